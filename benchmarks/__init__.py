@@ -0,0 +1,25 @@
+"""Benchmarki wydajności Forebet Scraper."""
+import time
+
+
+def best_of(func, *args, repeats: int = 5) -> float:
+    """
+    Najlepszy czas z kilku powtórzeń.
+    
+    Args:
+        func: Mierzona funkcja
+        *args: Argumenty funkcji
+        repeats: Liczba powtórzeń
+    
+    Returns:
+        Najkrótszy czas wywołania (sekundy)
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+__all__ = ['best_of']
@@ -0,0 +1,76 @@
+"""
+Benchmark profilu przeglądarki: pełny Chrome vs lekki profil (eager, blokada zasobów).
+
+Dla każdego profilu uruchamia Chrome, ładuje listingi i strony meczów z lokalnego
+mocka (strony z dołączonymi obrazami i fontem, jak na Forebet) i raportuje:
+czas ładowania strony (driver.get + gotowość), RSS drzewa procesów Chrome
+(szczyt i po ostatniej stronie) oraz liczbę pobranych zasobów statycznych.
+
+Wymaga Chrome i chromedriver.
+
+Uruchomienie:
+    python -m benchmarks.bench_browser_profile [--pages 30] [--assets 20] [--latency 0.02]
+"""
+import argparse
+import statistics
+import sys
+import time
+from typing import List
+
+from selenium.common.exceptions import WebDriverException
+
+from src.config import Settings, Sport
+from src.scrapers import ForebtScraper
+from src.scrapers.browser_profile import browser_rss_bytes
+from src.scrapers.page_readiness import wait_until_ready
+
+from .mock_server import MockServer
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Czas ładowania i pamięć Chrome: pełny vs lekki profil")
+    parser.add_argument("--pages", type=int, default=30, help="stron meczów na profil")
+    parser.add_argument("--assets", type=int, default=20, help="obrazów na stronę")
+    parser.add_argument("--latency", type=float, default=0.02, help="opóźnienie odpowiedzi mocka (s)")
+    args = parser.parse_args(argv)
+    
+    with MockServer(latency=args.latency, assets=args.assets) as server:
+        Settings.override_endpoints(server.url)
+        with ForebtScraper(use_selenium=False) as http:
+            events = http._fetch_with_requests(Settings.get_sport_url(Sport.FOOTBALL), Sport.FOOTBALL)
+        matches = [event['match_url'] for event in events if event.get('match_url')]
+        pages = [('listing', Settings.get_sport_url(sport)) for sport in Settings.SUPPORTED_SPORTS]
+        pages += [('match', url) for url in (matches * (args.pages // max(1, len(matches)) + 1))[:args.pages]]
+        
+        print(f"{'profil':>7} {'stron':>6} {'średnio [ms]':>13} {'p50 [ms]':>9} {'RSS max [MB]':>13} "
+              f"{'RSS koniec [MB]':>16} {'zasoby':>7}")
+        for lean in (False, True):
+            Settings.BROWSER_LEAN_PROFILE = lean
+            static_before = server.stats[('static', 200)]
+            scraper = ForebtScraper(use_selenium=True)
+            try:
+                scraper._init_driver()
+            except WebDriverException as e:
+                print(f"❌ Chrome/chromedriver niedostępny: {e.msg}")
+                return 2
+            
+            timings, peak, rss = [], 0, 0
+            try:
+                for page, url in pages:
+                    start = time.perf_counter()
+                    scraper.driver.get(url)
+                    wait_until_ready(scraper.driver, page)
+                    timings.append(time.perf_counter() - start)
+                    rss = browser_rss_bytes(scraper.driver)
+                    peak = max(peak, rss)
+            finally:
+                scraper.close()
+            
+            print(f"{'lekki' if lean else 'pełny':>7} {len(timings):>6} {statistics.mean(timings) * 1000:>13.0f} "
+                  f"{statistics.median(timings) * 1000:>9.0f} {peak / 2 ** 20:>13.0f} {rss / 2 ** 20:>16.0f} "
+                  f"{server.stats[('static', 200)] - static_before:>7}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
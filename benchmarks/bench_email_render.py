@@ -0,0 +1,65 @@
+"""
+Benchmark: renderowanie HTML emaili dla dużych list kwalifikowanych zdarzeń.
+
+Porównuje dotychczasowy renderer (`+=` w pętli, LegacyEmailRenderer) z
+szablonami z src.notifiers.email_templates.
+
+Uruchomienie:
+    python -m benchmarks.bench_email_render [liczba_zdarzeń ...]
+"""
+import sys
+from typing import Any, Dict, List
+
+from src.notifiers.email_templates import render_sport_email, render_summary_email
+
+from . import best_of
+from .legacy_email_render import LegacyEmailRenderer
+
+
+def _qualified_events(count: int, sport: str = 'football') -> List[Dict[str, Any]]:
+    """Generuje kwalifikowane zdarzenia z pełną analizą."""
+    events = []
+    for i in range(count):
+        events.append({
+            'event': {
+                'sport': sport,
+                'home_team': f"Home Team {i}",
+                'away_team': f"Away Team {i}",
+                'league': f"League {i % 40}",
+                'match_time': f"20/10/2026 {10 + i % 12}:{i % 60:02d}",
+                'probabilities': {'home': 64, 'draw': 21, 'away': 15, 'max': 64},
+                'match_url': f"https://www.forebet.com/pl/matches/home-away-{i}",
+            },
+            'analysis': {
+                'home_form': {'has_form': True, 'record': '4W-1D-1L', 'points': 13, 'display': '4W-1D-1L (13 pkt)'},
+                'away_form': {'has_form': True, 'record': '1W-2D-3L', 'points': 5, 'display': '1W-2D-3L (5 pkt)'},
+                'home_home_record': {'has_record': True, 'record': '4W-1D-1L', 'points': 13},
+                'away_away_record': {'has_record': True, 'record': '1W-2D-3L', 'points': 5},
+                'h2h': {'has_history': i % 2 == 0, 'home_win_rate': 0.7, 'total_matches': 10,
+                        'home_wins': 7, 'draws': 2, 'away_wins': 1},
+                'odds': {'has_odds': True, 'home_win': 1.55, 'draw': 4.1, 'away_win': 6.0},
+            },
+        })
+    return events
+
+
+def main(argv: List[str]) -> int:
+    sizes = [int(arg) for arg in argv] or [1000, 10000]
+    legacy = LegacyEmailRenderer()
+    
+    print(f"{'zdarzenia':>10} {'email':>9} {'przed [ms]':>11} {'po [ms]':>9} {'przyspieszenie':>15}")
+    for count in sizes:
+        events = _qualified_events(count)
+        rows = [
+            ('sport', best_of(legacy._generate_html_for_sport, 'football', events),
+             best_of(render_sport_email, 'football', events)),
+            ('zbiorczy', best_of(legacy._generate_html, events),
+             best_of(render_summary_email, events)),
+        ]
+        for email, before, after in rows:
+            print(f"{count:>10} {email:>9} {before * 1000:>11.1f} {after * 1000:>9.1f} {before / after:>14.1f}x")
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,103 @@
+"""
+Benchmark end-to-end: przepustowość potoku na lokalnym mocku Forebet/Flashscore.
+
+Listing → analiza (H2H, forma, kursy) → kwalifikacja → render emaila dla każdego
+sportu, przez HTTP (requests, bez Selenium) do benchmarks.mock_server. Cache,
+historia drużyn i logi trafiają do katalogu tymczasowego, więc każdy przebieg
+pobiera wszystko z sieci. Emaile są tylko renderowane, nie wysyłane.
+
+Uruchomienie:
+    python -m benchmarks.bench_end_to_end [--latency 0.05] [--error-rate 0.02] [--rate-limit 20]
+    python -m benchmarks.bench_end_to_end --synthetic 500 --sports football
+    python -m benchmarks.bench_end_to_end --port 8765 --transport record --store /tmp/forebet-http
+    python -m benchmarks.bench_end_to_end --port 8765 --transport replay --store /tmp/forebet-http
+
+W trybie replay odpowiedzi pochodzą wyłącznie z magazynu (mock nie dostaje
+zapytań); nagranie i odtworzenie muszą używać tego samego portu, bo URL jest
+częścią klucza zapytania.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from src.config import Settings
+
+from .mock_server import MockServer
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Przepustowość potoku na mocku Forebet/Flashscore")
+    parser.add_argument("--latency", type=float, default=0.02, help="opóźnienie odpowiedzi mocka (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="losowe dodatkowe opóźnienie (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="odsetek odpowiedzi 503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="limit zapytań mocka na sekundę")
+    parser.add_argument("--synthetic", type=int, default=None, help="N zdarzeń syntetycznych na sport")
+    parser.add_argument("--per-host", type=int, default=Settings.HTTP_MAX_PER_HOST,
+                        help="równoczesne zapytania na host (1 = sekwencyjnie)")
+    parser.add_argument("--port", type=int, default=0, help="port mocka (0 = wolny)")
+    parser.add_argument("--transport", choices=["live", "record", "replay"], default="live")
+    parser.add_argument("--store", type=Path, default=None, help="katalog magazynu odpowiedzi (record/replay)")
+    parser.add_argument("--sports", nargs="*", default=[sport.value for sport in Settings.SUPPORTED_SPORTS])
+    args = parser.parse_args(argv)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Izolacja stanu przed importem singletonów (cache, historia, logi)
+        Settings.CACHE_DIR = Path(tmp) / "cache"
+        Settings.HISTORY_DB_PATH = Settings.CACHE_DIR / "history.sqlite3"
+        Settings.LOGS_DIR = Path(tmp) / "logs"
+        Settings.RUN_LOG_PATH = Settings.LOGS_DIR / "run_log.jsonl"
+        Settings.TRANSPORT_MODE = args.transport
+        Settings.HTTP_MAX_PER_HOST = args.per_host
+        Settings.TRANSPORT_STORE_DIR = args.store or Path(tmp) / "http"
+        Settings.ensure_directories()
+        
+        import main as pipeline
+        from src.config import Sport
+        from src.data_management import Logger, team_history_store, h2h_index, run_log
+        from src.notifiers.email_templates import render_sport_email
+        from src.scrapers import ForebtScraper
+        
+        server = MockServer(port=args.port, latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                            rate_limit=args.rate_limit, synthetic=args.synthetic)
+        Settings.override_endpoints(server.url)
+        
+        totals = {'events': 0, 'analyzed': 0, 'qualified': 0}
+        start = time.perf_counter()
+        try:
+            with server, ForebtScraper(use_selenium=False) as scraper:
+                for sport in map(Sport, args.sports):
+                    events = scraper.fetch_events_by_sport(sport)
+                    team_history_store.record_events(events)
+                    h2h_index.record_events(events)
+                    
+                    filtered = [e for e in events
+                                if e['probabilities']['max'] >= Settings.NOTIFICATION_THRESHOLD]
+                    qualified = pipeline.analyze_and_qualify_events(filtered, scraper)
+                    render_sport_email(sport.value, qualified)
+                    
+                    totals['events'] += len(events)
+                    totals['analyzed'] += len(filtered)
+                    totals['qualified'] += len(qualified)
+        finally:
+            elapsed = time.perf_counter() - start
+            run_log.close()
+            team_history_store.close()
+            Logger.shutdown()
+    
+    requests_total = sum(server.stats.values())
+    print(f"\n{'sporty':>7} {'zdarzenia':>10} {'analiza':>8} {'kwalif.':>8} {'zapytania':>10} "
+          f"{'czas [s]':>9} {'zdarz./s':>9} {'zap./s':>7}")
+    print(f"{len(args.sports):>7} {totals['events']:>10} {totals['analyzed']:>8} {totals['qualified']:>8} "
+          f"{requests_total:>10} {elapsed:>9.2f} {totals['analyzed'] / elapsed:>9.2f} {requests_total / elapsed:>7.1f}")
+    print("\nOdpowiedzi mocka:")
+    for (route, status), count in sorted(server.stats.items()):
+        print(f"  {route:>8} {status}: {count}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""
+Benchmark: liczenie formy per-call (analyze_form/_analyze_matches) vs batch (score_results).
+
+Uruchomienie:
+    python -m benchmarks.bench_form_scoring [liczba_zdarzeń]
+"""
+import random
+import sys
+from typing import Dict, List, Tuple
+
+from src.config import Settings
+from src.analyzers import FormAnalyzer, HomeAwayAnalyzer, score_results
+
+from . import best_of
+
+
+def _generate_teams(events: int, seed: int = 42) -> List[Tuple[str, List[Dict]]]:
+    """Generuje sekwencje W/D/L (gospodarze i goście dla każdego zdarzenia)."""
+    rng = random.Random(seed)
+    teams = []
+    for i in range(events * 2):
+        length = rng.randint(0, 6)
+        matches = [{'result': rng.choice('WDLU')} for _ in range(length)]
+        teams.append((f"Team {i}", matches))
+    return teams
+
+
+def _per_call(teams: List[Tuple[str, List[Dict]]]) -> None:
+    """Ścieżka dotychczasowa: 4 wywołania na zdarzenie."""
+    form_analyzer = FormAnalyzer()
+    home_away_analyzer = HomeAwayAnalyzer()
+    for i in range(0, len(teams), 2):
+        home_team, home_matches = teams[i]
+        away_team, away_matches = teams[i + 1]
+        form_analyzer.analyze_form(home_team, home_matches)
+        form_analyzer.analyze_form(away_team, away_matches)
+        home_away_analyzer.analyze_home_record(home_team, home_matches)
+        home_away_analyzer.analyze_away_record(away_team, away_matches)
+
+
+def _batch(teams: List[Tuple[str, List[Dict]]]) -> None:
+    """Ścieżka batch: jedno wektorowe przejście współdzielone przez oba analizatory."""
+    form_analyzer = FormAnalyzer()
+    home_away_analyzer = HomeAwayAnalyzer()
+    scores = score_results([matches for _, matches in teams], Settings.MATCHES_TO_ANALYZE)
+    form_analyzer.analyze_form_batch(teams, scores=scores)
+    home_away_analyzer.analyze_records_batch(
+        teams[0::2], "home", scores={k: v[0::2] for k, v in scores.items()}
+    )
+    home_away_analyzer.analyze_records_batch(
+        teams[1::2], "away", scores={k: v[1::2] for k, v in scores.items()}
+    )
+
+
+def main(argv: List[str]) -> int:
+    sizes = [int(arg) for arg in argv] or [100, 1000, 10000]
+    
+    print(f"{'zdarzenia':>10} {'per-call [ms]':>14} {'batch [ms]':>12} {'przyspieszenie':>15}")
+    for events in sizes:
+        teams = _generate_teams(events)
+        per_call = best_of(_per_call, teams)
+        batch = best_of(_batch, teams)
+        print(f"{events:>10} {per_call * 1000:>14.2f} {batch * 1000:>12.2f} {per_call / batch:>14.1f}x")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
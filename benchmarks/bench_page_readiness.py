@@ -0,0 +1,101 @@
+"""
+Benchmark gotowości stron w Selenium: stałe pauzy (przed) vs warunki gotowości (po).
+
+Dla listingów i stron meczów z lokalnego mocka mierzy czas od driver.get do
+chwili, w której scraper czyta page_source:
+    fixed     - dawne zachowanie: listing = obecność tabeli + sleep(2), mecz = sleep(2)
+    readiness - src.scrapers.page_readiness.wait_until_ready
+
+Wymaga Chrome i chromedriver (jak produkcyjny przebieg z Selenium).
+
+Uruchomienie:
+    python -m benchmarks.bench_page_readiness [--pages 20] [--latency 0.05]
+"""
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.config import Settings, Sport
+from src.scrapers import ForebtScraper
+from src.scrapers.page_readiness import wait_until_ready
+
+from .mock_server import MockServer
+
+
+def _fixed_listing(driver):
+    try:
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, ".schema, .rcnt, tr[data-tid]"))
+        )
+    except TimeoutException:
+        pass
+    time.sleep(2)
+
+
+def _fixed_match(driver):
+    time.sleep(2)
+
+
+STRATEGIES: Dict[str, Dict[str, Callable]] = {
+    'fixed': {'listing': _fixed_listing, 'match': _fixed_match},
+    'readiness': {
+        'listing': lambda driver: wait_until_ready(driver, 'listing'),
+        'match': lambda driver: wait_until_ready(driver, 'match'),
+    },
+}
+
+
+def measure(driver, urls: List[str], wait: Callable) -> List[float]:
+    """Czasy driver.get + oczekiwania dla kolejnych URL-i (sekundy)."""
+    timings = []
+    for url in urls:
+        start = time.perf_counter()
+        driver.get(url)
+        wait(driver)
+        driver.page_source
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Czas gotowości stron Selenium: stałe pauzy vs warunki")
+    parser.add_argument("--pages", type=int, default=10, help="stron meczów na strategię")
+    parser.add_argument("--latency", type=float, default=0.05, help="opóźnienie odpowiedzi mocka (s)")
+    args = parser.parse_args(argv)
+    
+    with MockServer(latency=args.latency) as server:
+        Settings.override_endpoints(server.url)
+        with ForebtScraper(use_selenium=False) as http:
+            events = http._fetch_with_requests(Settings.get_sport_url(Sport.FOOTBALL), Sport.FOOTBALL)
+        listings = [Settings.get_sport_url(sport) for sport in Settings.SUPPORTED_SPORTS]
+        matches = [event['match_url'] for event in events if event.get('match_url')]
+        matches = (matches * (args.pages // max(1, len(matches)) + 1))[:args.pages]
+        
+        scraper = ForebtScraper(use_selenium=True)
+        try:
+            scraper._init_driver()
+        except WebDriverException as e:
+            print(f"❌ Chrome/chromedriver niedostępny: {e.msg}")
+            return 2
+        
+        print(f"{'strategia':>10} {'strona':>8} {'n':>4} {'średnio [ms]':>13} {'p50 [ms]':>9} {'max [ms]':>9}")
+        try:
+            for name, waits in STRATEGIES.items():
+                for page, urls in (('listing', listings), ('match', matches)):
+                    timings = measure(scraper.driver, urls, waits[page])
+                    print(f"{name:>10} {page:>8} {len(timings):>4} {statistics.mean(timings) * 1000:>13.0f} "
+                          f"{statistics.median(timings) * 1000:>9.0f} {max(timings) * 1000:>9.0f}")
+        finally:
+            scraper.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,97 @@
+"""
+Benchmark: narzut logowania w _parse_events na poziomie INFO.
+
+Porównuje parsowanie listingu przy zwykłym poziomie INFO z parsowaniem przy
+całkowicie wyłączonym loggerze (dolna granica) - różnica to koszt logów
+per-wiersz, które na INFO i tak nie są emitowane. Druga tabela mierzy same
+logi per-wiersz: f-string przy każdym wierszu vs sprawdzenie poziomu przed pętlą.
+
+Uruchomienie:
+    python -m benchmarks.bench_parse_events [liczba_wierszy ...]
+"""
+import logging
+import sys
+from typing import List
+
+from bs4 import BeautifulSoup
+
+from src.config import Sport
+from src.data_management import HotPathLogger
+from src.scrapers import ForebtScraper
+from src.scrapers import forebet_scraper
+
+from . import best_of
+
+_ROW = (
+    '<tr data-tid="{i}">'
+    '<td><span class="date_bah">{hour:02d}:00</span></td>'
+    '<td title="League {league}">'
+    '<a href="/pl/team/home-{i}">Home Team {i}</a>'
+    '<a href="/pl/team/away-{i}">Away Team {i}</a>'
+    '<a href="/pl/matches/home-{i}-away-{i}-{i}">mecz</a>'
+    '</td>'
+    '<td><div class="fprc"><span>{home}</span><span>{draw}</span><span>{away}</span></div></td>'
+    '</tr>'
+)
+
+
+def _generate_listing(rows: int) -> BeautifulSoup:
+    """Generuje syntetyczny listing Forebet z `rows` wierszami meczów."""
+    body = ''.join(
+        _ROW.format(i=i, hour=i % 24, league=i % 40, home=40 + i % 30, draw=20, away=40 - i % 30)
+        for i in range(rows)
+    )
+    return BeautifulSoup(f'<html><body><table>{body}</table></body></html>', 'lxml')
+
+
+def _eager_row_logs(events: List[dict], log: logging.Logger) -> None:
+    """Dotychczasowy wzorzec: f-string budowany dla każdego wiersza."""
+    total = len(events)
+    for i, event in enumerate(events, 1):
+        log.debug(f"  [{i}/{total}] ✅ {event.get('home_team')} vs {event.get('away_team')}")
+
+
+def _guarded_row_logs(events: List[dict], log: logging.Logger) -> None:
+    """Wzorzec hot-path: jedno isEnabledFor na pętlę, leniwe argumenty."""
+    hot = HotPathLogger(log)
+    total = len(events)
+    debug_rows = hot.enabled()
+    for i, event in enumerate(events, 1):
+        if debug_rows:
+            hot.sampled(i, "  [%d/%d] ✅ %s vs %s", i, total, event['home_team'], event['away_team'])
+
+
+def main(argv: List[str]) -> int:
+    sizes = [int(arg) for arg in argv] or [100, 1000, 5000]
+    scraper = ForebtScraper(use_selenium=False)
+    scraper_logger = forebet_scraper.logger
+    scraper_logger.setLevel(logging.INFO)
+    
+    print(f"{'wiersze':>8} {'INFO [ms]':>10} {'wyłączony [ms]':>15} {'narzut':>8}")
+    try:
+        for rows in sizes:
+            soup = _generate_listing(rows)
+            
+            scraper_logger.disabled = False
+            info = best_of(scraper._parse_events, soup, Sport.FOOTBALL)
+            
+            scraper_logger.disabled = True
+            floor = best_of(scraper._parse_events, soup, Sport.FOOTBALL)
+            
+            print(f"{rows:>8} {info * 1000:>10.2f} {floor * 1000:>15.2f} {(info - floor) / floor:>7.1%}")
+    finally:
+        scraper_logger.disabled = False
+        scraper.close()
+    
+    print(f"\n{'wiersze':>8} {'f-string [ms]':>14} {'hot-path [ms]':>14}")
+    for rows in sizes:
+        events = [{'home_team': f"Home Team {i}", 'away_team': f"Away Team {i}"} for i in range(rows)]
+        eager = best_of(_eager_row_logs, events, scraper_logger)
+        guarded = best_of(_guarded_row_logs, events, scraper_logger)
+        print(f"{rows:>8} {eager * 1000:>14.3f} {guarded * 1000:>14.3f}")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,226 @@
+"""
+Benchmark skalowania: czas i szczyt pamięci etapów potoku dla N syntetycznych zdarzeń.
+
+Etapy:
+    parse     - drzewo lxml + _parse_events dla listingu z N wierszami
+    details   - forma i H2H ze stron meczów oraz kursy z feedów df_od (N stron)
+    analysis  - batch scoring formy i home/away + statystyki H2H
+    filter    - EventFilter.qualify_event dla każdego zdarzenia
+    render    - email sportowy i zbiorczy z wszystkimi zdarzeniami
+
+Kończy się kodem 1, jeśli któryś etap skaluje się super-liniowo: wykładnik
+log(t2/t1) / log(N2/N1) między kolejnymi rozmiarami przekracza MAX_EXPONENT
+(pary z czasem mniejszego rozmiaru poniżej MIN_SECONDS są pomijane jako szum).
+
+Uruchomienie:
+    python -m benchmarks.bench_scaling [10 1000 10000 100000] [--stages parse analysis]
+"""
+import argparse
+import logging
+import math
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from bs4 import BeautifulSoup
+
+from src.config import Settings, Sport
+from src.scrapers import ForebtScraper
+from src.analyzers import FormAnalyzer, HomeAwayAnalyzer, HeadToHeadAnalyzer, score_results
+from src.filters import EventFilter
+from src.odds_fetchers import FlashscoreFetcher
+from src.notifiers.email_templates import render_sport_email, render_summary_email
+
+from .synthetic import SyntheticDay
+
+STAGES = ['parse', 'details', 'analysis', 'filter', 'render']
+MAX_EXPONENT = 1.25  # N log N mieści się z zapasem, N^1.5 już nie
+MIN_SECONDS = 0.01
+MIN_PEAK_BYTES = 1 << 20
+
+
+def _measure(func: Callable, *args, repeats: int = 1, memory: bool = True) -> Tuple[Any, float, int]:
+    """
+    Czas (najlepszy z `repeats`) i szczyt pamięci (osobny przebieg pod tracemalloc).
+    
+    Returns:
+        (wynik, sekundy, szczyt pamięci w bajtach)
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    
+    peak = 0
+    if memory:
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return result, best, peak
+
+
+class _Pipeline:
+    """Etapy potoku na jednym dniu syntetycznym (wynik etapu = wejście następnego)."""
+    
+    def __init__(self, day: SyntheticDay):
+        self.day = day
+        self.scraper = ForebtScraper(use_selenium=False)
+        self.h2h = HeadToHeadAnalyzer()
+        self.fetcher = FlashscoreFetcher()
+    
+    def close(self):
+        self.scraper.close()
+        self.h2h.close()
+        self.fetcher.close()
+    
+    def parse(self, html: str) -> List[Dict[str, Any]]:
+        return self.scraper._parse_events(BeautifulSoup(html, 'lxml'), self.day.sport)
+    
+    def details(self, events: List[Dict[str, Any]]) -> List[Tuple[Dict, List[Dict], Optional[Dict]]]:
+        details = []
+        for index in range(len(events)):
+            soup = BeautifulSoup(self.day.match_page(index), 'lxml')
+            odds = self.fetcher._parse_flashscore_odds(self.day.odds_feed(index), self.fetcher.NORDIC_BET_ID)
+            details.append((self.scraper._parse_team_form(soup), self.h2h._parse_h2h_page(soup), odds))
+        return details
+    
+    def analysis(self, events: List[Dict[str, Any]], details) -> List[Dict[str, Any]]:
+        teams = []
+        for event, (form, _, _) in zip(events, details):
+            teams.append((event['home_team'], form['home_form']))
+            teams.append((event['away_team'], form['away_form']))
+        
+        scores = score_results([matches for _, matches in teams], Settings.MATCHES_TO_ANALYZE)
+        forms = FormAnalyzer().analyze_form_batch(teams, scores=scores)
+        home_away = HomeAwayAnalyzer()
+        home_records = home_away.analyze_records_batch(teams[0::2], "home",
+                                                       scores={k: v[0::2] for k, v in scores.items()})
+        away_records = home_away.analyze_records_batch(teams[1::2], "away",
+                                                       scores={k: v[1::2] for k, v in scores.items()})
+        
+        analyzed = []
+        for index, (event, (_, h2h_matches, odds)) in enumerate(zip(events, details)):
+            analyzed.append({
+                'event': event,
+                'analysis': {
+                    'h2h': self.h2h._calculate_h2h_stats(h2h_matches, event['home_team']) if h2h_matches
+                    else {'has_history': False},
+                    'home_form': forms[2 * index],
+                    'away_form': forms[2 * index + 1],
+                    'home_home_record': home_records[index],
+                    'away_away_record': away_records[index],
+                    'odds': {'has_odds': odds is not None, 'home_win': (odds or {}).get('home'),
+                             'draw': (odds or {}).get('draw'), 'away_win': (odds or {}).get('away')},
+                },
+            })
+        return analyzed
+    
+    @staticmethod
+    def filter(analyzed: List[Dict[str, Any]]) -> List[Tuple[bool, str]]:
+        return [EventFilter.qualify_event(item['event'], item['analysis']) for item in analyzed]
+    
+    def render(self, analyzed: List[Dict[str, Any]]) -> int:
+        return len(render_sport_email(self.day.sport.value, analyzed)) + len(render_summary_email(analyzed))
+
+
+def run_scaling(sizes: Sequence[int], stages: Sequence[str] = STAGES, repeats: int = 1,
+                memory: bool = True, sport: Sport = Sport.FOOTBALL) -> Dict[int, Dict[str, Tuple[float, int]]]:
+    """
+    Mierzy etapy potoku dla każdego rozmiaru dnia.
+    
+    Args:
+        sizes: Liczby zdarzeń (rosnąco)
+        stages: Mierzone etapy (details jest liczony także gdy pominięty - zasila analizę)
+        repeats: Powtórzenia pomiaru czasu (najlepszy wynik)
+        memory: Czy mierzyć szczyt pamięci (dodatkowy przebieg pod tracemalloc)
+        sport: Sport dnia syntetycznego
+    
+    Returns:
+        {N: {etap: (sekundy, szczyt pamięci w bajtach)}}
+    """
+    results: Dict[int, Dict[str, Tuple[float, int]]] = {}
+    for size in sizes:
+        day = SyntheticDay(size, sport)
+        pipeline = _Pipeline(day)
+        html = day.listing_html()
+        measured: Dict[str, Tuple[float, int]] = {}
+        
+        def stage(name: str, func: Callable, *args):
+            if name not in stages:
+                return func(*args)
+            result, seconds, peak = _measure(func, *args, repeats=repeats, memory=memory)
+            measured[name] = (seconds, peak)
+            return result
+        
+        try:
+            events = stage('parse', pipeline.parse, html)
+            details = stage('details', pipeline.details, events)
+            analyzed = stage('analysis', pipeline.analysis, events, details)
+            stage('filter', pipeline.filter, analyzed)
+            stage('render', pipeline.render, analyzed)
+        finally:
+            pipeline.close()
+        results[size] = measured
+    return results
+
+
+def superlinear_stages(results: Dict[int, Dict[str, Tuple[float, int]]],
+                       max_exponent: float = MAX_EXPONENT) -> List[str]:
+    """
+    Etapy skalujące się super-liniowo (czas lub pamięć) między kolejnymi rozmiarami.
+    
+    Args:
+        results: Wynik run_scaling
+        max_exponent: Maksymalny dopuszczalny wykładnik skalowania
+    
+    Returns:
+        Opisy przekroczeń (pusta lista = skalowanie liniowe)
+    """
+    failures = []
+    sizes = sorted(results)
+    for small, large in zip(sizes, sizes[1:]):
+        for name, (seconds, peak) in results[small].items():
+            large_seconds, large_peak = results[large][name]
+            growth = math.log(large / small)
+            if seconds >= MIN_SECONDS:
+                exponent = math.log(large_seconds / seconds) / growth
+                if exponent > max_exponent:
+                    failures.append(f"{name}: czas N^{exponent:.2f} ({small} → {large})")
+            if peak >= MIN_PEAK_BYTES and large_peak:
+                exponent = math.log(large_peak / peak) / growth
+                if exponent > max_exponent:
+                    failures.append(f"{name}: pamięć N^{exponent:.2f} ({small} → {large})")
+    return failures
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Skalowanie etapów potoku dla N syntetycznych zdarzeń")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10, 1000, 10000])
+    parser.add_argument("--stages", nargs="*", choices=STAGES, default=STAGES)
+    parser.add_argument("--max-exponent", type=float, default=MAX_EXPONENT)
+    args = parser.parse_args(argv)
+    
+    # Logi per-zdarzenie (INFO) zaburzałyby pomiar
+    logging.disable(logging.INFO)
+    results = run_scaling(sorted(args.sizes), args.stages)
+    
+    print(f"{'N':>8} {'etap':>9} {'czas [ms]':>11} {'µs/zdarz.':>10} {'szczyt [MB]':>12}")
+    for size, measured in results.items():
+        for name, (seconds, peak) in measured.items():
+            print(f"{size:>8} {name:>9} {seconds * 1000:>11.1f} {seconds / size * 1e6:>10.1f} {peak / 2 ** 20:>12.1f}")
+    
+    failures = superlinear_stages(results, args.max_exponent)
+    for failure in failures:
+        print(f"❌ Skalowanie super-liniowe - {failure}")
+    if not failures:
+        print(f"✅ Wszystkie etapy skalują się liniowo (wykładnik ≤ {args.max_exponent})")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
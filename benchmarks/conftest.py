@@ -0,0 +1,195 @@
+"""
+Benchmarki offline w stylu pytest-benchmark: fixture `bench` i porównanie z baseline.
+
+Czasy są normalizowane przez stałe obciążenie kalibracyjne mierzone tuż przed
+każdym benchmarkiem, więc baseline zapisany na jednej maszynie da się porównać
+na innej, a chwilowe obciążenie maszyny nie zamienia się w fałszywą regresję.
+
+Uruchomienie:
+    python -m pytest benchmarks                   # porównanie z benchmarks/baseline.json
+    python -m pytest benchmarks --bench-save      # zapis nowego baseline
+    python -m pytest benchmarks --bench-tolerance=1.0
+"""
+import gc
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+from tests.conftest import session_logs_dir  # noqa: F401 - logi i run_log poza logs/ repozytorium
+
+from . import best_of
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+TARGET_SECONDS = 0.2  # Docelowy łączny czas pomiaru jednego benchmarku
+MIN_ROUND_SECONDS = 0.002  # Krótsze wywołania są powtarzane w obrębie jednej rundy (jak w timeit)
+MIN_ROUNDS = 3
+MAX_ROUNDS = 50
+
+_results_key = pytest.StashKey[Dict[str, Dict[str, Any]]]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "benchmarki offline")
+    group.addoption("--bench-save", action="store_true", default=False,
+                    help="Zapisz wyniki jako nowy baseline (benchmarks/baseline.json)")
+    group.addoption("--bench-tolerance", type=float, default=0.5,
+                    help="Dopuszczalny wzrost znormalizowanego czasu względem baseline (0.5 = +50%%)")
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = {}
+
+
+def _calibration_workload() -> int:
+    """Stałe obciążenie CPU (czysty Python) - jednostka normalizacji czasów."""
+    total = 0
+    for i in range(200_000):
+        total += i * i % 7
+    return total
+
+
+def _load_baseline() -> Dict[str, Any]:
+    """Wczytuje baseline (pusty słownik jeśli brak pliku)."""
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text(encoding='utf-8')).get('benchmarks', {})
+
+
+class Bench:
+    """Mierzy funkcję (rozgrzewka + rundy) i sprawdza regresję względem baseline."""
+    
+    def __init__(self, name: str, baseline: Optional[Dict[str, Any]],
+                 tolerance: Optional[float], results: Dict[str, Dict[str, Any]]):
+        """
+        Args:
+            name: Nazwa benchmarku (id testu)
+            baseline: Wpis baseline dla tego benchmarku (None = brak)
+            tolerance: Dopuszczalny wzrost (None = bez porównania, np. przy --bench-save)
+            results: Zbiorcze wyniki sesji
+        """
+        self.name = name
+        self.baseline = baseline
+        self.tolerance = tolerance
+        self.results = results
+        self.stats: Optional[Dict[str, Any]] = None
+    
+    def __call__(self, func: Callable, *args, rounds: Optional[int] = None, **kwargs) -> Any:
+        """
+        Mierzy `func(*args, **kwargs)` i zwraca wynik jej wywołania.
+        
+        Args:
+            func: Mierzona funkcja
+            *args: Argumenty funkcji
+            rounds: Liczba rund (domyślnie dobrana do TARGET_SECONDS)
+            **kwargs: Argumenty nazwane funkcji
+        
+        Returns:
+            Wynik rozgrzewkowego wywołania funkcji
+        """
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        first = max(time.perf_counter() - start, 1e-7)
+        
+        iterations = max(1, int(MIN_ROUND_SECONDS / first))
+        if rounds is None:
+            rounds = max(MIN_ROUNDS, min(MAX_ROUNDS, int(TARGET_SECONDS / (first * iterations))))
+        
+        self.stats = self._measure(func, args, kwargs, rounds, iterations)
+        if self._is_regression():
+            # Jednorazowy ponowny pomiar - chwilowy szum nie jest regresją
+            retry = self._measure(func, args, kwargs, rounds, iterations)
+            if retry['normalized'] < self.stats['normalized']:
+                self.stats = retry
+        
+        self.results[self.name] = self.stats
+        if self._is_regression():
+            pytest.fail(
+                f"Regresja wydajności {self.name}: {self.stats['normalized']:.4g} > "
+                f"{self._allowed():.4g} (baseline {self.baseline['normalized']:.4g} +{self.tolerance:.0%})",
+                pytrace=False,
+            )
+        return result
+    
+    @staticmethod
+    def _measure(func: Callable, args: tuple, kwargs: dict, rounds: int, iterations: int) -> Dict[str, Any]:
+        """Jeden pomiar: kalibracja + `rounds` rund po `iterations` wywołań."""
+        calibration = best_of(_calibration_workload, repeats=3)
+        
+        # Jak timeit: GC wyłączony na czas pomiaru, żeby zbiórki nie zaszumiały rund
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    func(*args, **kwargs)
+                timings.append((time.perf_counter() - start) / iterations)
+        finally:
+            if gc_enabled:
+                gc.enable()
+        
+        best = min(timings)
+        return {
+            'rounds': rounds,
+            'iterations': iterations,
+            'min': best,
+            'median': statistics.median(timings),
+            'normalized': best / calibration,
+        }
+    
+    def _allowed(self) -> float:
+        """Górna granica znormalizowanego czasu (baseline + tolerancja)."""
+        return self.baseline['normalized'] * (1 + self.tolerance)
+    
+    def _is_regression(self) -> bool:
+        """Czy znormalizowany czas przekracza baseline + tolerancję (bez baseline/przy zapisie: nie)."""
+        if self.tolerance is None or not self.baseline:
+            return False
+        return self.stats['normalized'] > self._allowed()
+
+
+@pytest.fixture(scope="session")
+def bench_baseline() -> Dict[str, Any]:
+    """Zapisane wyniki baseline {nazwa: statystyki}."""
+    return _load_baseline()
+
+
+@pytest.fixture
+def bench(request, bench_baseline) -> Bench:
+    """Fixture w stylu pytest-benchmark: `result = bench(func, *args)`."""
+    config = request.config
+    tolerance = None if config.getoption("--bench-save") else config.getoption("--bench-tolerance")
+    name = request.node.name
+    return Bench(name, bench_baseline.get(name), tolerance, config.stash[_results_key])
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(_results_key, {})
+    if not results:
+        return
+    
+    baseline = _load_baseline()
+    terminalreporter.section("benchmarki offline")
+    terminalreporter.write_line(f"{'benchmark':<56} {'min [ms]':>10} {'mediana [ms]':>13} {'rundy':>6} {'vs baseline':>12}")
+    for name, stats in sorted(results.items()):
+        base = baseline.get(name)
+        change = f"{stats['normalized'] / base['normalized'] - 1:+.1%}" if base else "-"
+        terminalreporter.write_line(
+            f"{name:<56} {stats['min'] * 1000:>10.3f} {stats['median'] * 1000:>13.3f} "
+            f"{stats['rounds']:>6} {change:>12}"
+        )
+    
+    if config.getoption("--bench-save"):
+        payload = {
+            'benchmarks': {
+                name: {'min': float(f"{stats['min']:.4g}"), 'normalized': float(f"{stats['normalized']:.4g}")}
+                for name, stats in sorted(results.items())
+            },
+        }
+        BASELINE_PATH.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding='utf-8')
+        terminalreporter.write_line(f"💾 Zapisano baseline: {BASELINE_PATH}")
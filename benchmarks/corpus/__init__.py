@@ -0,0 +1,65 @@
+"""
+Korpus zapisanych stron Forebet i Flashscore do testów i benchmarków offline.
+
+Struktura:
+    listings/<sport>.html           - listing prognoz dla każdego sportu z Settings.SPORT_URL_PATTERNS
+    matches/<slug>.html             - strony szczegółów meczu (forma w sekcjach/tabelach, H2H)
+    flashscore/search_<slug>.html   - strona wyszukiwania Flashscore
+    flashscore/df_od_1_<id>_1_eu_1.txt - feed kursów (rekordy '~', pola '¬')
+
+Strony mają szkielet oryginału (nagłówek, menu, skrypty, reklamy, stopka) i te
+elementy, które czytają parsery; dane drużyn i kursów są zamrożone, więc wyniki
+parsowania i czasy są powtarzalne między przebiegami.
+"""
+from pathlib import Path
+from typing import Dict
+
+from src.config import Sport
+
+CORPUS_DIR = Path(__file__).resolve().parent
+
+
+def listing_html(sport: Sport) -> str:
+    """
+    Zwraca zapisany listing prognoz dla sportu.
+    
+    Args:
+        sport: Sport
+    
+    Returns:
+        HTML listingu
+    """
+    return (CORPUS_DIR / "listings" / f"{sport.value}.html").read_text(encoding='utf-8')
+
+
+def match_pages() -> Dict[str, str]:
+    """Zwraca strony szczegółów meczów {slug: HTML}."""
+    return {
+        path.stem: path.read_text(encoding='utf-8')
+        for path in sorted((CORPUS_DIR / "matches").glob("*.html"))
+    }
+
+
+def odds_feeds() -> Dict[str, str]:
+    """Zwraca feedy kursów Flashscore {flashscore_id: surowa odpowiedź}."""
+    feeds = {}
+    for path in sorted((CORPUS_DIR / "flashscore").glob("df_od_1_*_1_eu_1.txt")):
+        flashscore_id = path.stem[len("df_od_1_"):-len("_1_eu_1")]
+        feeds[flashscore_id] = path.read_text(encoding='utf-8')
+    return feeds
+
+
+def search_page(slug: str) -> str:
+    """
+    Zwraca zapisaną stronę wyszukiwania Flashscore.
+    
+    Args:
+        slug: Nazwa strony (np. "arsenal-chelsea", "empty")
+    
+    Returns:
+        HTML strony wyszukiwania
+    """
+    return (CORPUS_DIR / "flashscore" / f"search_{slug}.html").read_text(encoding='utf-8')
+
+
+__all__ = ['CORPUS_DIR', 'listing_html', 'match_pages', 'odds_feeds', 'search_page']
@@ -0,0 +1,346 @@
+"""
+Lokalny serwer zastępujący Forebet i Flashscore w testach przepustowości end-to-end.
+
+Serwuje strony z korpusu (benchmarks/corpus):
+    /pl/<wzorzec listingu sportu>        - listing (Settings.SPORT_URL_PATTERNS)
+    /scripts/predictions.php?sport=<s>   - dane prognoz listingu jako JSON (XHR, tylko --synthetic)
+    /.../matches/<slug>-<id>             - strona szczegółów meczu
+    /wyszukiwanie/?q=<drużyny>           - wyszukiwarka Flashscore (g_1_<id>)
+    /x/feed/df_od_1_<id>_1_eu_1          - feed kursów (wymaga nagłówka X-Fsign)
+    /static/<plik>                       - obrazy i fonty wstrzykiwane do stron (assets > 0)
+
+Absolutne linki https://www.forebet.com w listingach są przepisywane na adres
+serwera, więc scraper podąża za nimi do mocka. Opóźnienie, odsetek błędów 503
+i limit zapytań (429 + Retry-After) są konfigurowalne; z validators=True odpowiedzi
+mają ETag i Last-Modified, a zapytania warunkowe z aktualnym ETag dostają 304. Z --synthetic N serwuje
+zamiast korpusu dni syntetyczne (benchmarks.synthetic) po N zdarzeń na sport.
+
+Uruchomienie:
+    python -m benchmarks.mock_server [--port 8765] [--latency 0.05] [--error-rate 0.02] [--rate-limit 20]
+    python -m benchmarks.mock_server --synthetic 5000
+    python main.py --endpoint http://127.0.0.1:8765
+"""
+import argparse
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.config import Settings
+
+from . import corpus
+from .synthetic import XHR_PATH, SyntheticDay, generate_day, parse_flashscore_id
+
+FOREBET_ORIGIN = "https://www.forebet.com"
+_SYNTHETIC_MATCH_ID = re.compile(r'/([a-z-]+)/matches/.*-(\d+)$')
+_SYNTHETIC_TEAM_NUMBER = re.compile(r'-(\d+)\b')
+
+
+class _TokenBucket:
+    """Limit zapytań po stronie serwera (wspólny dla wszystkich klientów)."""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def take(self) -> bool:
+        """Zabiera token; False gdy limit przekroczony."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Routing zapytań na strony korpusu."""
+    
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+    
+    def do_GET(self):
+        mock = self.server.mock
+        route, status, body, content_type = mock.respond(self.path, self.headers)
+        
+        self.send_response(status)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if mock.validators and status in (200, 304):
+            self.send_header("ETag", mock.etag(body) if status == 200 else self.headers["If-None-Match"])
+            self.send_header("Last-Modified", "Mon, 19 Oct 2026 06:00:00 GMT")
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        """Bez logowania każdego zapytania na stderr."""
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: "MockServer"
+
+
+class MockServer:
+    """Lokalny zamiennik Forebet i Flashscore z konfigurowalnym opóźnieniem, błędami i limitem."""
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, rate_limit: Optional[float] = None, seed: int = 42,
+                 synthetic: Optional[int] = None, assets: int = 0, asset_bytes: int = 32 * 1024,
+                 validators: bool = False):
+        """
+        Args:
+            host: Adres nasłuchu
+            port: Port (0 = wolny port przydzielony przez system)
+            latency: Stałe opóźnienie odpowiedzi (sekundy)
+            jitter: Losowe dodatkowe opóźnienie 0..jitter (sekundy)
+            error_rate: Odsetek odpowiedzi 503 (0.0 - 1.0)
+            rate_limit: Limit zapytań na sekundę (None = bez limitu); nadmiar dostaje 429
+            seed: Ziarno losowania błędów i opóźnień (i dni syntetycznych)
+            synthetic: Liczba zdarzeń syntetycznych na sport (None = korpus)
+            assets: Liczba obrazów dołączanych do każdej strony HTML (plus font) - jak grafiki na Forebet
+            asset_bytes: Rozmiar jednego zasobu statycznego
+            validators: ETag/Last-Modified w odpowiedziach 200 i 304 dla If-None-Match
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.bucket = _TokenBucket(rate_limit) if rate_limit else None
+        self.stats: Counter = Counter()
+        self.assets = assets
+        self.validators = validators
+        self._asset_body = bytes(asset_bytes)
+        
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._listings = {
+            unquote(pattern).strip('/'): corpus.listing_html(sport)
+            for sport, pattern in Settings.SPORT_URL_PATTERNS.items()
+        }
+        self._match_pages: List[str] = list(corpus.match_pages().values())
+        self._feeds = corpus.odds_feeds()
+        self._feed_ids: List[str] = sorted(self._feeds)
+        self._search_template = corpus.search_page("arsenal-chelsea")
+        self._search_empty = corpus.search_page("empty")
+        
+        self._days: Dict[str, SyntheticDay] = {}
+        self._synthetic_listings: Dict[str, bytes] = {}
+        if synthetic:
+            days = generate_day(synthetic, list(Settings.SPORT_URL_PATTERNS), seed)
+            self._days = {unquote(Settings.SPORT_URL_PATTERNS[sport]).strip('/'): day for sport, day in days.items()}
+        
+        self._server = _Server((host, port), _Handler)
+        self._server.mock = self
+        self._thread: Optional[threading.Thread] = None
+    
+    @staticmethod
+    def etag(body: bytes) -> str:
+        """ETag treści (crc32 - stały dla niezmienionej strony)."""
+        return f'"{zlib.crc32(body):08x}"'
+    
+    @property
+    def url(self) -> str:
+        """Adres bazowy serwera (http://host:port)."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> "MockServer":
+        """Uruchamia serwer w wątku tła."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, name="mock-server", daemon=True)
+            self._thread.start()
+        return self
+    
+    def stop(self):
+        """Zatrzymuje serwer."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+    
+    def respond(self, raw_path: str, headers) -> Tuple[str, int, bytes, str]:
+        """
+        Wyznacza odpowiedź na zapytanie (opóźnienie, limit, błąd, routing).
+        
+        Args:
+            raw_path: Ścieżka z query string
+            headers: Nagłówki zapytania
+        
+        Returns:
+            (trasa, status, treść, content-type)
+        """
+        path = unquote(urlsplit(raw_path).path)
+        route = self._route_name(path)
+        
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            failed = self.error_rate and self._rng.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        
+        if self.bucket and not self.bucket.take():
+            status, body, content_type = 429, b"Too Many Requests", "text/plain"
+        elif failed:
+            status, body, content_type = 503, b"Service Unavailable", "text/plain"
+        else:
+            status, body, content_type = self._content(route, path, raw_path, headers)
+            if self.validators and status == 200 and headers.get("If-None-Match") == self.etag(body):
+                status, body = 304, b""
+        
+        with self._lock:
+            self.stats[(route, status)] += 1
+        return route, status, body, content_type
+    
+    def _route_name(self, path: str) -> str:
+        """Nazwa trasy do statystyk."""
+        if path.startswith("/static/"):
+            return "static"
+        if path == XHR_PATH:
+            return "xhr"
+        if path.startswith("/x/feed/"):
+            return "odds"
+        if path.startswith("/wyszukiwanie"):
+            return "search"
+        if "/matches/" in path:
+            return "match"
+        return "listing"
+    
+    def _content(self, route: str, path: str, raw_path: str, headers) -> Tuple[int, bytes, str]:
+        """Treść strony dla trasy (404 gdy brak w korpusie)."""
+        html = "text/html; charset=utf-8"
+        if route == "static":
+            content_type = "font/woff2" if path.endswith(".woff2") else "image/png"
+            return 200, self._asset_body, content_type
+        if self._days:
+            return self._synthetic_content(route, path, raw_path, headers)
+        
+        if route == "odds":
+            if not headers.get("X-Fsign"):
+                return 401, b"Unauthorized", "text/plain"
+            flashscore_id = path.rsplit('/', 1)[-1][len("df_od_1_"):-len("_1_eu_1")]
+            feed = self._feeds.get(flashscore_id)
+            if feed is None:
+                return 404, b"", "text/plain"
+            return 200, feed.encode('utf-8'), "text/plain; charset=utf-8"
+        
+        if route == "search":
+            query = parse_qs(urlsplit(raw_path).query).get('q', [''])[0]
+            if not query.strip():
+                return 200, self._search_empty.encode('utf-8'), html
+            flashscore_id = self._feed_ids[zlib.crc32(query.encode('utf-8')) % len(self._feed_ids)]
+            page = self._search_template.replace("g_1_KxGt7mYq", f"g_1_{flashscore_id}")
+            return 200, page.encode('utf-8'), html
+        
+        if route == "match":
+            page = self._match_pages[zlib.crc32(path.encode('utf-8')) % len(self._match_pages)]
+            return 200, self._rewrite_links(page), html
+        
+        for pattern, listing in self._listings.items():
+            if path.rstrip('/').endswith(pattern):
+                return 200, self._rewrite_links(listing), html
+        return 404, b"Not Found", "text/plain"
+    
+    def _synthetic_content(self, route: str, path: str, raw_path: str, headers) -> Tuple[int, bytes, str]:
+        """Treść strony dnia syntetycznego (zdarzenie rozpoznawane po ID z adresu)."""
+        html = "text/html; charset=utf-8"
+        days = list(self._days.values())
+        
+        if route == "odds":
+            if not headers.get("X-Fsign"):
+                return 401, b"Unauthorized", "text/plain"
+            seed, index = parse_flashscore_id(path.rsplit('/', 1)[-1][len("df_od_1_"):-len("_1_eu_1")])
+            day = next((d for d in days if d.seed % 100 == seed and index < d.events), None)
+            if day is None:
+                return 404, b"", "text/plain"
+            return 200, day.odds_feed(index).encode('utf-8'), "text/plain; charset=utf-8"
+        
+        if route == "search":
+            # Nazwy drużyn kończą się numerem 2*i (gospodarz) - wystarcza do odnalezienia zdarzenia
+            query = parse_qs(urlsplit(raw_path).query).get('q', [''])[0]
+            found = _SYNTHETIC_TEAM_NUMBER.search(query)
+            if not found or int(found.group(1)) // 2 >= days[0].events:
+                return 200, self._search_empty.encode('utf-8'), html
+            return 200, days[0].search_page(int(found.group(1)) // 2).encode('utf-8'), html
+        
+        if route == "xhr":
+            sport = parse_qs(urlsplit(raw_path).query).get('sport', [''])[0]
+            day = next((d for d in days if d.sport.value == sport), None)
+            if day is None:
+                return 404, b"Not Found", "text/plain"
+            return 200, day.predictions_json().replace(FOREBET_ORIGIN, self.url).encode('utf-8'), "application/json"
+        
+        if route == "match":
+            found = _SYNTHETIC_MATCH_ID.search(path)
+            day = next((d for d in days if found and d.sport.value == found.group(1)), None)
+            index = int(found.group(2)) - 3_000_000 if found else -1
+            if day is None or not 0 <= index < day.events:
+                return 404, b"Not Found", "text/plain"
+            return 200, self._rewrite_links(day.match_page(index)), html
+        
+        for pattern, day in self._days.items():
+            if path.rstrip('/').endswith(pattern):
+                with self._lock:
+                    if pattern not in self._synthetic_listings:
+                        self._synthetic_listings[pattern] = self._rewrite_links(day.listing_html())
+                return 200, self._synthetic_listings[pattern], html
+        return 404, b"Not Found", "text/plain"
+    
+    def _rewrite_links(self, page: str) -> bytes:
+        """Kieruje absolutne linki Forebet na ten serwer (i dołącza zasoby statyczne)."""
+        page = page.replace(FOREBET_ORIGIN, self.url)
+        if self.assets:
+            tags = ''.join(f'<img src="/static/img-{i}.png" width="64" height="64">' for i in range(self.assets))
+            font = '<style>@font-face{font-family:f;src:url(/static/font.woff2)}body{font-family:f}</style>'
+            page = page.replace('</body>', f'{font}{tags}</body>', 1)
+        return page.encode('utf-8')
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Mock Forebet/Flashscore do testów przepustowości")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="opóźnienie odpowiedzi (s)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="losowe dodatkowe opóźnienie (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="odsetek odpowiedzi 503")
+    parser.add_argument("--rate-limit", type=float, default=None, help="limit zapytań na sekundę (429)")
+    parser.add_argument("--synthetic", type=int, default=None, help="N zdarzeń syntetycznych na sport zamiast korpusu")
+    args = parser.parse_args(argv)
+    
+    server = MockServer(args.host, args.port, args.latency, args.jitter, args.error_rate, args.rate_limit,
+                        synthetic=args.synthetic)
+    print(f"🧪 Mock Forebet/Flashscore: {server.url}  (python main.py --endpoint {server.url})")
+    try:
+        server.start()
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        for (route, status), count in sorted(server.stats.items()):
+            print(f"{route:>8} {status}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
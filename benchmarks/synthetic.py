@@ -0,0 +1,234 @@
+"""
+Generator syntetycznych dni Forebet/Flashscore o dowolnej liczbie zdarzeń.
+
+Generuje listing, dane prognoz XHR (JSON), strony meczów (forma + H2H), wyszukiwarkę
+i feedy kursów w tym samym formacie co korpus (benchmarks/corpus). Zdarzenie `i` jest zawsze takie samo
+dla danego ziarna, a strony są generowane na żądanie - dzień na 100k zdarzeń nie
+trzyma w pamięci 100k stron meczów.
+
+Przykład:
+    day = SyntheticDay(10_000, Sport.FOOTBALL)
+    html = day.listing_html()
+    page = day.match_page(42)
+"""
+import json
+import random
+from typing import Dict, List, Tuple
+
+from src.config import Sport
+
+FOREBET_ORIGIN = "https://www.forebet.com"
+XHR_PATH = "/scripts/predictions.php"
+NORDIC_BET_ID = 37
+
+_CLUBS = [
+    "United", "City", "Athletic", "Rovers", "Wanderers", "Albion", "Town", "County",
+    "Sporting", "Dynamo", "Olympic", "Real", "Racing", "Union", "Stal", "Polonia",
+]
+_BOOKMAKERS = [(16, "bet365"), (417, "1xBet"), (5, "Unibet"), (49, "Betway"), (2, "bwin")]
+_NO_DRAW_SPORTS = {Sport.BASKETBALL, Sport.VOLLEYBALL, Sport.BASEBALL, Sport.AMERICAN_FOOTBALL}
+
+_TABLE_ROW = (
+    '<tr data-tid="{match_id}" class="tr_{parity}">'
+    '<td class="shortTag" title="{league}">{tag}</td>'
+    '<td class="tnms"><a href="/pl/team/{home_slug}">{home}</a> - <a href="/pl/team/{away_slug}">{away}</a>'
+    '<br><span class="date_bah">{kickoff}</span></td>'
+    '<td><div class="fprc"><span class="fpr">{p_home}</span><span>{p_draw}</span><span>{p_away}</span></div></td>'
+    '<td class="lmbrw"><a href="{match_url}" class="tnmscn">szczegóły</a></td>'
+    '</tr>\n'
+)
+_RCNT_ROW = (
+    '<div class="rcnt tr_{parity}"><div class="stcn"><span class="shortTag" title="{league}">{tag}</span></div>'
+    '<div class="tnms"><a href="{match_url}" class="tnmscn" itemprop="url">'
+    '<span class="homeTeam" itemprop="homeTeam"><span itemprop="name">{home}</span></span>'
+    '<span class="awayTeam" itemprop="awayTeam"><span itemprop="name">{away}</span></span>'
+    '<span class="date_bah">{kickoff}</span></a></div>'
+    '<div class="fprc"><span class="fpr">{p_home}</span><span>{p_draw}</span><span>{p_away}</span></div>'
+    '</div>\n'
+)
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(' ', '-')
+
+
+class SyntheticDay:
+    """Deterministyczny dzień z `events` zdarzeniami jednego sportu."""
+    
+    def __init__(self, events: int, sport: Sport = Sport.FOOTBALL, seed: int = 42):
+        """
+        Args:
+            events: Liczba zdarzeń w listingu
+            sport: Sport (piłka nożna: układ tabeli data-tid, pozostałe: div.rcnt)
+            seed: Ziarno generatora
+        """
+        self.events = events
+        self.sport = sport
+        self.seed = seed
+    
+    def _rng(self, index: int, salt: int = 0) -> random.Random:
+        """Generator zależny tylko od ziarna i numeru zdarzenia."""
+        return random.Random((self.seed * 1_000_003 + index) * 31 + salt)
+    
+    def event(self, index: int) -> Dict[str, object]:
+        """
+        Dane zdarzenia `index` (drużyny, liga, prawdopodobieństwa, ID).
+        
+        Args:
+            index: Numer zdarzenia (0..events-1)
+        
+        Returns:
+            Słownik pól używanych w szablonach
+        """
+        rng = self._rng(index)
+        league = index % 120
+        home = f"{_CLUBS[index % len(_CLUBS)]} {league}-{2 * index}"
+        away = f"{_CLUBS[(index + 7) % len(_CLUBS)]} {league}-{2 * index + 1}"
+        
+        draw = 0 if self.sport in _NO_DRAW_SPORTS else rng.randint(12, 32)
+        p_home = rng.randint(10, 95 - draw)
+        match_id = 3_000_000 + index
+        lang = "pl" if self.sport == Sport.FOOTBALL else "en"
+        return {
+            'match_id': match_id,
+            'home': home,
+            'away': away,
+            'home_slug': _slug(home),
+            'away_slug': _slug(away),
+            'league': f"League {league}",
+            'tag': f"L{league}",
+            'kickoff': f"20/10/2026 {10 + index % 13:02d}:{(index * 15) % 60:02d}",
+            'p_home': p_home,
+            'p_draw': draw,
+            'p_away': 100 - draw - p_home,
+            'match_url': f"{FOREBET_ORIGIN}/{lang}/{self.sport.value}/matches/{_slug(home)}-{_slug(away)}-{match_id}",
+            'parity': index % 2,
+        }
+    
+    def listing_html(self) -> str:
+        """Listing prognoz ze wszystkimi zdarzeniami dnia."""
+        template = _TABLE_ROW if self.sport == Sport.FOOTBALL else _RCNT_ROW
+        rows = [template.format(**self.event(i)) for i in range(self.events)]
+        
+        if self.sport == Sport.FOOTBALL:
+            body = f'<table class="schema"><tbody>\n{"".join(rows)}</tbody></table>\n'
+        else:
+            body = f'<div class="schema">\n{"".join(rows)}</div>\n'
+        return (
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            f'<title>{self.sport.value} predictions | Forebet</title></head>\n'
+            f'<body><div id="body-main"><div class="contentmiddle">\n{body}</div></div>\n'
+            f'<script>fetch("{XHR_PATH}?sport={self.sport.value}").then(r => r.json());</script>'
+            '</body></html>\n'
+        )
+    
+    def predictions_json(self) -> str:
+        """Dane prognoz, które listing dociąga przez XHR (te same zdarzenia co listing_html)."""
+        rows = []
+        for i in range(self.events):
+            event = self.event(i)
+            rows.append({
+                'id': event['match_id'], 'HOST_NAME': event['home'], 'GUEST_NAME': event['away'],
+                'Pred_1': event['p_home'], 'Pred_X': event['p_draw'], 'Pred_2': event['p_away'],
+                'league_name': event['league'], 'short_tag': event['tag'], 'DATE_BAH': event['kickoff'],
+                'url': event['match_url'],
+            })
+        return json.dumps({'sport': self.sport.value, 'matches': rows})
+    
+    def form(self, index: int) -> Tuple[str, str]:
+        """Forma gospodarzy i gości (ostatnie 6 meczów, np. "WWDLWD")."""
+        rng = self._rng(index, salt=1)
+        return (
+            ''.join(rng.choice("WWDL") for _ in range(6)),
+            ''.join(rng.choice("WDLL") for _ in range(6)),
+        )
+    
+    def match_page(self, index: int) -> str:
+        """Strona szczegółów meczu: sekcje formy i (dla części meczów) historia H2H."""
+        event = self.event(index)
+        home_form, away_form = self.form(index)
+        rng = self._rng(index, salt=2)
+        
+        sections = [
+            f'<div class="last_matches_home"><h2>{event["home"]}</h2>{_form_spans(home_form)}</div>',
+            f'<div class="last_matches_away"><h2>{event["away"]}</h2>{_form_spans(away_form)}</div>',
+        ]
+        h2h_rows = []
+        for n in range(rng.choice([0, 0, 2, 4, 6, 8, 10])):
+            home, away = (event['home'], event['away']) if n % 2 == 0 else (event['away'], event['home'])
+            h2h_rows.append(
+                f'<tr class="match_row"><td><span class="date">{1 + n:02d}/05/{2025 - n // 2}</span></td>'
+                f'<td><a class="team">{home}</a></td><td><span class="score">{rng.randint(0, 4)}-{rng.randint(0, 3)}</span></td>'
+                f'<td><a class="team">{away}</a></td></tr>'
+            )
+        if h2h_rows:
+            sections.append(f'<div class="h2h_block"><table>{"".join(h2h_rows)}</table></div>')
+        
+        return (
+            '<!DOCTYPE html>\n<html><head><meta charset="utf-8">'
+            f'<title>{event["home"]} vs {event["away"]}</title></head>\n'
+            f'<body><div id="body-main">{"".join(sections)}</div></body></html>\n'
+        )
+    
+    def flashscore_id(self, index: int) -> str:
+        """ID meczu we Flashscore (8 znaków: ziarno i numer zdarzenia, odwracalne - parse_flashscore_id)."""
+        return f"{self.seed % 100:02d}{index:06x}"
+    
+    def search_page(self, index: int) -> str:
+        """Wynik wyszukiwarki Flashscore z identyfikatorem g_1_<id>."""
+        event = self.event(index)
+        return (
+            '<!DOCTYPE html><html lang="pl"><head><meta charset="utf-8"></head><body><div id="search-results">'
+            f'<div class="event__match" id="g_1_{self.flashscore_id(index)}">'
+            f'<div class="event__participant--home">{event["home"]}</div>'
+            f'<div class="event__participant--away">{event["away"]}</div></div></div></body></html>\n'
+        )
+    
+    def odds_feed(self, index: int) -> str:
+        """Feed df_od meczu (Nordic Bet obecny w ~85% meczów)."""
+        rng = self._rng(index, salt=3)
+        bookmakers = list(_BOOKMAKERS[:rng.randint(2, len(_BOOKMAKERS))])
+        if rng.random() < 0.85:
+            bookmakers.insert(rng.randint(0, len(bookmakers)), (NORDIC_BET_ID, "Nordic Bet"))
+        
+        parts = ['SA÷1¬~OA÷1X2¬OB÷Full Time¬OC÷1¬']
+        for bookmaker_id, name in bookmakers:
+            odds = [round(rng.uniform(1.2, 7.5), 2) for _ in range(3)]
+            parts.append(f'~OD¬AA¬{bookmaker_id}¬{name}¬~OE¬{odds[0]}¬{odds[1]}¬{odds[2]}¬OG¬1¬OH¬0¬')
+        parts.append('~A1÷f6d3c1e2b7¬')
+        return ''.join(parts)
+
+
+def _form_spans(results: str) -> str:
+    return ''.join(f'<span class="form_{result.lower()}">{result}</span>' for result in results)
+
+
+def parse_flashscore_id(flashscore_id: str) -> Tuple[int, int]:
+    """
+    Odwrotność SyntheticDay.flashscore_id.
+    
+    Args:
+        flashscore_id: ID meczu z wyszukiwarki syntetycznej
+    
+    Returns:
+        (ziarno % 100, numer zdarzenia)
+    """
+    return int(flashscore_id[:2]), int(flashscore_id[2:], 16)
+
+
+def generate_day(events: int, sports: List[Sport], seed: int = 42) -> Dict[Sport, SyntheticDay]:
+    """
+    Dni syntetyczne dla kilku sportów (po `events` zdarzeń każdy).
+    
+    Args:
+        events: Liczba zdarzeń na sport
+        sports: Sporty
+        seed: Ziarno generatora
+    
+    Returns:
+        Słownik {sport: SyntheticDay}
+    """
+    return {sport: SyntheticDay(events, sport, seed + i) for i, sport in enumerate(sports)}
+
+
+__all__ = ['SyntheticDay', 'generate_day', 'parse_flashscore_id']
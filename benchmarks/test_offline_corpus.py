@@ -0,0 +1,180 @@
+"""
+Benchmarki offline na korpusie zapisanych stron (benchmarks/corpus).
+
+Mierzy parsowanie listingów, stron meczów i feedów kursów, analizatory,
+EventFilter i renderowanie emaili - bez sieci i przeglądarki.
+
+Uruchomienie:
+    python -m pytest benchmarks [--bench-save]
+"""
+from typing import Any, Dict, List
+
+import pytest
+from bs4 import BeautifulSoup
+
+from src.config import Settings, Sport
+from src.scrapers import ForebtScraper
+from src.analyzers import FormAnalyzer, HomeAwayAnalyzer, HeadToHeadAnalyzer, score_results
+from src.filters import EventFilter
+from src.odds_fetchers import FlashscoreFetcher
+from src.notifiers.email_templates import render_sport_email, render_summary_email
+
+from . import corpus
+
+SPORTS = list(Settings.SPORT_URL_PATTERNS)
+MATCH_PAGES = corpus.match_pages()
+ODDS_FEEDS = corpus.odds_feeds()
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    scraper = ForebtScraper(use_selenium=False)
+    yield scraper
+    scraper.close()
+
+
+@pytest.fixture(scope="module")
+def fetcher():
+    fetcher = FlashscoreFetcher()
+    yield fetcher
+    fetcher.close()
+
+
+@pytest.fixture(scope="module")
+def corpus_events(scraper) -> List[Dict[str, Any]]:
+    """Wszystkie zdarzenia z listingów korpusu."""
+    events = []
+    for sport in SPORTS:
+        events.extend(_parse_listing(scraper, corpus.listing_html(sport), sport))
+    return events
+
+
+@pytest.fixture(scope="module")
+def corpus_teams(scraper, corpus_events):
+    """Pary (drużyna, forma) - gospodarze i goście naprzemiennie, forma ze stron meczów korpusu."""
+    forms = [scraper._parse_team_form(BeautifulSoup(html, 'lxml')) for html in MATCH_PAGES.values()]
+    teams = []
+    for i, event in enumerate(corpus_events):
+        form = forms[i % len(forms)]
+        teams.append((event['home_team'], form['home_form']))
+        teams.append((event['away_team'], form['away_form']))
+    return teams
+
+
+@pytest.fixture(scope="module")
+def analyzed_events(corpus_events, corpus_teams, fetcher) -> List[Dict[str, Any]]:
+    """Zdarzenia z pełną analizą (jak po etapie 2 i 3 w main.py)."""
+    home_form, away_form, home_records, away_records = _analyze(corpus_teams)
+    h2h = HeadToHeadAnalyzer()
+    h2h_matches = h2h._parse_h2h_page(BeautifulSoup(MATCH_PAGES['arsenal-chelsea'], 'lxml'))
+    odds = [fetcher._parse_flashscore_odds(feed, fetcher.NORDIC_BET_ID) for feed in ODDS_FEEDS.values()]
+    
+    analyzed = []
+    for i, event in enumerate(corpus_events):
+        event_odds = odds[i % len(odds)]
+        analyzed.append({
+            'event': event,
+            'analysis': {
+                'h2h': h2h._calculate_h2h_stats(h2h_matches, event['home_team']),
+                'home_form': home_form[i],
+                'away_form': away_form[i],
+                'home_home_record': home_records[i],
+                'away_away_record': away_records[i],
+                'odds': {'has_odds': event_odds is not None, 'home_win': (event_odds or {}).get('home'),
+                         'draw': (event_odds or {}).get('draw'), 'away_win': (event_odds or {}).get('away')},
+            },
+        })
+    h2h.close()
+    return analyzed
+
+
+def _parse_listing(scraper: ForebtScraper, html: str, sport: Sport) -> List[Dict[str, Any]]:
+    """Pełne parsowanie listingu: drzewo lxml + ekstrakcja zdarzeń."""
+    return scraper._parse_events(BeautifulSoup(html, 'lxml'), sport)
+
+
+def _analyze(teams):
+    """Etap scoringu z main.py: jedno przejście score_results dla formy i home/away."""
+    scores = score_results([matches for _, matches in teams], Settings.MATCHES_TO_ANALYZE)
+    forms = FormAnalyzer().analyze_form_batch(teams, scores=scores)
+    home_away = HomeAwayAnalyzer()
+    home_records = home_away.analyze_records_batch(teams[0::2], "home",
+                                                   scores={k: v[0::2] for k, v in scores.items()})
+    away_records = home_away.analyze_records_batch(teams[1::2], "away",
+                                                   scores={k: v[1::2] for k, v in scores.items()})
+    return forms[0::2], forms[1::2], home_records, away_records
+
+
+@pytest.mark.parametrize("sport", SPORTS, ids=lambda sport: sport.value)
+def test_parse_listing(bench, scraper, sport):
+    """Parsowanie zapisanego listingu każdego sportu."""
+    events = bench(_parse_listing, scraper, corpus.listing_html(sport), sport)
+    
+    assert events
+    assert all(event['sport'] == sport.value for event in events)
+
+
+@pytest.mark.parametrize("slug", sorted(MATCH_PAGES))
+def test_parse_team_form(bench, scraper, slug):
+    """Parsowanie formy ze strony meczu (sekcje W/D/L lub tabele wyników)."""
+    html = MATCH_PAGES[slug]
+    form = bench(lambda: scraper._parse_team_form(BeautifulSoup(html, 'lxml')))
+    
+    assert form['home_form'] and form['away_form']
+
+
+def test_parse_h2h_page(bench):
+    """Parsowanie historii H2H ze strony meczu."""
+    analyzer = HeadToHeadAnalyzer()
+    html = MATCH_PAGES['arsenal-chelsea']
+    matches = bench(lambda: analyzer._parse_h2h_page(BeautifulSoup(html, 'lxml')))
+    analyzer.close()
+    
+    assert len(matches) == 10
+
+
+@pytest.mark.parametrize("flashscore_id", sorted(ODDS_FEEDS))
+def test_parse_flashscore_odds(bench, fetcher, flashscore_id):
+    """Parsowanie feedu kursów df_od (Nordic Bet obecny lub nie)."""
+    bench(fetcher._parse_flashscore_odds, ODDS_FEEDS[flashscore_id], fetcher.NORDIC_BET_ID)
+
+
+def test_analyzers(bench, corpus_teams):
+    """Batch scoring formy i home/away dla wszystkich zdarzeń korpusu."""
+    home_form, away_form, home_records, away_records = bench(_analyze, corpus_teams)
+    
+    assert len(home_form) == len(away_form) == len(home_records) == len(away_records) == len(corpus_teams) // 2
+
+
+def test_h2h_stats(bench, corpus_events):
+    """Statystyki H2H z indeksu dla każdego zdarzenia korpusu."""
+    analyzer = HeadToHeadAnalyzer()
+    matches = analyzer._parse_h2h_page(BeautifulSoup(MATCH_PAGES['arsenal-chelsea'], 'lxml'))
+    
+    stats = bench(lambda: [analyzer._calculate_h2h_stats(matches, event['home_team']) for event in corpus_events])
+    analyzer.close()
+    
+    assert len(stats) == len(corpus_events)
+
+
+def test_event_filter(bench, analyzed_events):
+    """Kwalifikacja wszystkich zdarzeń korpusu."""
+    decisions = bench(lambda: [EventFilter.qualify_event(item['event'], item['analysis'])
+                               for item in analyzed_events])
+    
+    assert len(decisions) == len(analyzed_events)
+
+
+def test_render_sport_email(bench, analyzed_events):
+    """Renderowanie emaila sportowego dla wszystkich zdarzeń piłkarskich korpusu."""
+    football = [item for item in analyzed_events if item['event']['sport'] == Sport.FOOTBALL.value]
+    html = bench(render_sport_email, Sport.FOOTBALL.value, football)
+    
+    assert football[0]['event']['home_team'] in html
+
+
+def test_render_summary_email(bench, analyzed_events):
+    """Renderowanie emaila zbiorczego dla wszystkich zdarzeń korpusu."""
+    html = bench(render_summary_email, analyzed_events)
+    
+    assert analyzed_events[-1]['event']['away_team'] in html
@@ -0,0 +1,36 @@
+"""
+Szybki test skalowania: etapy potoku na syntetycznych dniach 250 i 2000 zdarzeń.
+
+Pełny pomiar (do 100k zdarzeń, z etapem details i szczytem pamięci):
+    python -m benchmarks.bench_scaling 10 1000 10000 100000
+"""
+import logging
+
+import pytest
+
+from .bench_scaling import run_scaling, superlinear_stages
+from .synthetic import SyntheticDay, parse_flashscore_id
+
+
+def test_synthetic_day_is_deterministic():
+    """Ten sam seed daje te same strony; ID Flashscore jest odwracalne."""
+    day, again = SyntheticDay(50), SyntheticDay(50)
+    
+    assert day.listing_html() == again.listing_html()
+    assert day.odds_feed(7) == again.odds_feed(7)
+    assert parse_flashscore_id(day.flashscore_id(49)) == (42, 49)
+
+
+def test_pipeline_stages_scale_linearly():
+    """Wykładnik czasu i pamięci parse/analysis/filter/render nie przekracza MAX_EXPONENT."""
+    logging.disable(logging.INFO)
+    try:
+        results = run_scaling([250, 2000], stages=['parse', 'analysis', 'filter', 'render'], repeats=2)
+    finally:
+        logging.disable(logging.NOTSET)
+    
+    assert superlinear_stages(results) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -2,29 +2,93 @@
 Forebet Scraper - Główny orchestrator
 Automatyczne monitorowanie zdarzeń sportowych z Forebet.
 """
+import argparse
 import sys
 import time
-import smtplib
 from datetime import datetime
-from typing import List, Dict, Any
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from typing import List, Dict, Any, Optional
 
 from src.config import Settings, Sport, secrets
-from src.data_management import get_logger, Logger, cache_manager
+from src.data_management import (
+    get_logger, get_hot_logger, Logger, cache_manager, team_history_store, h2h_index, run_log, metrics,
+    run_profiler
+)
 from src.scrapers import ForebtScraper
-from src.analyzers import HeadToHeadAnalyzer, FormAnalyzer, HomeAwayAnalyzer
+from src.analyzers import HeadToHeadAnalyzer, FormAnalyzer, HomeAwayAnalyzer, score_results
 from src.odds_fetchers import OddsAggregator
 from src.filters import EventFilter
-from src.notifiers import EmailSender
+from src.notifiers import EmailSender, NotificationDispatcher
+from src.scheduling import run_deadline, prioritize
+from src.transport import fetch_engine, host_of, http_cache, response_store
 
 # Konfiguruj root logger
 Logger.setup_root_logger()
 logger = get_logger(__name__)
+hot_logger = get_hot_logger(__name__)
 
+_run_duration = metrics.gauge("run_duration_seconds", "Czas trwania ostatniego przebiegu")
+_run_exit_code = metrics.gauge("run_exit_code", "Kod wyjścia ostatniego przebiegu (0 = sukces)")
+_run_last_success = metrics.gauge("run_last_success_timestamp_seconds", "Znacznik czasu ostatniego udanego przebiegu")
+_events_analyzed = metrics.counter("events_analyzed_total", "Zdarzenia z przewagą przekazane do analizy", ["sport"])
+_events_qualified = metrics.counter("events_qualified_total", "Zdarzenia kwalifikowane", ["sport"])
 
-def main():
-    """Główna funkcja orchestratora."""
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Argumenty wiersza poleceń."""
+    parser = argparse.ArgumentParser(description="Forebet Scraper - monitorowanie zdarzeń sportowych")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="profiluj przebieg (cProfile, czas ściany/CPU i szczyt pamięci per etap; raport i .prof w logs/)"
+    )
+    parser.add_argument(
+        "--endpoint", metavar="URL",
+        help="kieruj zapytania Forebet i Flashscore na podany serwer (np. mock: python -m benchmarks.mock_server)"
+    )
+    parser.add_argument(
+        "--transport", choices=["live", "record", "replay", "cache"],
+        help="tryb warstwy HTTP: nagrywanie/odtwarzanie odpowiedzi lub długotrwały cache (Settings.TRANSPORT_STORE_DIR)"
+    )
+    parser.add_argument(
+        "--time-budget", type=int, metavar="SECONDS",
+        help="budżet czasu przebiegu w sekundach (domyślnie env RUN_TIME_BUDGET lub Settings.RUN_TIME_BUDGET; 0 = bez limitu)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
+    """Główna funkcja orchestratora (przebieg + zapis metryk)."""
+    args = parse_args(argv)
+    start = time.time()
+    exit_code = 1
+    
+    if args.profile:
+        run_profiler.start()
+    
+    if args.endpoint:
+        Settings.override_endpoints(args.endpoint)
+        logger.info("🧪 Endpointy Forebet/Flashscore: %s", args.endpoint)
+    
+    if args.transport:
+        Settings.TRANSPORT_MODE = args.transport
+        logger.info("📼 Transport HTTP: %s (%s)", args.transport, Settings.TRANSPORT_STORE_DIR)
+    
+    run_deadline.start(args.time_budget if args.time_budget is not None else secrets.run_time_budget)
+    
+    try:
+        exit_code = run()
+        return exit_code
+    finally:
+        _run_duration.set(round(time.time() - start, 3))
+        _run_exit_code.set(exit_code)
+        if exit_code == 0:
+            _run_last_success.set(int(time.time()))
+        fetch_engine.close()
+        metrics.write_textfile()
+        run_profiler.stop()
+
+
+def run():
+    """Przebieg orchestratora: listing, analiza, kwalifikacja i powiadomienia."""
     logger.info("=" * 70)
     logger.info("🚀 Forebet Scraper uruchomiony")
     logger.info(f"📅 Data: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -41,66 +105,101 @@ def main():
         expired = cache_manager.cleanup_expired()
         if expired > 0:
             logger.info(f"✓ Usunięto {expired} wygasłych plików cache")
+        pruned = response_store.prune()
+        if pruned['requests']:
+            logger.info(f"✓ Cache HTTP: usunięto {pruned['requests']} starych wpisów, "
+                        f"zwolniono {pruned['bytes'] / 1024 / 1024:.1f} MB")
         
         # Lista sportów do analizy
         sports_to_analyze = Settings.SUPPORTED_SPORTS
         logger.info(f"🎯 Sporty do analizy: {', '.join([s.value for s in sports_to_analyze])}")
         
-        # Zbierz wszystkie zdarzenia
-        all_events = []
+        # Liczniki dla podsumowania
+        total_events = 0
+        total_qualified = 0
         
-        with ForebtScraper(use_selenium=True) as scraper:
-            for sport in sports_to_analyze:
-                try:
-                    logger.info(f"\n{'─' * 70}")
-                    logger.info(f"🏆 Przetwarzanie sportu: {sport.value.upper()}")
-                    logger.info(f"{'─' * 70}")
-                    
-                    events = scraper.fetch_events_by_sport(sport)
-                    
-                    if not events:
-                        logger.warning(f"⚠️  Brak zdarzeń dla {sport.value}")
+        # Emaile sportów wysyłane w tle po kwalifikacji
+        with NotificationDispatcher(EmailSender()) as dispatcher:
+            with ForebtScraper(use_selenium=True) as scraper:
+                # Etap 1: listingi wszystkich sportów (zdarzenia z przewagą zbierane razem)
+                pending = []
+                for sport in sports_to_analyze:
+                    # Po wyczerpaniu budżetu czasu tylko analiza i wysyłka tego, co już pobrane
+                    if not run_deadline.allows('sport'):
                         continue
                     
-                    # Filtruj po przewadze matematycznej
-                    filtered_events = [
-                        e for e in events 
-                        if e.get('probabilities', {}).get('max', 0) >= Settings.NOTIFICATION_THRESHOLD
-                    ]
-                    
-                    logger.info(f"✓ Znaleziono {len(events)} zdarzeń, {len(filtered_events)} z przewagą ≥{Settings.NOTIFICATION_THRESHOLD}%")
+                    try:
+                        logger.info(f"\n{'─' * 70}")
+                        logger.info(f"🏆 Przetwarzanie sportu: {sport.value.upper()}")
+                        logger.info(f"{'─' * 70}")
+                        
+                        with run_log.stage('listing', sport=sport.value):
+                            events = scraper.fetch_events_by_sport(sport)
+                        
+                        if not events:
+                            logger.warning(f"⚠️  Brak zdarzeń dla {sport.value}")
+                            continue
+                        
+                        # Zapamiętaj mecze drużyn (decydują o odświeżaniu historii formy i H2H)
+                        team_history_store.record_events(events)
+                        h2h_index.record_events(events)
+                        
+                        # Filtruj po przewadze matematycznej
+                        filtered_events = [
+                            e for e in events 
+                            if e.get('probabilities', {}).get('max', 0) >= Settings.NOTIFICATION_THRESHOLD
+                        ]
+                        
+                        logger.info(f"✓ Znaleziono {len(events)} zdarzeń, {len(filtered_events)} z przewagą ≥{Settings.NOTIFICATION_THRESHOLD}%")
+                        
+                        total_events += len(filtered_events)
+                        _events_analyzed.inc(len(filtered_events), sport=sport.value)
+                        pending.extend(filtered_events)
                     
-                    all_events.extend(filtered_events)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Błąd przetwarzania {sport.value}: {e}", exc_info=True)
-                    continue
-        
-        if not all_events:
-            logger.warning("\n⚠️  Brak zdarzeń spełniających kryterium przewagi matematycznej")
-            send_no_events_notification()
-            return 0
-        
-        logger.info(f"\n📊 Łącznie zdarzeń do dalszej analizy: {len(all_events)}")
+                    except Exception as e:
+                        logger.error(f"❌ Błąd przetwarzania {sport.value}: {e}", exc_info=True)
+                        continue
+                
+                # Etap 2: analiza wszystkich sportów w jednej kolejce priorytetów (najbliższe rozpoczęcia
+                # i najwyższa przewaga najpierw) - przy deadline degradacja dotyka najmniej pilnych
+                qualified_by_sport: Dict[str, List[Dict[str, Any]]] = {}
+                if pending:
+                    try:
+                        for item in analyze_and_qualify_events(prioritize(pending), scraper):
+                            qualified_by_sport.setdefault(item['event'].get('sport', 'football'), []).append(item)
+                    except Exception as e:
+                        logger.error(f"❌ Błąd analizy zdarzeń: {e}", exc_info=True)
+                
+                for sport in sports_to_analyze:
+                    qualified_events = qualified_by_sport.get(sport.value)
+                    if qualified_events:
+                        logger.info(f"✅ Kwalifikowanych zdarzeń ({sport.value}): {len(qualified_events)}")
+                        total_qualified += len(qualified_events)
+                        _events_qualified.inc(len(qualified_events), sport=sport.value)
+                        dispatcher.submit_sport(sport.value, qualified_events)
+            
+            if not total_events:
+                logger.warning("\n⚠️  Brak zdarzeń spełniających kryterium przewagi matematycznej")
+            elif not total_qualified:
+                logger.warning("\n⚠️  Brak zdarzeń spełniających wszystkie kryteria kwalifikacji")
+            
+            if not total_qualified:
+                dispatcher.submit_no_events()
+            
+            # Dosłanie kolejki przed podsumowaniem
+            logger.info(f"\n{'=' * 70}")
+            logger.info("📧 Oczekiwanie na wysyłkę powiadomień...")
+            logger.info(f"{'=' * 70}")
+            success = dispatcher.flush()
         
-        # Analiza i kwalifikacja zdarzeń
-        qualified_events = analyze_and_qualify_events(all_events)
+        _log_stage_summary()
         
-        if not qualified_events:
-            logger.warning("\n⚠️  Brak zdarzeń spełniających wszystkie kryteria kwalifikacji")
-            send_no_events_notification()
+        # Brak zdarzeń to poprawny przebieg - błąd samego powiadomienia nie zmienia kodu wyjścia
+        if not total_qualified:
+            if not success:
+                logger.warning("⚠️  Nie udało się wysłać powiadomienia o braku zdarzeń")
             return 0
         
-        logger.info(f"\n✅ Kwalifikowanych zdarzeń: {len(qualified_events)}")
-        
-        # Wysłanie emaila
-        logger.info(f"\n{'=' * 70}")
-        logger.info("📧 Wysyłanie powiadomienia email...")
-        logger.info(f"{'=' * 70}")
-        
-        email_sender = EmailSender()
-        success = email_sender.send_qualified_events(qualified_events)
-        
         if success:
             logger.info("✅ Email wysłany pomyślnie!")
         else:
@@ -112,31 +211,36 @@ def main():
         logger.info("📊 PODSUMOWANIE")
         logger.info(f"{'=' * 70}")
         logger.info(f"Sportów przeanalizowanych: {len(sports_to_analyze)}")
-        logger.info(f"Zdarzeń znalezionych: {len(all_events)}")
-        logger.info(f"Zdarzeń kwalifikowanych: {len(qualified_events)}")
+        logger.info(f"Zdarzeń znalezionych: {total_events}")
+        logger.info(f"Zdarzeń kwalifikowanych: {total_qualified}")
         logger.info(f"{'=' * 70}")
         logger.info("✅ Forebet Scraper zakończony pomyślnie")
         logger.info(f"{'=' * 70}\n")
         
         return 0
-        
+    
     except Exception as e:
         logger.error(f"❌ Krytyczny błąd: {e}", exc_info=True)
         return 1
 
 
-def analyze_and_qualify_events(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def analyze_and_qualify_events(events: List[Dict[str, Any]],
+                               scraper: Optional[ForebtScraper] = None) -> List[Dict[str, Any]]:
     """
     Analizuje i kwalifikuje zdarzenia.
     
     Args:
         events: Lista zdarzeń do analizy
+        scraper: Otwarty scraper do ponownego użycia (domyślnie własny, zamykany na końcu)
     
     Returns:
         Lista kwalifikowanych zdarzeń z analizą
     """
     qualified = []
     
+    # Najpierw najbliższe rozpoczęcia i najwyższa przewaga - przy deadline degradacja dotyka pozostałych
+    events = prioritize(events)
+    
     h2h_analyzer = HeadToHeadAnalyzer()
     form_analyzer = FormAnalyzer()
     home_away_analyzer = HomeAwayAnalyzer()
@@ -147,108 +251,173 @@ def analyze_and_qualify_events(events: List[Dict[str, Any]]) -> List[Dict[str, A
     logger.info("🔍 Analiza i kwalifikacja zdarzeń...")
     logger.info(f"{'─' * 70}\n")
     
-    # Utwórz scraper do pobierania szczegółów (forma)
-    scraper = ForebtScraper(use_selenium=True)
-    scraper._init_driver()
+    # Scraper do pobierania szczegółów (forma) - współdzielony z listingiem, jeśli podany
+    # (WebDriver uruchamiany dopiero przy pierwszym pobraniu strony meczu - fetch_team_form)
+    owns_scraper = scraper is None
+    if owns_scraper:
+        scraper = ForebtScraper(use_selenium=True)
+    
+    # Etap 1: pobieranie danych (H2H + forma) - strony meczów wszystkich zdarzeń równolegle
+    collected = []
+    form_fetches = 0
+    forebet_host = host_of(Settings.FOREBET_BASE_URL)
+    
+    def analyze_h2h(numbered_event):
+        i, event = numbered_event
+        home_team = event.get('home_team', '')
+        away_team = event.get('away_team', '')
+        sport = event.get('sport', 'football')
+        logger.info("[%d/%d] Analiza: %s vs %s", i, len(events), home_team, away_team)
+        
+        with run_log.stage('h2h', sport=sport, match_id=event.get('match_id', '')):
+            return h2h_analyzer.analyze_h2h(home_team, away_team, event.get('match_url', ''), sport,
+                                            refresh=run_deadline.allows('h2h'))
+    
+    def refresh_form(event) -> bool:
+        """Forma z magazynu historii - strona meczu tylko gdy historia nieaktualna (True = pobrano)."""
+        home_team = event.get('home_team', '')
+        away_team = event.get('away_team', '')
+        sport = event.get('sport', 'football')
+        
+        with run_log.stage('form', sport=sport, match_id=event.get('match_id', '')):
+            if not (team_history_store.needs_refresh(home_team, sport)
+                    or team_history_store.needs_refresh(away_team, sport)):
+                run_log.annotate(cache='hit')
+                return False
+            
+            if not run_deadline.allows('form'):
+                run_log.annotate(cache='deadline')
+                return False
+            
+            run_log.annotate(cache='miss')
+            logger.debug("   Pobieranie formy drużyn...")
+            fetched_form = scraper.fetch_team_form(event.get('match_url', ''))
+            team_history_store.record_form(home_team, sport, fetched_form.get('home_form', []))
+            team_history_store.record_form(away_team, sport, fetched_form.get('away_form', []))
+            return True
     
     try:
-        for i, event in enumerate(events, 1):
+        h2h_results = fetch_engine.map(analyze_h2h, list(enumerate(events, 1)), host=forebet_host)
+        # Jeden WebDriver nie obsłuży równoległych stron - z Selenium forma sekwencyjnie
+        form_results = fetch_engine.map(refresh_form, events, host=forebet_host,
+                                        per_host=1 if scraper.use_selenium else None)
+        
+        for event, h2h, fetched in zip(events, h2h_results, form_results):
+            failure = next((r for r in (h2h, fetched) if isinstance(r, BaseException)), None)
+            if failure is not None:
+                logger.error(f"   ❌ Błąd analizy: {failure}")
+                continue
+            
+            form_fetches += fetched
+            sport = event.get('sport', 'football')
+            team_form_data = {
+                'home_form': team_history_store.get_form(event.get('home_team', ''), sport),
+                'away_form': team_history_store.get_form(event.get('away_team', ''), sport),
+            }
+            collected.append((event, h2h, team_form_data))
+        
+        logger.info(f"📚 Forma: {form_fetches} stron meczów pobranych, "
+                    f"{len(collected) - form_fetches} zdarzeń z historii")
+        
+        # Etap 2: forma i home/away dla wszystkich drużyn w jednym wektorowym przejściu
+        # (kolejność: gospodarze i goście naprzemiennie, ta sama sekwencja liczona raz)
+        teams = []
+        for event, _, team_form_data in collected:
+            teams.append((event.get('home_team', ''), team_form_data.get('home_form', [])))
+            teams.append((event.get('away_team', ''), team_form_data.get('away_form', [])))
+        
+        with run_log.stage('scoring', teams=len(teams)):
+            sequences = [matches for _, matches in teams]
+            form_scores = score_results(sequences, Settings.MATCHES_TO_ANALYZE)
+            if HomeAwayAnalyzer.MATCHES_LIMIT == Settings.MATCHES_TO_ANALYZE:
+                venue_scores = form_scores
+            else:
+                venue_scores = score_results(sequences, HomeAwayAnalyzer.MATCHES_LIMIT)
+            
+            forms = form_analyzer.analyze_form_batch(teams, scores=form_scores)
+            # Home/Away Analysis (używamy tej samej formy - uproszczenie)
+            # TODO: W przyszłości można dodać osobne pobieranie statystyk home/away
+            home_records = home_away_analyzer.analyze_records_batch(teams[0::2], "home", scores=_take(venue_scores, 0))
+            away_records = home_away_analyzer.analyze_records_batch(teams[1::2], "away", scores=_take(venue_scores, 1))
+        
+        # Etap 3: kursy Nordic Bet (Flashscore API) równolegle, potem kwalifikacja
+        def fetch_odds(item):
+            event = item[0]
+            sport = event.get('sport', 'football')
+            with run_log.stage('odds', sport=sport, match_id=event.get('match_id', '')):
+                if not run_deadline.allows('odds'):
+                    run_log.annotate(odds='deadline')
+                    return OddsAggregator.unavailable('deadline')
+                return odds_aggregator.aggregate_odds(event.get('match_id', ''), event.get('home_team', ''),
+                                                      event.get('away_team', ''), sport)
+        
+        odds_results = fetch_engine.map(fetch_odds, collected, host=host_of(Settings.FLASHSCORE_BASE_URL))
+        
+        for index, ((event, h2h, _), odds) in enumerate(zip(collected, odds_results)):
             try:
                 home_team = event.get('home_team', '')
                 away_team = event.get('away_team', '')
-                match_url = event.get('match_url', '')
                 match_id = event.get('match_id', '')
                 sport = event.get('sport', 'football')
                 
-                logger.info(f"[{i}/{len(events)}] Analiza: {home_team} vs {away_team}")
-                
-                # H2H Analysis
-                h2h = h2h_analyzer.analyze_h2h(home_team, away_team, match_url)
-                
-                # Pobierz formę drużyn z detali meczu
-                logger.debug(f"   Pobieranie formy drużyn...")
-                team_form_data = scraper.fetch_team_form(match_url)
-                
-                home_form = form_analyzer.analyze_form(home_team, team_form_data.get('home_form', []))
-                away_form = form_analyzer.analyze_form(away_team, team_form_data.get('away_form', []))
-                
-                # Home/Away Analysis (używamy tej samej formy - uproszczenie)
-                # TODO: W przyszłości można dodać osobne pobieranie statystyk home/away
-                home_home_record = home_away_analyzer.analyze_home_record(home_team, team_form_data.get('home_form', []))
-                away_away_record = home_away_analyzer.analyze_away_record(away_team, team_form_data.get('away_form', []))
-                
-                # Odds z Nordic Bet (Flashscore API)
-                odds = odds_aggregator.aggregate_odds(match_id, home_team, away_team, sport)
+                if isinstance(odds, BaseException):
+                    raise odds
                 
                 # Kompletna analiza
                 analysis = {
                     'h2h': h2h,
-                    'home_form': home_form,
-                    'away_form': away_form,
-                    'home_home_record': home_home_record,
-                    'away_away_record': away_away_record,
+                    'home_form': forms[2 * index],
+                    'away_form': forms[2 * index + 1],
+                    'home_home_record': home_records[index],
+                    'away_away_record': away_records[index],
                     'odds': odds
                 }
                 
                 # Kwalifikacja
-                is_qualified, reason = event_filter.qualify_event(event, analysis)
+                with run_log.stage('filter', sport=sport, match_id=match_id) as record:
+                    is_qualified, reason = event_filter.qualify_event(event, analysis)
+                    record.update(qualified=is_qualified, reason=reason)
                 
                 if is_qualified:
-                    logger.info(f"   ✅ KWALIFIKOWANE: {reason}")
+                    logger.info(f"   ✅ KWALIFIKOWANE: {home_team} vs {away_team} - {reason}")
                     qualified.append({
                         'event': event,
                         'analysis': analysis,
                         'qualification_reason': reason
                     })
                 else:
-                    logger.debug(f"   ❌ Odrzucone: {reason}")
-                
+                    hot_logger.sampled(index + 1, "   ❌ Odrzucone: %s", reason)
+            
             except Exception as e:
                 logger.error(f"   ❌ Błąd analizy: {e}")
                 continue
     
     finally:
         # Cleanup
-        scraper.close()
+        if owns_scraper:
+            scraper.close()
         h2h_analyzer.close()
         odds_aggregator.close()
     
     return qualified
 
 
-def send_no_events_notification():
-    """Wysyła powiadomienie o braku kwalifikowanych zdarzeń."""
-    try:
-        email_sender = EmailSender()
-        
-        html = f"""
-        <html>
-        <body style="font-family: Arial, sans-serif;">
-            <h2>Forebet Scraper - Brak kwalifikowanych zdarzeń</h2>
-            <p><strong>Data:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            <p>Dzisiaj nie znaleziono żadnych zdarzeń spełniających wszystkie kryteria kwalifikacji.</p>
-            <p style="color: #7f8c8d; font-size: 0.9em;">Wygenerowane automatycznie przez Forebet Scraper</p>
-        </body>
-        </html>
-        """
-        
-        message = MIMEMultipart('alternative')
-        message['Subject'] = "Forebet Scraper - Brak kwalifikowanych zdarzeń"
-        message['From'] = email_sender.sender_email
-        message['To'] = email_sender.recipient_email
-        
-        message.attach(MIMEText(html, 'html', 'utf-8'))
-        
-        with smtplib.SMTP(email_sender.smtp_server, email_sender.smtp_port) as server:
-            if Settings.USE_TLS:
-                server.starttls()
-            server.login(email_sender.sender_email, email_sender.sender_password)
-            server.sendmail(email_sender.sender_email, email_sender.recipient_email, message.as_string())
-        
-        logger.info("📧 Wysłano powiadomienie o braku zdarzeń")
-        
-    except Exception as e:
-        logger.error(f"Błąd wysyłania powiadomienia: {e}")
+def _log_stage_summary():
+    """Loguje czasy etapów przebiegu (p50/p95) z dziennika JSON."""
+    logger.info(f"\n{'=' * 70}")
+    logger.info(f"⏱️  CZASY ETAPÓW (szczegóły: {run_log.path})")
+    logger.info(f"{'=' * 70}")
+    for line in run_log.format_summary():
+        logger.info(line)
+    for line in http_cache.format_summary():
+        logger.info(line)
+    for line in run_deadline.format_summary():
+        logger.info(line)
+
+
+def _take(scores: Dict[str, Any], offset: int) -> Dict[str, Any]:
+    """Wybiera co drugi wiersz wyników batch (gospodarze: 0, goście: 1)."""
+    return {key: values[offset::2] for key, values in scores.items()}
 
 
 if __name__ == "__main__":
@@ -2,5 +2,6 @@
 from .head_to_head_analyzer import HeadToHeadAnalyzer
 from .form_analyzer import FormAnalyzer
 from .home_away_analyzer import HomeAwayAnalyzer
+from .batch_scoring import score_results
 
-__all__ = ["HeadToHeadAnalyzer", "FormAnalyzer", "HomeAwayAnalyzer"]
+__all__ = ["HeadToHeadAnalyzer", "FormAnalyzer", "HomeAwayAnalyzer", "score_results"]
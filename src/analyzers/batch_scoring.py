@@ -0,0 +1,131 @@
+"""
+Wektorowe liczenie formy - wszystkie sekwencje W/D/L z jednego przebiegu naraz.
+"""
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+# Kody wyników: 0 = brak/nieznany (U lub padding), 1 = L, 2 = D, 3 = W
+CODE_UNKNOWN = 0
+CODE_LOSS = 1
+CODE_DRAW = 2
+CODE_WIN = 3
+
+# Tablica ASCII -> kod wyniku (pozostałe znaki = nieznany)
+_ASCII_TO_CODE = np.zeros(256, dtype=np.int8)
+_ASCII_TO_CODE[ord('L')] = CODE_LOSS
+_ASCII_TO_CODE[ord('D')] = CODE_DRAW
+_ASCII_TO_CODE[ord('W')] = CODE_WIN
+
+# Kod wyniku -> punkty (L=0, D=1, W=3)
+_CODE_TO_POINTS = np.array([0, 0, 1, 3], dtype=np.int16)
+
+_PAD = ' '
+_KNOWN_RESULTS = ('W', 'D', 'L')  # Tylko dokładne W/D/L (jak w analyze_form)
+
+
+def encode_results(sequences: Sequence[List[Dict]], limit: int) -> Dict[str, np.ndarray]:
+    """
+    Koduje sekwencje wyników jako macierz małych liczb całkowitych.
+
+    Args:
+        sequences: Listy meczów (słowniki z kluczem 'result'), najnowszy pierwszy
+        limit: Maksymalna liczba meczów na drużynę
+
+    Returns:
+        {'codes': int8 (n x limit), 'lengths': int16 (n,)}
+    """
+    n = len(sequences)
+    if n == 0 or limit <= 0:
+        return {
+            'codes': np.zeros((n, max(limit, 0)), dtype=np.int8),
+            'lengths': np.zeros(n, dtype=np.int16),
+        }
+
+    # Jeden bufor ASCII dla wszystkich drużyn zamiast pętli po meczach w numpy
+    rows = []
+    lengths = np.empty(n, dtype=np.int16)
+    for i, matches in enumerate(sequences):
+        window = matches[:limit]
+        lengths[i] = len(window)
+        row = ''.join([r if (r := m.get('result')) in _KNOWN_RESULTS else 'U' for m in window])
+        rows.append(row.ljust(limit, _PAD))
+
+    buffer = ''.join(rows).encode('ascii')
+    ascii_codes = np.frombuffer(buffer, dtype=np.uint8).reshape(n, limit)
+
+    return {'codes': _ASCII_TO_CODE[ascii_codes], 'lengths': lengths}
+
+
+def score_results(sequences: Sequence[List[Dict]], limit: int) -> Dict[str, np.ndarray]:
+    """
+    Liczy punkty, bilans W/D/L, średnie i trend formy dla wszystkich drużyn naraz.
+
+    Trend to różnica między średnią ważoną (nowsze mecze mają większą wagę,
+    liniowo: limit, limit-1, ...) a zwykłą średnią punktów - wartość dodatnia
+    oznacza poprawiającą się formę.
+
+    Args:
+        sequences: Listy meczów (słowniki z kluczem 'result'), najnowszy pierwszy
+        limit: Maksymalna liczba meczów na drużynę
+
+    Returns:
+        Słownik tablic numpy o długości len(sequences):
+        points, wins, draws, losses, matches, avg_points, weighted_avg_points, trend
+    """
+    encoded = encode_results(sequences, limit)
+    codes = encoded['codes']
+    lengths = encoded['lengths']
+
+    points_matrix = _CODE_TO_POINTS[codes]
+    points = points_matrix.sum(axis=1)
+    wins = (codes == CODE_WIN).sum(axis=1)
+    draws = (codes == CODE_DRAW).sum(axis=1)
+    losses = (codes == CODE_LOSS).sum(axis=1)
+
+    matches = lengths.astype(np.int64)
+    safe_matches = np.maximum(matches, 1)
+    avg_points = np.where(matches > 0, points / safe_matches, 0.0)
+
+    # Wagi recency: pozycja 0 (najnowszy mecz) ma wagę `limit`
+    positions = np.arange(codes.shape[1])
+    valid = positions[np.newaxis, :] < lengths[:, np.newaxis]
+    weights = (codes.shape[1] - positions)[np.newaxis, :] * valid
+    weight_sums = weights.sum(axis=1)
+    weighted_avg_points = np.where(
+        weight_sums > 0,
+        (points_matrix * weights).sum(axis=1) / np.maximum(weight_sums, 1),
+        0.0
+    )
+    trend = np.where(matches > 0, weighted_avg_points - avg_points, 0.0)
+
+    return {
+        'points': points,
+        'wins': wins,
+        'draws': draws,
+        'losses': losses,
+        'matches': matches,
+        'avg_points': avg_points,
+        'weighted_avg_points': weighted_avg_points,
+        'trend': trend,
+    }
+
+
+def as_lists(scores: Dict[str, np.ndarray], decimals: int = 2) -> Dict[str, list]:
+    """
+    Konwertuje wyniki score_results na listy Pythona (średnie zaokrąglone).
+
+    Args:
+        scores: Wynik score_results
+        decimals: Liczba miejsc po przecinku dla wartości zmiennoprzecinkowych
+
+    Returns:
+        Słownik list o tych samych kluczach
+    """
+    return {
+        key: (np.round(values, decimals) if values.dtype.kind == 'f' else values).tolist()
+        for key, values in scores.items()
+    }
+
+
+__all__ = ['encode_results', 'score_results', 'as_lists']
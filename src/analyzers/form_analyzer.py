@@ -1,9 +1,10 @@
 """
 Analyzer formy drużyn - analiza ostatnich wyników.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from ..config import Settings
 from ..data_management import get_logger
+from .batch_scoring import score_results, as_lists as _as_lists
 
 logger = get_logger(__name__)
 
@@ -23,17 +24,8 @@ class FormAnalyzer:
             Statystyki formy (punkty, W/D/L, trend)
         """
         if not recent_matches:
-            logger.debug(f"Brak danych formy dla {team}")
-            return {
-                'has_form': False, 
-                'points': 0, 
-                'matches_analyzed': 0,
-                'wins': 0,
-                'draws': 0,
-                'losses': 0,
-                'record': 'N/A',
-                'display': 'N/A (0 pkt)'
-            }
+            logger.debug("Brak danych formy dla %s", team)
+            return self._empty_form()
         
         points = 0
         wins = draws = losses = 0
@@ -56,7 +48,7 @@ class FormAnalyzer:
         matches_count = len(matches_to_check)
         avg_points = round(points / matches_count, 2) if matches_count > 0 else 0
         
-        logger.debug(f"Forma {team}: {wins}W-{draws}D-{losses}L = {points} pkt z {matches_count} meczów")
+        logger.debug("Forma %s: %dW-%dD-%dL = %d pkt z %d meczów", team, wins, draws, losses, points, matches_count)
         
         return {
             'has_form': True,
@@ -69,6 +61,70 @@ class FormAnalyzer:
             'record': f"{wins}W-{draws}D-{losses}L",
             'display': f"{wins}W-{draws}D-{losses}L ({points} pkt)"
         }
+    
+    def analyze_form_batch(
+        self,
+        teams: Sequence[Tuple[str, List[Dict]]],
+        scores: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analizuje formę wszystkich drużyn z przebiegu w jednym wektorowym przejściu.
+        
+        Args:
+            teams: Pary (nazwa drużyny, lista ostatnich meczów)
+            scores: Wynik score_results dla tych samych sekwencji (jeśli już policzony)
+        
+        Returns:
+            Statystyki formy w kolejności `teams` - te same klucze co analyze_form
+            oraz 'weighted_avg_points' i 'trend'
+        """
+        if scores is None:
+            scores = score_results([matches for _, matches in teams], Settings.MATCHES_TO_ANALYZE)
+        
+        # Jedna konwersja tablic numpy -> listy Pythona (bez indeksowania skalarów)
+        columns = _as_lists(scores)
+        
+        results = []
+        for i, (team, matches) in enumerate(teams):
+            if not matches:
+                results.append(self._empty_form())
+                continue
+            
+            points = columns['points'][i]
+            wins = columns['wins'][i]
+            draws = columns['draws'][i]
+            losses = columns['losses'][i]
+            
+            results.append({
+                'has_form': True,
+                'points': points,
+                'wins': wins,
+                'draws': draws,
+                'losses': losses,
+                'matches_analyzed': columns['matches'][i],
+                'avg_points': columns['avg_points'][i],
+                'weighted_avg_points': columns['weighted_avg_points'][i],
+                'trend': columns['trend'][i],
+                'record': f"{wins}W-{draws}D-{losses}L",
+                'display': f"{wins}W-{draws}D-{losses}L ({points} pkt)"
+            })
+        
+        logger.debug("Forma (batch): przeanalizowano %d drużyn", len(results))
+        return results
+    
+    @staticmethod
+    def _empty_form() -> Dict[str, Any]:
+        """Zwraca statystyki dla drużyny bez danych formy."""
+        return {
+            'has_form': False, 
+            'points': 0, 
+            'matches_analyzed': 0,
+            'wins': 0,
+            'draws': 0,
+            'losses': 0,
+            'record': 'N/A',
+            'display': 'N/A (0 pkt)'
+        }
 
 
 __all__ = ['FormAnalyzer']
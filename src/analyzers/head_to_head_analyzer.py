@@ -5,7 +5,6 @@ import re
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -13,7 +12,8 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..config import Settings
-from ..data_management import get_logger, cache_manager
+from ..data_management import get_logger, h2h_index, run_log
+from ..transport import create_session
 
 logger = get_logger(__name__)
 
@@ -29,11 +29,11 @@ class HeadToHeadAnalyzer:
             use_selenium: Czy używać Selenium
         """
         self.use_selenium = use_selenium
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': Settings.USER_AGENT})
+        self.session = create_session({'User-Agent': Settings.USER_AGENT})
         self.driver = None
     
-    def analyze_h2h(self, home_team: str, away_team: str, match_url: Optional[str] = None) -> Dict[str, Any]:
+    def analyze_h2h(self, home_team: str, away_team: str, match_url: Optional[str] = None,
+                    sport: str = 'football', refresh: bool = True) -> Dict[str, Any]:
         """
         Analizuje historię H2H między dwiema drużynami.
         
@@ -41,26 +41,34 @@ class HeadToHeadAnalyzer:
             home_team: Nazwa drużyny gospodarzy
             away_team: Nazwa drużyny gości
             match_url: URL do strony meczu na Forebet (jeśli dostępny)
+            sport: Sport
+            refresh: False = bez pobierania strony meczu, tylko indeks (np. przy zbliżającym się deadline)
         
         Returns:
             Słownik z analizą H2H
         """
-        logger.debug(f"Analiza H2H: {home_team} vs {away_team}")
-        
-        # Sprawdź cache
-        cache_key = f"h2h_{home_team}_{away_team}"
-        cached_h2h = cache_manager.load(cache_key)
-        
-        if cached_h2h:
-            logger.debug("✓ H2H znaleziono w cache")
-            return cached_h2h
+        logger.debug("Analiza H2H: %s vs %s", home_team, away_team)
         
         try:
-            # Pobierz historię meczów
-            h2h_matches = self._fetch_h2h_matches(home_team, away_team, match_url)
+            # Pobierz historię tylko gdy indeks pary jest nieaktualny
+            if refresh and match_url and h2h_index.needs_refresh(home_team, away_team, sport):
+                run_log.annotate(cache='miss')
+                fetched = self._fetch_h2h_matches(home_team, away_team, match_url)
+                
+                # None = błąd pobierania (nie zapisuj, spróbuj przy następnym przebiegu)
+                if fetched is not None:
+                    h2h_index.record_matches(home_team, away_team, fetched, sport)
+            else:
+                run_log.annotate(cache='hit')
+                logger.debug("✓ H2H z indeksu")
+            
+            # Statystyki dla dowolnej orientacji i okna liczone z indeksu
+            h2h_matches = h2h_index.get_matches(
+                home_team, away_team, sport, limit=Settings.H2H_MATCHES_TO_ANALYZE
+            )
             
             if not h2h_matches:
-                logger.warning(f"Brak historii H2H dla {home_team} vs {away_team}")
+                logger.warning("Brak historii H2H dla %s vs %s", home_team, away_team)
                 return {
                     'has_history': False,
                     'total_matches': 0,
@@ -72,13 +80,8 @@ class HeadToHeadAnalyzer:
                 }
             
             # Oblicz statystyki
-            stats = self._calculate_h2h_stats(h2h_matches, home_team)
-            
-            # Zapisz do cache (24h)
-            cache_manager.save(cache_key, stats, ttl=86400)
-            
-            return stats
-            
+            return self._calculate_h2h_stats(h2h_matches, home_team)
+        
         except Exception as e:
             logger.error(f"Błąd analizy H2H: {e}")
             return {
@@ -87,8 +90,8 @@ class HeadToHeadAnalyzer:
                 'error': str(e)
             }
     
-    def _fetch_h2h_matches(self, home_team: str, away_team: str, match_url: Optional[str]) -> List[Dict]:
-        """Pobiera historię meczów H2H."""
+    def _fetch_h2h_matches(self, home_team: str, away_team: str, match_url: Optional[str]) -> Optional[List[Dict]]:
+        """Pobiera historię meczów H2H (None jeśli pobieranie się nie powiodło)."""
         if match_url:
             # Pobierz z strony meczu na Forebet
             return self._fetch_h2h_from_match_page(match_url)
@@ -97,40 +100,44 @@ class HeadToHeadAnalyzer:
             logger.debug("Brak URL meczu - nie można pobrać H2H")
             return []
     
-    def _fetch_h2h_from_match_page(self, match_url: str) -> List[Dict]:
-        """Pobiera H2H ze strony szczegółów meczu."""
+    def _fetch_h2h_from_match_page(self, match_url: str) -> Optional[List[Dict]]:
+        """Pobiera pełną historię H2H ze strony szczegółów meczu (do indeksu)."""
         try:
             response = self.session.get(match_url, timeout=Settings.FOREBET_TIMEOUT)
             response.raise_for_status()
+            run_log.add_bytes(len(response.content))
             
             soup = BeautifulSoup(response.content, 'lxml')
-            
-            # Znajdź sekcję H2H (przykładowe selektory - trzeba dostosować do rzeczywistej struktury)
-            h2h_section = soup.find('div', class_=re.compile(r'h2h', re.IGNORECASE))
-            
-            if not h2h_section:
-                logger.debug("Nie znaleziono sekcji H2H na stronie")
-                return []
-            
-            matches = []
-            
-            # Parsuj mecze (trzeba dostosować do struktury Forebet)
-            match_rows = h2h_section.find_all('tr', class_=re.compile(r'match', re.IGNORECASE))
-            
-            for row in match_rows[:Settings.H2H_MATCHES_TO_ANALYZE]:
-                try:
-                    match_data = self._parse_h2h_match(row)
-                    if match_data:
-                        matches.append(match_data)
-                except Exception as e:
-                    logger.debug(f"Błąd parsowania meczu H2H: {e}")
-                    continue
-            
-            return matches
-            
+            return self._parse_h2h_page(soup)
+        
         except Exception as e:
             logger.error(f"Błąd pobierania H2H z {match_url}: {e}")
+            return None
+    
+    def _parse_h2h_page(self, soup: BeautifulSoup) -> List[Dict]:
+        """Parsuje historię H2H ze strony szczegółów meczu."""
+        # Znajdź sekcję H2H (przykładowe selektory - trzeba dostosować do rzeczywistej struktury)
+        h2h_section = soup.find('div', class_=re.compile(r'h2h', re.IGNORECASE))
+        
+        if not h2h_section:
+            logger.debug("Nie znaleziono sekcji H2H na stronie")
             return []
+        
+        matches = []
+        
+        # Parsuj mecze (trzeba dostosować do struktury Forebet)
+        match_rows = h2h_section.find_all('tr', class_=re.compile(r'match', re.IGNORECASE))
+        
+        for row in match_rows:
+            try:
+                match_data = self._parse_h2h_match(row)
+                if match_data:
+                    matches.append(match_data)
+            except Exception as e:
+                logger.debug("Błąd parsowania meczu H2H: %s", e)
+                continue
+        
+        return matches
     
     def _parse_h2h_match(self, row) -> Optional[Dict]:
         """Parsuje pojedynczy mecz H2H."""
@@ -149,9 +156,9 @@ class HeadToHeadAnalyzer:
                 'away_team': teams_elems[1].get_text(strip=True),
                 'score': score_elem.get_text(strip=True),
             }
-            
+        
         except Exception as e:
-            logger.debug(f"Błąd parsowania meczu: {e}")
+            logger.debug("Błąd parsowania meczu: %s", e)
             return None
     
     def _calculate_h2h_stats(self, matches: List[Dict], home_team: str) -> Dict[str, Any]:
@@ -212,7 +219,7 @@ class HeadToHeadAnalyzer:
                 return 'L' if is_home else 'W'
             else:
                 return 'D'
-                
+        
         except Exception:
             return 'U'
     
@@ -1,8 +1,9 @@
 """
 Analyzer statystyk u siebie/na wyjeździe.
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from ..data_management import get_logger
+from .batch_scoring import score_results, as_lists as _as_lists
 
 logger = get_logger(__name__)
 
@@ -10,6 +11,9 @@ logger = get_logger(__name__)
 class HomeAwayAnalyzer:
     """Analiza statystyk drużyn u siebie i na wyjeździe."""
     
+    # Maksymalna liczba ostatnich meczów branych pod uwagę
+    MATCHES_LIMIT = 6
+    
     def analyze_home_record(self, team: str, home_matches: List[Dict]) -> Dict[str, Any]:
         """
         Analizuje formę drużyny u siebie.
@@ -49,22 +53,13 @@ class HomeAwayAnalyzer:
             Statystyki meczów
         """
         if not matches:
-            logger.debug(f"Brak danych {venue} dla {team}")
-            return {
-                'has_record': False, 
-                'points': 0, 
-                'venue': venue,
-                'wins': 0,
-                'draws': 0,
-                'losses': 0,
-                'record': 'N/A',
-                'display': 'N/A (0 pkt)'
-            }
+            logger.debug("Brak danych %s dla %s", venue, team)
+            return self._empty_record(venue)
         
         points = wins = draws = losses = 0
         
         # Analizuj max 6 ostatnich meczów
-        matches_to_check = matches[:6]
+        matches_to_check = matches[:self.MATCHES_LIMIT]
         
         for match in matches_to_check:
             result = match.get('result', 'U')
@@ -81,7 +76,7 @@ class HomeAwayAnalyzer:
         matches_count = len(matches_to_check)
         venue_name = "u siebie" if venue == "home" else "na wyjeździe"
         
-        logger.debug(f"Forma {team} {venue_name}: {wins}W-{draws}D-{losses}L = {points} pkt z {matches_count} meczów")
+        logger.debug("Forma %s %s: %dW-%dD-%dL = %d pkt z %d meczów", team, venue_name, wins, draws, losses, points, matches_count)
         
         return {
             'has_record': True,
@@ -94,6 +89,72 @@ class HomeAwayAnalyzer:
             'record': f"{wins}W-{draws}D-{losses}L",
             'display': f"{wins}W-{draws}D-{losses}L ({points} pkt)"
         }
+    
+    def analyze_records_batch(
+        self,
+        teams: Sequence[Tuple[str, List[Dict]]],
+        venue: str,
+        scores: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analizuje mecze wielu drużyn (jedno miejsce rozgrywania) w jednym przejściu.
+        
+        Args:
+            teams: Pary (nazwa drużyny, lista meczów)
+            venue: "home" lub "away"
+            scores: Wynik score_results dla tych samych sekwencji (jeśli już policzony)
+        
+        Returns:
+            Statystyki w kolejności `teams` - te same klucze co _analyze_matches
+            oraz 'weighted_avg_points' i 'trend'
+        """
+        if scores is None:
+            scores = score_results([matches for _, matches in teams], self.MATCHES_LIMIT)
+        
+        # Jedna konwersja tablic numpy -> listy Pythona (bez indeksowania skalarów)
+        columns = _as_lists(scores)
+        
+        results = []
+        for i, (team, matches) in enumerate(teams):
+            if not matches:
+                results.append(self._empty_record(venue))
+                continue
+            
+            points = columns['points'][i]
+            wins = columns['wins'][i]
+            draws = columns['draws'][i]
+            losses = columns['losses'][i]
+            
+            results.append({
+                'has_record': True,
+                'venue': venue,
+                'points': points,
+                'wins': wins,
+                'draws': draws,
+                'losses': losses,
+                'matches_analyzed': columns['matches'][i],
+                'weighted_avg_points': columns['weighted_avg_points'][i],
+                'trend': columns['trend'][i],
+                'record': f"{wins}W-{draws}D-{losses}L",
+                'display': f"{wins}W-{draws}D-{losses}L ({points} pkt)"
+            })
+        
+        logger.debug("Forma %s (batch): przeanalizowano %d drużyn", venue, len(results))
+        return results
+    
+    @staticmethod
+    def _empty_record(venue: str) -> Dict[str, Any]:
+        """Zwraca statystyki dla drużyny bez danych home/away."""
+        return {
+            'has_record': False, 
+            'points': 0, 
+            'venue': venue,
+            'wins': 0,
+            'draws': 0,
+            'losses': 0,
+            'record': 'N/A',
+            'display': 'N/A (0 pkt)'
+        }
 
 
 __all__ = ['HomeAwayAnalyzer']
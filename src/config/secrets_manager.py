@@ -6,6 +6,8 @@ from pathlib import Path
 from typing import Optional
 from dotenv import load_dotenv
 
+from .settings import Settings
+
 
 class SecretsManager:
     """Zarządzanie sekretami i zmiennymi środowiskowymi."""
@@ -144,6 +146,11 @@ class SecretsManager:
         """Czas życia cache w sekundach."""
         return self.get_int("CACHE_DURATION", 3600)
     
+    @property
+    def run_time_budget(self) -> int:
+        """Budżet czasu przebiegu w sekundach (0 = bez limitu)."""
+        return self.get_int("RUN_TIME_BUDGET", Settings.RUN_TIME_BUDGET)
+    
     # Logging Configuration
     @property
     def log_level(self) -> str:
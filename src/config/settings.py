@@ -31,6 +31,12 @@ class Settings:
     # Forebet Configuration (używamy /pl bo Chrome automatycznie przekierowuje)
     FOREBET_BASE_URL = "https://www.forebet.com/pl"
     FOREBET_TIMEOUT = 30
+    
+    # Flashscore (wyszukiwarka meczów i feed kursów)
+    FLASHSCORE_BASE_URL = "https://www.flashscore.pl"
+    FLASHSCORE_FEED_URL = "https://d.flashscore.com/x/feed"
+    FLASHSCORE_TIMEOUT = 10
+    
     USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
     
     # Scraper Configuration
@@ -42,26 +48,87 @@ class Settings:
     # Cache Configuration
     CACHE_DURATION = 3600  # 1 godzina w sekundach
     
-    # Rate Limiting
-    REQUEST_DELAY = 2  # Opóźnienie między requestami (sekundy)
-    MAX_RETRIES = 3
-    RETRY_DELAY = 5  # Początkowe opóźnienie retry (exponential backoff)
+    # Historia drużyn (SQLite)
+    HISTORY_DB_PATH = CACHE_DIR / "history.sqlite3"
+    TEAM_HISTORY_MAX_AGE_DAYS = 7  # Wymuś odświeżenie formy po tylu dniach
+    H2H_INDEX_MAX_AGE_DAYS = 30  # Wymuś odświeżenie historii H2H pary po tylu dniach
+    
+    # Transport HTTP (record/replay/cache - src/transport)
+    TRANSPORT_MODE = "live"  # live | record | replay | cache
+    TRANSPORT_STORE_DIR = CACHE_DIR / "http"  # Magazyn odpowiedzi adresowany treścią
+    TRANSPORT_CACHE_TTL = 6 * 3600  # Ważność odpowiedzi w trybie cache (sekundy)
+    HTTP_CACHE = True  # Tryb live: rewalidacja ETag/Last-Modified i Cache-Control (src/transport/http_cache)
+    HTTP_CACHE_MAX_AGE = 7 * 24 * 3600  # Wpisy cache HTTP niezapisane dłużej usuwane przy starcie (0 = bez limitu)
+    HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024  # Limit treści magazynu - najstarsze wpisy cache usuwane (0 = bez limitu)
+    
+    # Równoległe pobieranie (src/transport/async_engine)
+    HTTP_MAX_CONNECTIONS = 16  # Zapytania w toku łącznie (rozmiar puli połączeń sesji)
+    HTTP_MAX_PER_HOST = 4  # Zapytania w toku do jednego hosta (forebet.com, flashscore)
+    FETCH_TASK_TIMEOUT = 0  # Limit czasu zadania silnika (s); 0 = z timeoutów zapytań/stron i MAX_RETRIES
+    
+    # Rate Limiting (token bucket per host - src/transport/rate_limiter)
+    RATE_LIMITS = {  # Zapytania na sekundę wg fragmentu nazwy hosta
+        "forebet.com": 2.0,
+        "flashscore": 5.0,
+    }
+    RATE_LIMIT_DEFAULT = 50.0  # Pozostałe hosty (np. lokalny mock)
+    RATE_LIMIT_MIN = 0.2  # Dolna granica tempa po obniżeniach na 429/503
+    MAX_RETRIES = 3  # Próby jednego zapytania/strony przy błędach przejściowych (src/transport/retry_policy)
+    RETRY_DELAY = 1.0  # Bazowe opóźnienie: losowo 0..min(RETRY_MAX_DELAY, RETRY_DELAY * 2^próba)
+    RETRY_MAX_DELAY = 10.0  # Górna granica opóźnienia ponowienia (sekundy)
+    RETRY_BUDGET_RUN = 100  # Ponowienia w całym przebiegu
+    RETRY_BUDGET_HOST = 40  # Ponowienia na host (grupy hostów jak w RATE_LIMITS)
+    BREAKER_FAILURE_THRESHOLD = 5  # Kolejne błędy hosta otwierające circuit breaker (src/transport/circuit_breaker)
+    BREAKER_COOLDOWN = 120  # Sekundy otwartego breakera przed zapytaniem próbnym
+    
+    # Deadline przebiegu (src/scheduling/deadline)
+    RUN_TIME_BUDGET = 45 * 60  # Budżet czasu przebiegu w sekundach (0 = bez limitu; env RUN_TIME_BUDGET)
+    DEADLINE_RESERVE = 180  # Sekundy zostawiane na wysyłkę powiadomień i podsumowanie
+    DEADLINE_SKIP_INPUTS = {  # Pominięcie danych, gdy do deadline (ponad rezerwę) zostaje mniej sekund
+        "form": 900,
+        "h2h": 600,
+        "odds": 300,
+    }
     
     # Browser Configuration (Selenium)
     HEADLESS_BROWSER = True
     BROWSER_TIMEOUT = 30
     IMPLICIT_WAIT = 10
     PAGE_LOAD_TIMEOUT = 30
+    BROWSER_LEAN_PROFILE = True  # Eager load, bez obrazów/fontów/reklam (src/scrapers/browser_profile)
+    BROWSER_BLOCKED_URLS = [  # Wzorce CDP Network.setBlockedURLs dla lekkiego profilu
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf", "*.mp4", "*.webm", "*.mp3",
+        "*googletagmanager.com*", "*google-analytics.com*", "*doubleclick.net*", "*googlesyndication.com*",
+        "*adservice.google*", "*facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*criteo.*",
+        "*taboola.com*", "*outbrain.com*", "*scorecardresearch.com*", "*quantserve.com*", "*amazon-adsystem.com*",
+    ]
+    BROWSER_MAX_PAGES = 150  # Restart przeglądarki po tylu stronach (0 = bez limitu)
+    BROWSER_MAX_RSS_MB = 1500  # Restart gdy RSS Chrome (chromedriver + procesy potomne) przekroczy (0 = bez limitu)
+    READINESS_TIMEOUT = 15  # Maksymalne oczekiwanie na gotowość strony (src/scrapers/page_readiness)
+    READINESS_POLL = 0.1  # Odstęp odpytań warunku gotowości (sekundy)
+    READINESS_STABLE_POLLS = 3  # Ile kolejnych odpytań liczba wierszy/sekcji musi się nie zmieniać
+    READINESS_IDLE_SECONDS = 0.5  # Bezczynność sieci uznawana za koniec ładowania
+    LISTING_SOURCE = "auto"  # dom | xhr (tylko JSON z XHR) | auto (JSON z XHR, DOM jako fallback)
+    XHR_ENDPOINT_TTL = 2 * 24 * 3600  # Ważność odkrytych endpointów XHR listingów (sekundy; dzienny przebieg + zapas)
     
     # Email Configuration
     SMTP_SERVER = "smtp.gmail.com"
     SMTP_PORT = 587
     USE_TLS = True
+    SMTP_TIMEOUT = 30
+    SMTP_MAX_RECONNECTS = 2  # Ponowne połączenia w obrębie jednej wysyłki
+    EMAIL_MAX_RETRIES = 3  # Ponowienia wysyłki emaila w kolejce powiadomień
+    EMAIL_RETRY_DELAY = 5  # Początkowe opóźnienie ponowienia (exponential backoff)
+    EMAIL_FLUSH_TIMEOUT = 300  # Maksymalne oczekiwanie na opróżnienie kolejki powiadomień (s)
     
     # Logging Configuration
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+    RUN_LOG_PATH = LOGS_DIR / "run_log.jsonl"  # Strukturalny dziennik etapów (JSON lines)
+    METRICS_TEXTFILE_PATH = LOGS_DIR / "forebet_scraper.prom"  # Metryki dla textfile collectora
+    LOG_SAMPLE_EVERY = 1  # Co który wiersz/zdarzenie logować na DEBUG w gorących pętlach (1 = każdy)
     
     # Wspierane sporty (priorytet)
     SUPPORTED_SPORTS: List[Sport] = [
@@ -93,6 +160,19 @@ class Settings:
             raise ValueError(f"Nieobsługiwany sport: {sport}")
         return f"{cls.FOREBET_BASE_URL}/{pattern}"
     
+    @classmethod
+    def override_endpoints(cls, base_url: str):
+        """
+        Kieruje wszystkie zapytania Forebet i Flashscore na jeden serwer (np. lokalny mock).
+        
+        Args:
+            base_url: Adres serwera, np. "http://127.0.0.1:8765"
+        """
+        base_url = base_url.rstrip('/')
+        cls.FOREBET_BASE_URL = f"{base_url}/pl"
+        cls.FLASHSCORE_BASE_URL = base_url
+        cls.FLASHSCORE_FEED_URL = f"{base_url}/x/feed"
+    
     @classmethod
     def ensure_directories(cls):
         """Tworzy wymagane katalogi jeśli nie istnieją."""
@@ -1,5 +1,15 @@
 """Inicjalizacja modułu data_management."""
-from .logger import Logger, get_logger
+from .logger import Logger, HotPathLogger, get_logger, get_hot_logger
 from .cache_manager import CacheManager, cache_manager
+from .team_history_store import TeamHistoryStore, team_history_store
+from .h2h_index import H2HIndex, h2h_index
+from .run_log import RunLog, run_log
+from .metrics import MetricsRegistry, metrics
+from .profiler import RunProfiler, run_profiler
 
-__all__ = ["Logger", "get_logger", "CacheManager", "cache_manager"]
+__all__ = [
+    "Logger", "HotPathLogger", "get_logger", "get_hot_logger", "CacheManager", "cache_manager",
+    "TeamHistoryStore", "team_history_store", "H2HIndex", "h2h_index",
+    "RunLog", "run_log", "MetricsRegistry", "metrics",
+    "RunProfiler", "run_profiler",
+]
@@ -9,9 +9,13 @@ from datetime import datetime, timedelta
 
 from ..config import Settings
 from .logger import get_logger
+from .metrics import metrics
 
 logger = get_logger(__name__)
 
+_lookups = metrics.counter("cache_lookups_total", "Odczyty cache wg wyniku (hit/miss/expired/error)", ["result"])
+_saves = metrics.counter("cache_saves_total", "Zapisy cache wg wyniku (ok/error)", ["result"])
+
 
 class CacheManager:
     """Zarządzanie cache'em danych w plikach JSON."""
@@ -60,10 +64,12 @@ class CacheManager:
                 json.dump(cache_data, f, ensure_ascii=False, indent=2)
             
             logger.debug(f"Cache saved: {key} (TTL: {ttl}s)")
+            _saves.inc(result='ok')
             return True
             
         except Exception as e:
             logger.error(f"Błąd zapisywania cache '{key}': {e}")
+            _saves.inc(result='error')
             return False
     
     def load(self, key: str) -> Optional[Any]:
@@ -81,6 +87,7 @@ class CacheManager:
             
             if not cache_file.exists():
                 logger.debug(f"Cache miss: {key} (plik nie istnieje)")
+                _lookups.inc(result='miss')
                 return None
             
             with open(cache_file, 'r', encoding='utf-8') as f:
@@ -89,14 +96,17 @@ class CacheManager:
             # Sprawdź czy cache wygasł
             if time.time() > cache_data.get("expires_at", 0):
                 logger.debug(f"Cache expired: {key}")
+                _lookups.inc(result='expired')
                 self.delete(key)
                 return None
             
             logger.debug(f"Cache hit: {key}")
+            _lookups.inc(result='hit')
             return cache_data.get("data")
             
         except Exception as e:
             logger.error(f"Błąd wczytywania cache '{key}': {e}")
+            _lookups.inc(result='error')
             return None
     
     def delete(self, key: str) -> bool:
@@ -0,0 +1,198 @@
+"""
+Indeks historii H2H (SQLite) - pojedyncze mecze zapisane raz na parę drużyn.
+"""
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional
+
+from ..config import Settings
+from .history_db import SQLiteStore
+from .logger import get_logger
+from .team_history_store import event_date, team_key
+
+logger = get_logger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS h2h_pairs (
+    pair_key TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    PRIMARY KEY (pair_key, sport)
+);
+CREATE TABLE IF NOT EXISTS h2h_fixtures (
+    pair_key TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    match_date TEXT,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    score TEXT NOT NULL,
+    PRIMARY KEY (pair_key, sport, position)
+);
+CREATE TABLE IF NOT EXISTS h2h_meetings (
+    pair_key TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    fixture_date TEXT NOT NULL,
+    PRIMARY KEY (pair_key, sport, fixture_date)
+);
+"""
+
+
+def pair_key(team_a: str, team_b: str) -> str:
+    """Klucz pary drużyn niezależny od kolejności (A-B == B-A)."""
+    return "|".join(sorted((team_key(team_a), team_key(team_b))))
+
+
+class H2HIndex(SQLiteStore):
+    """
+    Indeks bezpośrednich spotkań drużyn.
+    
+    Każdy historyczny mecz pary jest zapisany raz (klucz pary bez kolejności),
+    a statystyki dla dowolnej orientacji i rozmiaru okna liczy się z indeksu.
+    Historia pary jest pobierana ponownie tylko gdy drużyny zagrały ze sobą
+    od ostatniego pobrania lub minęło H2H_INDEX_MAX_AGE_DAYS.
+    """
+    
+    SCHEMA = _SCHEMA
+    
+    def record_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Zapisuje spotkania par z listy zdarzeń (data = dzień scrapowania).
+        
+        Args:
+            events: Zdarzenia z ForebtScraper.fetch_events_by_sport
+        
+        Returns:
+            Liczba zapisanych wierszy
+        """
+        rows = []
+        for event in events:
+            home_team = event.get('home_team', '')
+            away_team = event.get('away_team', '')
+            if not home_team or not away_team:
+                continue
+            
+            fixture_date = event_date(event)
+            rows.append((pair_key(home_team, away_team), event.get('sport', 'football'), fixture_date.isoformat()))
+        
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO h2h_meetings (pair_key, sport, fixture_date) VALUES (?, ?, ?)",
+                    rows
+                )
+        
+        return len(rows)
+    
+    def needs_refresh(self, team_a: str, team_b: str, sport: str = 'football',
+                      today: Optional[date] = None) -> bool:
+        """
+        Sprawdza czy historia pary wymaga pobrania strony meczu.
+        
+        Args:
+            team_a: Pierwsza drużyna
+            team_b: Druga drużyna
+            sport: Sport
+            today: Dzisiejsza data (domyślnie date.today())
+        
+        Returns:
+            True jeśli brak historii, jest za stara lub para grała od pobrania
+        """
+        today = today or date.today()
+        key = pair_key(team_a, team_b)
+        
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT fetched_at FROM h2h_pairs WHERE pair_key = ? AND sport = ?", (key, sport)
+            ).fetchone()
+            
+            if not row:
+                return True
+            
+            fetched = datetime.fromisoformat(row[0]).date()
+            if (today - fetched).days > Settings.H2H_INDEX_MAX_AGE_DAYS:
+                return True
+            
+            played = conn.execute(
+                "SELECT 1 FROM h2h_meetings WHERE pair_key = ? AND sport = ? "
+                "AND fixture_date >= ? AND fixture_date < ? LIMIT 1",
+                (key, sport, fetched.isoformat(), today.isoformat())
+            ).fetchone()
+        
+        return played is not None
+    
+    def record_matches(self, team_a: str, team_b: str, matches: List[Dict[str, Any]],
+                       sport: str = 'football') -> int:
+        """
+        Zapisuje pełną historię H2H pary (najnowszy mecz pierwszy).
+        
+        Pusta lista też jest zapisywana - para bez historii nie jest pobierana ponownie
+        do następnego spotkania.
+        
+        Args:
+            team_a: Pierwsza drużyna
+            team_b: Druga drużyna
+            matches: Mecze z HeadToHeadAnalyzer._parse_h2h_match
+            sport: Sport
+        
+        Returns:
+            Liczba zapisanych meczów
+        """
+        key = pair_key(team_a, team_b)
+        rows = [
+            (key, sport, position, match.get('date'), match.get('home_team', ''),
+             match.get('away_team', ''), match.get('score', ''))
+            for position, match in enumerate(matches)
+        ]
+        
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM h2h_fixtures WHERE pair_key = ? AND sport = ?", (key, sport))
+                conn.executemany(
+                    "INSERT INTO h2h_fixtures (pair_key, sport, position, match_date, home_team, away_team, score) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO h2h_pairs (pair_key, sport, fetched_at) VALUES (?, ?, ?)",
+                    (key, sport, datetime.now().isoformat())
+                )
+        
+        logger.debug("Indeks H2H zapisany: %s (%s) - %d meczów", key, sport, len(rows))
+        return len(rows)
+    
+    def get_matches(self, team_a: str, team_b: str, sport: str = 'football',
+                    limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Zwraca historyczne mecze pary (dowolna kolejność drużyn).
+        
+        Args:
+            team_a: Pierwsza drużyna
+            team_b: Druga drużyna
+            sport: Sport
+            limit: Rozmiar okna (domyślnie wszystkie mecze)
+        
+        Returns:
+            Lista meczów w formacie _parse_h2h_match (najnowszy pierwszy)
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT match_date, home_team, away_team, score FROM h2h_fixtures "
+                "WHERE pair_key = ? AND sport = ? ORDER BY position LIMIT ?",
+                (pair_key(team_a, team_b), sport, limit if limit is not None else -1)
+            ).fetchall()
+        
+        return [
+            {'date': match_date, 'home_team': home_team, 'away_team': away_team, 'score': score}
+            for match_date, home_team, away_team, score in rows
+        ]
+
+
+# Globalny singleton
+h2h_index = H2HIndex()
+
+
+__all__ = ['H2HIndex', 'h2h_index', 'pair_key']
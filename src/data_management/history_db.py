@@ -0,0 +1,83 @@
+"""
+Wspólne połączenie SQLite dla magazynów historii (forma drużyn, indeks H2H).
+"""
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from ..config import Settings
+
+
+class _SharedConnection:
+    """Jedno połączenie na plik bazy, z blokadą wspólną dla wszystkich magazynów."""
+    
+    def __init__(self):
+        self.conn: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        self.schemas: Set[str] = set()
+
+
+_connections: Dict[str, _SharedConnection] = {}
+_registry_lock = threading.Lock()
+
+
+def _shared_connection(db_path: Path) -> _SharedConnection:
+    """Zwraca wspólne połączenie dla pliku bazy (tworzy wpis przy pierwszym użyciu)."""
+    key = str(Path(db_path).resolve())
+    with _registry_lock:
+        if key not in _connections:
+            _connections[key] = _SharedConnection()
+        return _connections[key]
+
+
+class SQLiteStore:
+    """
+    Bazowa klasa magazynu SQLite.
+    
+    Magazyny wskazujące ten sam plik bazy współdzielą jedno połączenie
+    (check_same_thread=False) i jedną blokadę; schemat podklasy (SCHEMA)
+    jest tworzony leniwie przy pierwszym połączeniu.
+    """
+    
+    SCHEMA = ""
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        """
+        Inicjalizacja magazynu.
+        
+        Args:
+            db_path: Ścieżka do bazy SQLite (domyślnie Settings.HISTORY_DB_PATH)
+        """
+        self.db_path = db_path or Settings.HISTORY_DB_PATH
+        self._shared = _shared_connection(self.db_path)
+    
+    @property
+    def _lock(self) -> threading.Lock:
+        """Blokada wspólna dla wszystkich magazynów tej bazy."""
+        return self._shared.lock
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Otwiera połączenie (leniwie) i tworzy schemat (wywoływać pod blokadą)."""
+        shared = self._shared
+        if shared.conn is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            shared.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            shared.schemas.clear()
+        
+        if self.SCHEMA not in shared.schemas:
+            shared.conn.executescript(self.SCHEMA)
+            shared.schemas.add(self.SCHEMA)
+        
+        return shared.conn
+    
+    def close(self) -> None:
+        """Zamyka wspólne połączenie z bazą (kolejne użycie otworzy je ponownie)."""
+        with self._lock:
+            if self._shared.conn is not None:
+                self._shared.conn.close()
+                self._shared.conn = None
+                self._shared.schemas.clear()
+
+
+__all__ = ['SQLiteStore']
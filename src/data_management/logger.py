@@ -1,11 +1,18 @@
 """
 Moduł logowania z kolorowymi logami i rotacją plików.
+
+Wszystkie loggery piszą przez jeden QueueHandler - wątki robocze tylko wkładają
+rekord do kolejki, a jeden QueueListener w tle zapisuje go do wspólnych
+handlerów (konsola, plik, plik błędów).
 """
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 try:
     import colorlog
@@ -16,11 +23,41 @@ except ImportError:
 from ..config import Settings
 
 
+class _SharedQueueHandler(QueueHandler):
+    """
+    QueueHandler współdzielony przez wszystkie loggery.
+    
+    Po zatrzymaniu listenera (Logger.shutdown) zapisuje rekordy bezpośrednio
+    do sinków, zamiast wkładać je do kolejki, której nikt już nie czyta.
+    """
+    
+    def __init__(self, log_queue: queue.SimpleQueue):
+        super().__init__(log_queue)
+        self.direct_sinks: List[logging.Handler] = []
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Kolejkuje rekord lub (bez listenera) zapisuje go synchronicznie."""
+        sinks = self.direct_sinks
+        if not sinks:
+            super().emit(record)
+            return
+        
+        for sink in sinks:
+            if record.levelno >= sink.level:
+                sink.handle(record)
+
+
 class Logger:
     """Zarządzanie logowaniem aplikacji."""
     
     _loggers = {}
     
+    # Wspólne sinki i kolejka (tworzone raz na proces)
+    _queue: Optional[queue.SimpleQueue] = None
+    _queue_handler: Optional["_SharedQueueHandler"] = None
+    _listener: Optional[QueueListener] = None
+    _lock = threading.RLock()
+    
     @classmethod
     def get_logger(cls, name: str, log_level: Optional[str] = None) -> logging.Logger:
         """
@@ -48,13 +85,81 @@ class Logger:
         # Usuń istniejące handlery
         logger.handlers.clear()
         
-        # Dodaj handlery
-        logger.addHandler(cls._get_console_handler())
-        logger.addHandler(cls._get_file_handler())
+        # Jeden współdzielony handler kolejki zamiast własnych sinków
+        logger.addHandler(cls.get_queue_handler())
         
         cls._loggers[name] = logger
         return logger
     
+    @classmethod
+    def get_queue_handler(cls) -> QueueHandler:
+        """
+        Zwraca współdzielony QueueHandler (przy pierwszym wywołaniu startuje listener).
+        
+        Returns:
+            Handler wkładający rekordy do wspólnej kolejki
+        """
+        with cls._lock:
+            if cls._queue_handler is None:
+                cls._queue = queue.SimpleQueue()
+                cls._queue_handler = _SharedQueueHandler(cls._queue)
+                cls._start_listener()
+                atexit.register(cls.shutdown)
+            
+            return cls._queue_handler
+    
+    @classmethod
+    def _start_listener(cls):
+        """Startuje listener kolejki z nowymi sinkami."""
+        cls._listener = QueueListener(cls._queue, *cls._create_sinks(), respect_handler_level=True)
+        cls._listener.start()
+        cls._queue_handler.direct_sinks = []
+    
+    @classmethod
+    def _create_sinks(cls) -> List[logging.Handler]:
+        """Tworzy wspólne sinki: konsola, plik i plik błędów."""
+        return [
+            cls._get_console_handler(),
+            cls._get_file_handler(),
+            cls._get_error_file_handler(),
+        ]
+    
+    @classmethod
+    def restart(cls):
+        """
+        Uruchamia listener z nowymi sinkami (np. po zmianie Settings.LOGS_DIR).
+        
+        Loggery zachowują swój handler kolejki - zmieniają się tylko sinki.
+        """
+        with cls._lock:
+            if cls._queue_handler is None:
+                cls.get_queue_handler()
+                return
+            
+            cls.shutdown()
+            cls._start_listener()
+    
+    @classmethod
+    def shutdown(cls):
+        """
+        Zapisuje zaległe rekordy z kolejki, zatrzymuje listener i zamyka pliki.
+        
+        Rekordy zalogowane później (np. z innych handlerów atexit) nie giną -
+        handler kolejki zapisuje je wtedy synchronicznie do tych samych sinków.
+        """
+        with cls._lock:
+            listener = cls._listener
+            cls._listener = None
+            
+            if listener is None:
+                return
+            
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()  # Pliki otwierane ponownie przy kolejnym zapisie
+            
+            cls._queue_handler.direct_sinks = list(listener.handlers)
+    
     @staticmethod
     def _get_console_handler() -> logging.Handler:
         """Tworzy handler dla konsoli z kolorowaniem."""
@@ -95,7 +200,8 @@ class Logger:
             log_file,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # Plik otwierany przy pierwszym zapisie
         )
         
         formatter = logging.Formatter(
@@ -116,7 +222,8 @@ class Logger:
             error_log_file,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
-            encoding='utf-8'
+            encoding='utf-8',
+            delay=True  # Plik otwierany przy pierwszym zapisie
         )
         
         error_handler.setLevel(logging.ERROR)
@@ -136,10 +243,50 @@ class Logger:
         root_logger.setLevel(logging.DEBUG)
         root_logger.handlers.clear()
         
-        # Dodaj handlery
-        root_logger.addHandler(cls._get_console_handler())
-        root_logger.addHandler(cls._get_file_handler())
-        root_logger.addHandler(cls._get_error_file_handler())
+        # Ten sam handler kolejki co w loggerach modułów
+        root_logger.addHandler(cls.get_queue_handler())
+
+
+class HotPathLogger:
+    """
+    Logger dla gorących pętli (wiersz po wierszu, zdarzenie po zdarzeniu).
+    
+    Komunikaty w stylu %-formatowania są składane dopiero gdy poziom jest
+    włączony, a logi per-wiersz mogą być próbkowane (co N-ty wiersz).
+    Przy większych argumentach sprawdź enabled() raz przed pętlą.
+    """
+    
+    def __init__(self, logger: logging.Logger, sample_every: Optional[int] = None):
+        """
+        Inicjalizacja.
+        
+        Args:
+            logger: Logger docelowy
+            sample_every: Co który wiersz logować (domyślnie Settings.LOG_SAMPLE_EVERY)
+        """
+        self.logger = logger
+        self.sample_every = max(1, sample_every or Settings.LOG_SAMPLE_EVERY)
+    
+    def enabled(self, level: int = logging.DEBUG) -> bool:
+        """Czy poziom jest włączony (sprawdzenie do wyniesienia przed pętlę)."""
+        return self.logger.isEnabledFor(level)
+    
+    def debug(self, msg: str, *args) -> None:
+        """Log DEBUG z leniwym formatowaniem."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, stacklevel=2)
+    
+    def sampled(self, index: int, msg: str, *args) -> None:
+        """
+        Log DEBUG dla wiersza pętli - tylko co sample_every-ty wiersz.
+        
+        Args:
+            index: Numer wiersza (od 1, pierwszy zawsze logowany)
+            msg: Komunikat w stylu %-formatowania
+            *args: Argumenty komunikatu
+        """
+        if (index - 1) % self.sample_every == 0 and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(msg, *args, stacklevel=2)
 
 
 # Helper function dla szybkiego dostępu
@@ -153,3 +300,17 @@ def get_logger(name: str) -> logging.Logger:
         logger.info("Wiadomość")
     """
     return Logger.get_logger(name)
+
+
+def get_hot_logger(name: str, sample_every: Optional[int] = None) -> HotPathLogger:
+    """
+    Skrót do pobierania loggera gorących pętli.
+    
+    Usage:
+        hot_logger = get_hot_logger(__name__)
+        debug_rows = hot_logger.enabled()
+        for i, row in enumerate(rows, 1):
+            if debug_rows:
+                hot_logger.sampled(i, "wiersz %d: %s", i, row)
+    """
+    return HotPathLogger(Logger.get_logger(name), sample_every)
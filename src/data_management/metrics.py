@@ -0,0 +1,247 @@
+"""
+Rejestr metryk (liczniki, gauge, histogramy) zapisywany w formacie textfile Prometheusa.
+
+Plik jest zapisywany raz na koniec przebiegu i zbierany przez textfile collector
+node-exportera - bez serwera HTTP i bez zależności od prometheus_client.
+"""
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..config import Settings
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+LabelValues = Tuple[str, ...]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _escape(value: str) -> str:
+    """Escapowanie wartości etykiety (\\, " i nowa linia)."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    """Wartość liczbowa w formacie Prometheusa."""
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Etykiety {a="1",b="2"} (pusty string bez etykiet)."""
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Metric:
+    """Wspólna część metryk: nazwa, opis, etykiety i blokada."""
+    
+    TYPE = ""
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+    
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """Wartości etykiet w kolejności labelnames."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metryka {self.name} wymaga etykiet {self.labelnames}, podano {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+    
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+    
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Licznik rosnący monotonicznie."""
+    
+    TYPE = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Zwiększa licznik (amount >= 0)."""
+        if amount < 0:
+            raise ValueError("Licznik nie może maleć")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels: str) -> float:
+        """Bieżąca wartość licznika."""
+        return self._values.get(self._key(labels), 0)
+    
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Gauge(Counter):
+    """Wartość chwilowa (może rosnąć i maleć)."""
+    
+    TYPE = "gauge"
+    
+    def set(self, value: float, **labels: str) -> None:
+        """Ustawia wartość."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Zwiększa (lub przy ujemnym amount zmniejsza) wartość."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Histogram(_Metric):
+    """Histogram z kumulatywnymi kubełkami, sumą i liczbą obserwacji."""
+    
+    TYPE = "histogram"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+    
+    def observe(self, value: float, **labels: str) -> None:
+        """Dodaje obserwację."""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self.buckets))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            self._sums[key] = self._sums.get(key, 0.0) + value
+    
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Mierzy czas bloku (sekundy) i zapisuje jako obserwację."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+    
+    def count(self, **labels: str) -> int:
+        """Liczba obserwacji."""
+        counts = self._counts.get(self._key(labels))
+        return counts[-1] if counts else 0
+    
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            items = sorted(self._counts.items())
+            sums = dict(self._sums)
+        
+        bucket_names = self.labelnames + ('le',)
+        for key, counts in items:
+            for bound, count in zip(self.buckets, counts):
+                labels = _format_labels(bucket_names, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(sums[key])}")
+            lines.append(f"{self.name}_count{labels} {counts[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Rejestr metryk przebiegu (get-or-create po nazwie)."""
+    
+    def __init__(self, namespace: str = "forebet"):
+        """
+        Inicjalizacja rejestru.
+        
+        Args:
+            namespace: Prefiks nazw metryk
+        """
+        self.namespace = namespace
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+    
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs):
+        full_name = f"{self.namespace}_{name}" if self.namespace else name
+        with self._lock:
+            metric = self._metrics.get(full_name)
+            if metric is None:
+                metric = cls(full_name, documentation, labelnames, **kwargs)
+                self._metrics[full_name] = metric
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metryka {full_name} jest już zarejestrowana z innym typem/etykietami")
+            return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Zwraca (lub rejestruje) licznik."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+    
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Zwraca (lub rejestruje) gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+    
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Zwraca (lub rejestruje) histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def render(self) -> str:
+        """Wszystkie metryki w formacie tekstowym Prometheusa."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+    
+    def write_textfile(self, path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Zapisuje metryki atomowo (plik tymczasowy + rename), jak wymaga textfile collector.
+        
+        Args:
+            path: Plik docelowy (domyślnie Settings.METRICS_TEXTFILE_PATH)
+        
+        Returns:
+            Ścieżka zapisanego pliku lub None przy błędzie
+        """
+        path = Path(path or Settings.METRICS_TEXTFILE_PATH)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(self.render(), encoding='utf-8')
+            os.replace(tmp_path, path)
+            logger.info(f"📈 Metryki zapisane: {path}")
+            return path
+        except OSError as e:
+            logger.error(f"Błąd zapisu metryk: {e}")
+            return None
+
+
+# Globalny singleton
+metrics = MetricsRegistry()
+
+
+__all__ = ['Counter', 'Gauge', 'Histogram', 'MetricsRegistry', 'metrics']
@@ -0,0 +1,216 @@
+"""
+Profilowanie przebiegu (main.py --profile): cProfile, czas ściany vs CPU i szczyt pamięci per etap.
+"""
+import cProfile
+import io
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config import Settings
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class RunProfiler:
+    """
+    Profiler przebiegu podpięty pod etapy RunLog.
+    
+    Dla każdego etapu (listing, parse, h2h, form, odds, ...) mierzy czas ściany,
+    czas CPU wątku (różnica = czekanie na sieć, Selenium, sleep) i szczyt pamięci
+    z tracemalloc. Cały przebieg jest dodatkowo profilowany przez cProfile - także
+    wątki uruchomione po start() (pula fetch_engine, wysyłka emaili w tle): do 3.11
+    osobny profil na wątek (threading.setprofile), scalany w stop(); od 3.12
+    cProfile (sys.monitoring) obejmuje wszystkie wątki.
+    
+    tracemalloc ma jeden licznik szczytu na proces, więc dokładny szczyt
+    (mem_peak_kb) jest mierzony tylko dla etapów bez równoległych etapów w innych
+    wątkach; etapy nakładające się dostają szczyt procesu (mem_peak_process_kb).
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self._profile: Optional[cProfile.Profile] = None
+        self._thread_profiles: List[cProfile.Profile] = []
+        self._started_at = 0.0
+        self._cpu_started_at = 0.0
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._open: Dict[int, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    def start(self) -> None:
+        """Włącza profilowanie (cProfile + tracemalloc)."""
+        if self.enabled:
+            return
+        
+        self._stats.clear()
+        self._thread_profiles = []
+        tracemalloc.start()
+        self._profile = cProfile.Profile()
+        self._started_at = time.perf_counter()
+        self._cpu_started_at = time.process_time()
+        self.enabled = True
+        if sys.version_info < (3, 12):
+            threading.setprofile(self._profile_thread)
+        self._profile.enable()
+        logger.info("🔬 Profilowanie włączone (cProfile + tracemalloc)")
+    
+    def _profile_thread(self, frame, event, arg) -> None:
+        """Hook startu nowego wątku - zastępuje się własnym profilem cProfile wątku."""
+        sys.setprofile(None)
+        if not self.enabled:
+            return
+        profile = cProfile.Profile()
+        with self._lock:
+            self._thread_profiles.append(profile)
+        profile.enable()
+    
+    def enter(self) -> Tuple[float, float, Dict[str, Any]]:
+        """Początek etapu - zwraca token dla exit()."""
+        stack = self._stack()
+        entry = {'peak': 0, 'overlap': False}
+        with self._lock:
+            others = [other for ident, entries in self._open.items()
+                      if ident != threading.get_ident() for other in entries]
+            if others:
+                # Etap równoległy z innym wątkiem - licznika szczytu nie wolno zerować
+                for open_entry in others + stack + [entry]:
+                    open_entry['overlap'] = True
+            else:
+                # Szczyt etapów nadrzędnych zapamiętany przed wyzerowaniem licznika
+                current = tracemalloc.get_traced_memory()[1]
+                for parent in stack:
+                    parent['peak'] = max(parent['peak'], current)
+                tracemalloc.reset_peak()
+            stack.append(entry)
+            self._open[threading.get_ident()] = stack
+        return time.perf_counter(), time.thread_time(), entry
+    
+    def exit(self, token: Tuple[float, float, Dict[str, Any]], record: Dict[str, Any]) -> None:
+        """Koniec etapu - dopisuje czasy i pamięć do rekordu i statystyk."""
+        wall_start, cpu_start, entry = token
+        wall = time.perf_counter() - wall_start
+        cpu = time.thread_time() - cpu_start
+        
+        stack = self._stack()
+        with self._lock:
+            if stack and stack[-1] is entry:
+                stack.pop()
+            peak = max(entry['peak'], tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+            else:
+                self._open.pop(threading.get_ident(), None)
+            
+            stats = self._stats.setdefault(record['stage'], {'count': 0, 'wall': 0.0, 'cpu': 0.0, 'peak': 0,
+                                                             'process_peak': 0})
+            stats['count'] += 1
+            stats['wall'] += wall
+            stats['cpu'] += cpu
+            stats['process_peak' if entry['overlap'] else 'peak'] = max(
+                stats['process_peak' if entry['overlap'] else 'peak'], peak)
+        
+        record['cpu_ms'] = round(cpu * 1000, 2)
+        record['mem_peak_process_kb' if entry['overlap'] else 'mem_peak_kb'] = round(peak / 1024, 1)
+    
+    def _stack(self) -> List[Dict[str, Any]]:
+        """Stos otwartych etapów wątku (szczyt pamięci, nakładanie z innymi wątkami)."""
+        if not hasattr(self._local, 'stack'):
+            self._local.stack = []
+        return self._local.stack
+    
+    def _merged_stats(self) -> pstats.Stats:
+        """Statystyki cProfile głównego wątku i wątków roboczych."""
+        stats = pstats.Stats(self._profile)
+        for profile in self._thread_profiles:
+            try:
+                stats.add(profile)
+            except TypeError:
+                # Wątek bez wywołań (pusty profil)
+                continue
+        return stats
+    
+    def stop(self, output_dir: Optional[Path] = None) -> Optional[Path]:
+        """
+        Wyłącza profilowanie i zapisuje raport oraz plik .prof.
+        
+        Args:
+            output_dir: Katalog wyników (domyślnie Settings.LOGS_DIR)
+        
+        Returns:
+            Ścieżka raportu tekstowego (None gdy profilowanie nie było włączone)
+        """
+        if not self.enabled:
+            return None
+        
+        self._profile.disable()
+        self.enabled = False
+        if sys.version_info < (3, 12):
+            threading.setprofile(None)
+        wall = time.perf_counter() - self._started_at
+        cpu = time.process_time() - self._cpu_started_at
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        output_dir = Path(output_dir or Settings.LOGS_DIR)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        prof_path = output_dir / f"profile_{stamp}.prof"
+        report_path = output_dir / f"profile_{stamp}.txt"
+        
+        merged = self._merged_stats()
+        merged.dump_stats(str(prof_path))
+        report_path.write_text(self.format_report(wall, cpu, peak, prof_path, merged), encoding='utf-8')
+        
+        logger.info(f"🔬 Raport profilowania: {report_path} (cProfile: {prof_path})")
+        return report_path
+    
+    def format_report(self, wall: float, cpu: float, peak: int, prof_path: Path,
+                      merged: Optional[pstats.Stats] = None) -> str:
+        """Raport: podsumowanie przebiegu, tabela etapów i top funkcji cProfile (wszystkie wątki)."""
+        lines = [
+            f"Profil przebiegu Forebet Scraper - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Czas ściany: {wall:.2f}s | CPU procesu: {cpu:.2f}s | "
+            f"czekanie: {max(wall - cpu, 0):.2f}s | szczyt pamięci: {peak / (1024 * 1024):.1f} MB",
+            "",
+            f"{'etap':<10} {'liczba':>7} {'ściana [s]':>11} {'CPU [s]':>9} {'czekanie [s]':>13} "
+            f"{'CPU %':>6} {'szczyt [MB]':>12} {'szczyt proc. [MB]':>18}",
+        ]
+        
+        with self._lock:
+            stats = sorted(self._stats.items(), key=lambda item: item[1]['wall'], reverse=True)
+        
+        for stage, row in stats:
+            cpu_share = row['cpu'] / row['wall'] if row['wall'] > 0 else 0.0
+            lines.append(
+                f"{stage:<10} {row['count']:>7} {row['wall']:>11.2f} {row['cpu']:>9.2f} "
+                f"{max(row['wall'] - row['cpu'], 0):>13.2f} {cpu_share:>6.0%} "
+                f"{_mb(row['peak']):>12} {_mb(row['process_peak']):>18}"
+            )
+        lines.append("(szczyt proc. = szczyt pamięci procesu dla wywołań równoległych z etapami w innych wątkach)")
+        
+        stream = io.StringIO()
+        merged = merged or self._merged_stats()
+        merged.stream = stream
+        merged.sort_stats('cumulative').print_stats(30)
+        lines += ["", f"cProfile (top 30 wg czasu skumulowanego, {len(self._thread_profiles) + 1} wątków, "
+                      f"pełne dane: {prof_path.name}):", stream.getvalue()]
+        return "\n".join(lines)
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f}" if size else "-"
+
+
+# Globalny singleton
+run_profiler = RunProfiler()
+
+
+__all__ = ['RunProfiler', 'run_profiler']
@@ -0,0 +1,161 @@
+"""
+Strukturalny dziennik przebiegu (JSON lines) - jeden rekord na etap i zdarzenie.
+"""
+import contextvars
+import json
+import math
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..config import Settings
+from .logger import get_logger
+from .profiler import run_profiler
+
+logger = get_logger(__name__)
+
+# Rekord bieżącego etapu - kod głębiej w stosie (scraper, fetchery) dopisuje
+# do niego cache hit/miss i pobrane bajty bez przekazywania parametrów
+_current_record: contextvars.ContextVar[Optional[Dict[str, Any]]] = contextvars.ContextVar(
+    "run_log_record", default=None
+)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    """Percentyl (metoda najbliższego rzędu) z posortowanej listy."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+class RunLog:
+    """
+    Dziennik etapów przebiegu: listing, parse, h2h, form, odds, filter, email.
+    
+    Każdy etap zapisuje linię JSON z czasem trwania, statusem oraz polami
+    dopisanymi przez annotate()/add_bytes() (np. cache hit/miss, bajty).
+    Bieżący etap jest trzymany w contextvars, więc etapy można zagnieżdżać
+    (parse wewnątrz listing) i dopisywać pola z dowolnego miejsca w stosie.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Inicjalizacja dziennika.
+        
+        Args:
+            path: Plik JSON lines (domyślnie Settings.RUN_LOG_PATH)
+        """
+        self.path = Path(path or Settings.RUN_LOG_PATH)
+        self.run_id = uuid.uuid4().hex[:12]
+        self._durations: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+        self._file = None
+    
+    @contextmanager
+    def stage(self, name: str, /, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Mierzy etap i zapisuje jego rekord po zakończeniu.
+        
+        Args:
+            name: Nazwa etapu
+            **fields: Dodatkowe pola rekordu (np. sport, match_id)
+        
+        Yields:
+            Rekord etapu (można dopisywać pola)
+        """
+        record: Dict[str, Any] = {'stage': name, **fields}
+        token = _current_record.set(record)
+        profile_token = run_profiler.enter() if run_profiler.enabled else None
+        start = time.perf_counter()
+        
+        try:
+            yield record
+            record.setdefault('status', 'ok')
+        except BaseException as e:
+            record['status'] = 'error'
+            record['error'] = str(e)
+            raise
+        finally:
+            _current_record.reset(token)
+            record['duration_ms'] = round((time.perf_counter() - start) * 1000, 2)
+            if profile_token is not None:
+                run_profiler.exit(profile_token, record)
+            self._write(record)
+    
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Dopisuje rekord do pliku i statystyk przebiegu."""
+        record = {'run_id': self.run_id, 'ts': datetime.now().isoformat(timespec='milliseconds'), **record}
+        
+        with self._lock:
+            self._durations.setdefault(record['stage'], []).append(record['duration_ms'])
+            try:
+                if self._file is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, 'a', encoding='utf-8')
+                self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                self._file.flush()
+            except OSError as e:
+                logger.warning(f"Błąd zapisu dziennika przebiegu: {e}")
+    
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Statystyki czasów etapów bieżącego przebiegu.
+        
+        Returns:
+            {etap: {'count', 'total_ms', 'p50_ms', 'p95_ms'}}
+        """
+        with self._lock:
+            durations = {stage: sorted(values) for stage, values in self._durations.items()}
+        
+        return {
+            stage: {
+                'count': len(values),
+                'total_ms': round(sum(values), 2),
+                'p50_ms': _percentile(values, 0.50),
+                'p95_ms': _percentile(values, 0.95),
+            }
+            for stage, values in durations.items()
+        }
+    
+    def format_summary(self) -> List[str]:
+        """Tabela p50/p95 per etap (linie do logu), etapy wg łącznego czasu."""
+        stats = self.summary()
+        lines = [f"{'etap':<10} {'liczba':>7} {'łącznie [s]':>12} {'p50 [ms]':>10} {'p95 [ms]':>10}"]
+        for stage, row in sorted(stats.items(), key=lambda item: item[1]['total_ms'], reverse=True):
+            lines.append(
+                f"{stage:<10} {row['count']:>7} {row['total_ms'] / 1000:>12.2f} "
+                f"{row['p50_ms']:>10.1f} {row['p95_ms']:>10.1f}"
+            )
+        return lines
+    
+    @staticmethod
+    def annotate(**fields: Any) -> None:
+        """Dopisuje pola do rekordu bieżącego etapu (poza etapem - nic nie robi)."""
+        record = _current_record.get()
+        if record is not None:
+            record.update(fields)
+    
+    @staticmethod
+    def add_bytes(count: int) -> None:
+        """Dolicza pobrane bajty do rekordu bieżącego etapu."""
+        record = _current_record.get()
+        if record is not None:
+            record['bytes'] = record.get('bytes', 0) + count
+    
+    def close(self) -> None:
+        """Zamyka plik dziennika."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# Globalny singleton
+run_log = RunLog()
+
+
+__all__ = ['RunLog', 'run_log']
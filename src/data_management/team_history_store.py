@@ -0,0 +1,231 @@
+"""
+Magazyn historii drużyn (SQLite) - przyrostowe aktualizacje formy.
+"""
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import Settings
+from .history_db import SQLiteStore
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS teams (
+    team_key TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    team TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (team_key, sport)
+);
+CREATE TABLE IF NOT EXISTS team_results (
+    team_key TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    score TEXT,
+    recorded_at TEXT NOT NULL,
+    PRIMARY KEY (team_key, sport, position)
+);
+CREATE TABLE IF NOT EXISTS team_fixtures (
+    team_key TEXT NOT NULL,
+    sport TEXT NOT NULL,
+    fixture_date TEXT NOT NULL,
+    PRIMARY KEY (team_key, sport, fixture_date)
+);
+"""
+
+
+def team_key(team: str) -> str:
+    """Normalizuje nazwę drużyny do klucza w bazie."""
+    return " ".join(team.split()).lower()
+
+
+def event_date(event: Dict[str, Any]) -> date:
+    """Data meczu ze zdarzenia (listing 'na dziś' = dzień scrapowania)."""
+    scraped_at = event.get('scraped_at')
+    if scraped_at:
+        try:
+            return datetime.fromisoformat(scraped_at).date()
+        except ValueError:
+            pass
+    return date.today()
+
+
+class TeamHistoryStore(SQLiteStore):
+    """
+    Lokalna historia wyników drużyn (klucz: drużyna + sport).
+    
+    Forma drużyny jest pobierana ze strony meczu tylko wtedy, gdy od ostatniej
+    aktualizacji historii drużyna rozegrała znany nam mecz (z listingów Forebet)
+    albo historia jest starsza niż TEAM_HISTORY_MAX_AGE_DAYS.
+    """
+    
+    SCHEMA = _SCHEMA
+    
+    def record_fixture(self, team: str, sport: str, fixture_date: date) -> None:
+        """
+        Zapisuje mecz drużyny znany z listingu (bez wyniku).
+        
+        Args:
+            team: Nazwa drużyny
+            sport: Sport
+            fixture_date: Data meczu
+        """
+        self.record_fixtures([(team, sport, fixture_date)])
+    
+    def record_fixtures(self, fixtures: Iterable[tuple]) -> int:
+        """
+        Zapisuje wiele meczów naraz.
+        
+        Args:
+            fixtures: Krotki (drużyna, sport, data meczu)
+        
+        Returns:
+            Liczba zapisanych wierszy
+        """
+        rows = [
+            (team_key(team), sport, fixture_date.isoformat())
+            for team, sport, fixture_date in fixtures if team
+        ]
+        
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO team_fixtures (team_key, sport, fixture_date) VALUES (?, ?, ?)",
+                    rows
+                )
+        
+        return len(rows)
+    
+    def record_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Zapisuje mecze obu drużyn z listy zdarzeń (data = dzień scrapowania).
+        
+        Args:
+            events: Zdarzenia z ForebtScraper.fetch_events_by_sport
+        
+        Returns:
+            Liczba zapisanych wierszy
+        """
+        fixtures = []
+        for event in events:
+            fixture_date = event_date(event)
+            sport = event.get('sport', 'football')
+            fixtures.append((event.get('home_team', ''), sport, fixture_date))
+            fixtures.append((event.get('away_team', ''), sport, fixture_date))
+        
+        return self.record_fixtures(fixtures)
+    
+    def needs_refresh(self, team: str, sport: str, today: Optional[date] = None) -> bool:
+        """
+        Sprawdza czy historia drużyny wymaga pobrania strony meczu.
+        
+        Args:
+            team: Nazwa drużyny
+            sport: Sport
+            today: Dzisiejsza data (domyślnie date.today())
+        
+        Returns:
+            True jeśli brak historii, jest za stara lub drużyna grała od aktualizacji
+        """
+        today = today or date.today()
+        key = team_key(team)
+        
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT updated_at FROM teams WHERE team_key = ? AND sport = ?", (key, sport)
+            ).fetchone()
+            
+            if not row:
+                return True
+            
+            updated = datetime.fromisoformat(row[0]).date()
+            if (today - updated).days > Settings.TEAM_HISTORY_MAX_AGE_DAYS:
+                return True
+            
+            # Mecz rozegrany od dnia aktualizacji (dzisiejszy jeszcze się nie odbył)
+            played = conn.execute(
+                "SELECT 1 FROM team_fixtures WHERE team_key = ? AND sport = ? "
+                "AND fixture_date >= ? AND fixture_date < ? LIMIT 1",
+                (key, sport, updated.isoformat(), today.isoformat())
+            ).fetchone()
+        
+        return played is not None
+    
+    def record_form(self, team: str, sport: str, matches: List[Dict[str, Any]]) -> bool:
+        """
+        Zapisuje ostatnie wyniki drużyny (najnowszy pierwszy).
+        
+        Args:
+            team: Nazwa drużyny
+            sport: Sport
+            matches: Lista meczów z ForebtScraper.fetch_team_form
+        
+        Returns:
+            True jeśli zapisano (puste listy są pomijane, żeby ponowić pobranie)
+        """
+        if not team or not matches:
+            return False
+        
+        key = team_key(team)
+        now = datetime.now().isoformat()
+        rows = [
+            (key, sport, position, match.get('result', 'U'), match.get('score'), now)
+            for position, match in enumerate(matches)
+        ]
+        
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM team_results WHERE team_key = ? AND sport = ?", (key, sport))
+                conn.executemany(
+                    "INSERT INTO team_results (team_key, sport, position, result, score, recorded_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO teams (team_key, sport, team, updated_at) VALUES (?, ?, ?, ?)",
+                    (key, sport, team, now)
+                )
+        
+        logger.debug("Historia zapisana: %s (%s) - %d wyników", team, sport, len(rows))
+        return True
+    
+    def get_form(self, team: str, sport: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Zwraca zapisane wyniki drużyny w formacie fetch_team_form.
+        
+        Args:
+            team: Nazwa drużyny
+            sport: Sport
+            limit: Maksymalna liczba meczów (domyślnie wszystkie)
+        
+        Returns:
+            Lista meczów [{'result': 'W', ...}] (najnowszy pierwszy)
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT result, score FROM team_results WHERE team_key = ? AND sport = ? "
+                "ORDER BY position LIMIT ?",
+                (team_key(team), sport, limit if limit is not None else -1)
+            ).fetchall()
+        
+        matches = []
+        for result, score in rows:
+            match = {'result': result}
+            if score is not None:
+                match['score'] = score
+            matches.append(match)
+        
+        return matches
+
+
+# Globalny singleton
+team_history_store = TeamHistoryStore()
+
+
+__all__ = ['TeamHistoryStore', 'team_history_store']
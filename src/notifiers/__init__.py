@@ -1,4 +1,6 @@
 """Inicjalizacja modułu notifiers."""
 from .email_sender import EmailSender
+from .smtp_session import SMTPSession
+from .notification_dispatcher import NotificationDispatcher
 
-__all__ = ["EmailSender"]
+__all__ = ["EmailSender", "SMTPSession", "NotificationDispatcher"]
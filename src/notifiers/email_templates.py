@@ -0,0 +1,791 @@
+"""
+Szablony HTML emaili - prekompilowane (f-stringi w funkcjach, CSS renderowany
+raz na proces), a treść składana przez list + join.
+"""
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+# Ikony sportów
+SPORT_ICONS = {
+    'football': '⚽',
+    'basketball': '🏀',
+    'volleyball': '🏐',
+    'hockey': '🏒',
+    'handball': '🤾',
+    'baseball': '⚾',
+    'rugby': '🏉',
+    'cricket': '🏏',
+    'american-football': '🏈'
+}
+
+# Kolory dla sportów
+SPORT_COLORS = {
+    'football': '#27ae60',
+    'basketball': '#e67e22',
+    'volleyball': '#9b59b6',
+    'hockey': '#3498db',
+    'handball': '#e74c3c',
+    'baseball': '#16a085',
+    'rugby': '#d35400',
+    'cricket': '#8e44ad',
+    'american-football': '#c0392b'
+}
+
+# Sporty z remisem (1/X/2) vs bez remisu (1/2)
+DRAW_SPORTS = ('football', 'handball')
+
+_FORM_LETTERS = {
+    'W': '<span class="form-letter form-w">W</span>',
+    'D': '<span class="form-letter form-d">D</span>',
+    'L': '<span class="form-letter form-l">L</span>',
+}
+
+# Kursy niepobrane (pole 'unavailable') - opis w emailu
+_UNAVAILABLE_ODDS = {
+    'breaker_open': "kursy niedostępne (breaker open)",
+    'deadline': "kursy pominięte (limit czasu przebiegu)",
+}
+
+
+# Email zbiorczy (wszystkie sporty) - statyczny CSS
+_SUMMARY_STYLESHEET = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #2c3e50;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            margin: 0;
+            padding: 20px;
+        }
+        .container {
+            max-width: 900px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.2em;
+            font-weight: 700;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        }
+        .header-info {
+            margin-top: 15px;
+            font-size: 1.1em;
+            opacity: 0.95;
+        }
+        .content {
+            padding: 30px;
+        }
+        .sport-section {
+            margin-bottom: 40px;
+        }
+        .sport-header {
+            background: linear-gradient(135deg, var(--sport-color) 0%, var(--sport-color-dark) 100%);
+            color: white;
+            padding: 15px 20px;
+            border-radius: 8px;
+            font-size: 1.5em;
+            font-weight: 600;
+            margin-bottom: 20px;
+            display: flex;
+            align-items: center;
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+        }
+        .sport-icon {
+            font-size: 1.3em;
+            margin-right: 12px;
+        }
+        .event {
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+            border-left: 5px solid var(--sport-color);
+            padding: 20px;
+            margin: 15px 0;
+            border-radius: 8px;
+            box-shadow: 0 3px 10px rgba(0,0,0,0.1);
+            transition: transform 0.2s;
+        }
+        .event:hover {
+            transform: translateX(5px);
+            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+        }
+        .event-header {
+            font-size: 1.3em;
+            font-weight: 700;
+            color: #2c3e50;
+            margin-bottom: 12px;
+            display: flex;
+            align-items: center;
+        }
+        .vs-divider {
+            margin: 0 10px;
+            color: var(--sport-color);
+            font-weight: 600;
+        }
+        .info-row {
+            margin: 8px 0;
+            font-size: 0.95em;
+        }
+        .label {
+            font-weight: 600;
+            color: #7f8c8d;
+            display: inline-block;
+            min-width: 120px;
+        }
+        .value {
+            color: #34495e;
+            font-weight: 500;
+        }
+        .probability {
+            background: white;
+            padding: 12px;
+            margin: 12px 0;
+            border-radius: 6px;
+            font-size: 1.1em;
+            font-weight: 600;
+            text-align: center;
+            color: var(--sport-color);
+            box-shadow: 0 2px 6px rgba(0,0,0,0.1);
+        }
+        .stats {
+            background: rgba(255,255,255,0.9);
+            padding: 12px;
+            margin: 12px 0;
+            border-radius: 6px;
+            border: 1px solid #e0e0e0;
+        }
+        .stats strong {
+            color: var(--sport-color);
+            display: block;
+            margin-bottom: 6px;
+        }
+        .form-row {
+            margin: 5px 0;
+            padding: 4px 0;
+        }
+        .footer {
+            background: #34495e;
+            color: #ecf0f1;
+            padding: 25px 30px;
+            text-align: center;
+            font-size: 0.9em;
+        }
+        .footer-warning {
+            background: #e74c3c;
+            color: white;
+            padding: 10px;
+            border-radius: 6px;
+            margin-top: 15px;
+            font-weight: 600;
+        }
+        a {
+            color: var(--sport-color);
+            text-decoration: none;
+            font-weight: 600;
+            transition: opacity 0.2s;
+        }
+        a:hover {
+            opacity: 0.7;
+        }
+        .link-button {
+            display: inline-block;
+            background: var(--sport-color);
+            color: white;
+            padding: 8px 16px;
+            border-radius: 6px;
+            margin-top: 10px;
+            text-decoration: none;
+            transition: transform 0.2s;
+        }
+        .link-button:hover {
+            transform: scale(1.05);
+            opacity: 1;
+        }
+    </style>
+"""
+
+def _summary_header(generated_at, event_count) -> str:
+    return f"""
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎯 Forebet Scraper - Kwalifikowane Wydarzenia</h1>
+            <div class="header-info">
+                📅 Data: {generated_at} |
+                📊 Wydarzenia: {event_count}
+            </div>
+        </div>
+        <div class="content">
+"""
+
+def _summary_sport_section(sport_color, sport_color_dark, sport_icon, sport_name, event_count) -> str:
+    return f"""
+<div class="sport-section" style="--sport-color: {sport_color}; --sport-color-dark: {sport_color_dark};">
+    <div class="sport-header">
+        <span class="sport-icon">{sport_icon}</span>
+        <span>{sport_name} ({event_count})</span>
+    </div>
+"""
+
+def _summary_event(home_team, away_team, league, prob_text,
+                   home_form_display, away_form_display, home_home_display, away_away_display) -> str:
+    return f"""
+<div class="event">
+    <div class="event-header">
+        <span>{home_team}</span>
+        <span class="vs-divider">VS</span>
+        <span>{away_team}</span>
+    </div>
+    <div class="info-row">
+        <span class="label">🏆 Liga:</span>
+        <span class="value">{league}</span>
+    </div>
+    <div class="probability">
+        {prob_text}
+    </div>
+    <div class="stats">
+        <strong>📊 Forma Ogólna (ostatnie 6 meczów):</strong>
+        <div class="form-row">🏠 {home_team}: {home_form_display}</div>
+        <div class="form-row">✈️ {away_team}: {away_form_display}</div>
+    </div>
+    <div class="stats">
+        <strong>🏟️ Forma Home/Away:</strong>
+        <div class="form-row">🏠 {home_team} u siebie: {home_home_display}</div>
+        <div class="form-row">✈️ {away_team} na wyjeździe: {away_away_display}</div>
+    </div>
+"""
+
+def _summary_h2h(home_team, h2h_win_rate, h2h_total, h2h_wins, h2h_draws, h2h_losses) -> str:
+    return f"""
+<div class="stats">
+    <strong>🤝 Historia Head-to-Head:</strong>
+    <div class="form-row">Win rate {home_team}: {h2h_win_rate:.1f}%</div>
+    <div class="form-row">Mecze: {h2h_total} (W:{h2h_wins} | D:{h2h_draws} | L:{h2h_losses})</div>
+</div>
+"""
+
+def _summary_link(match_url) -> str:
+    return f"""
+    <a href="{match_url}" target="_blank" class="link-button">
+        🔗 Zobacz szczegóły na Forebet
+    </a>
+</div>
+"""
+
+
+# Email dla jednego sportu - CSS zależny tylko od koloru sportu
+_SPORT_STYLESHEET = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            line-height: 1.6;
+            color: #2c3e50;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            margin: 0;
+            padding: 20px;
+        }}
+        .container {{
+            max-width: 900px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 12px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }}
+        .header {{
+            background: linear-gradient(135deg, {sport_color} 0%, {sport_color_dark} 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }}
+        .header h1 {{
+            margin: 0;
+            font-size: 2.2em;
+            font-weight: 700;
+            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+        }}
+        .header-info {{
+            margin-top: 15px;
+            font-size: 1.1em;
+            opacity: 0.95;
+        }}
+        .content {{
+            padding: 30px;
+        }}
+        .event {{
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+            border-left: 5px solid {sport_color};
+            padding: 20px;
+            margin: 15px 0;
+            border-radius: 8px;
+            box-shadow: 0 3px 10px rgba(0,0,0,0.1);
+            transition: transform 0.2s;
+        }}
+        .event:hover {{
+            transform: translateX(5px);
+            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
+        }}
+        .event-header {{
+            font-size: 1.3em;
+            font-weight: 700;
+            color: #2c3e50;
+            margin-bottom: 12px;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+        }}
+        .match-time {{
+            color: {sport_color};
+            font-size: 0.9em;
+            font-weight: 600;
+        }}
+        .vs-divider {{
+            margin: 0 10px;
+            color: {sport_color};
+            font-weight: 600;
+        }}
+        .info-row {{
+            margin: 8px 0;
+            font-size: 0.95em;
+        }}
+        .label {{
+            font-weight: 600;
+            color: #7f8c8d;
+            display: inline-block;
+            min-width: 120px;
+        }}
+        .value {{
+            color: #34495e;
+            font-weight: 500;
+        }}
+        .probability {{
+            background: white;
+            padding: 12px;
+            margin: 12px 0;
+            border-radius: 6px;
+            font-size: 1.1em;
+            font-weight: 600;
+            text-align: center;
+            color: {sport_color};
+            box-shadow: 0 2px 6px rgba(0,0,0,0.1);
+        }}
+        .odds-box {{
+            background: linear-gradient(135deg, #2ecc71 0%, #27ae60 100%);
+            color: white;
+            padding: 15px;
+            margin: 12px 0;
+            border-radius: 6px;
+            text-align: center;
+            box-shadow: 0 3px 8px rgba(0,0,0,0.2);
+        }}
+        .odds-box strong {{
+            display: block;
+            margin-bottom: 8px;
+            font-size: 1.1em;
+        }}
+        .odds-values {{
+            font-size: 1.3em;
+            font-weight: 700;
+        }}
+        .stats {{
+            background: rgba(255,255,255,0.9);
+            padding: 12px;
+            margin: 12px 0;
+            border-radius: 6px;
+            border: 1px solid #e0e0e0;
+        }}
+        .stats strong {{
+            color: {sport_color};
+            display: block;
+            margin-bottom: 6px;
+        }}
+        .form-row {{
+            margin: 5px 0;
+            padding: 4px 0;
+            font-family: monospace;
+        }}
+        .form-letter {{
+            display: inline-block;
+            width: 24px;
+            height: 24px;
+            line-height: 24px;
+            text-align: center;
+            margin: 2px;
+            border-radius: 4px;
+            font-weight: bold;
+            color: white;
+        }}
+        .form-w {{ background-color: #27ae60; }}
+        .form-d {{ background-color: #f39c12; }}
+        .form-l {{ background-color: #e74c3c; }}
+        .footer {{
+            background: #34495e;
+            color: #ecf0f1;
+            padding: 25px 30px;
+            text-align: center;
+            font-size: 0.9em;
+        }}
+        .footer-warning {{
+            background: #e74c3c;
+            color: white;
+            padding: 10px;
+            border-radius: 6px;
+            margin-top: 15px;
+            font-weight: 600;
+        }}
+        a {{
+            color: {sport_color};
+            text-decoration: none;
+            font-weight: 600;
+            transition: opacity 0.2s;
+        }}
+        a:hover {{
+            opacity: 0.7;
+        }}
+        .link-button {{
+            display: inline-block;
+            background: {sport_color};
+            color: white;
+            padding: 8px 16px;
+            border-radius: 6px;
+            margin-top: 10px;
+            text-decoration: none;
+            transition: transform 0.2s;
+        }}
+        .link-button:hover {{
+            transform: scale(1.05);
+            opacity: 1;
+        }}
+    </style>
+"""
+
+def _sport_header(sport_icon, sport_name, generated_at, event_count) -> str:
+    return f"""
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>{sport_icon} {sport_name} - Kwalifikowane Wydarzenia</h1>
+            <div class="header-info">
+                📅 Data: {generated_at} |
+                📊 Wydarzenia: {event_count}
+            </div>
+        </div>
+        <div class="content">
+"""
+
+def _sport_event(home_team, away_team, time_display, league, prob_text) -> str:
+    return f"""
+<div class="event">
+    <div class="event-header">
+        <span>{home_team} <span class="vs-divider">VS</span> {away_team}</span>
+        <span class="match-time">🕐 {time_display}</span>
+    </div>
+    <div class="info-row">
+        <span class="label">🏆 Liga:</span>
+        <span class="value">{league}</span>
+    </div>
+    <div class="probability">
+        {prob_text}
+    </div>
+"""
+
+def _sport_odds(odds_text) -> str:
+    return f"""
+<div class="odds-box">
+    <strong>💰 Kursy Nordic Bet:</strong>
+    <div class="odds-values">{odds_text}</div>
+</div>
+"""
+
+def _sport_stats(home_team, home_form_colored, home_form_points, away_team, away_form_colored, away_form_points,
+                 home_home_colored, home_home_points, away_away_colored, away_away_points) -> str:
+    return f"""
+<div class="stats">
+    <strong>📊 Forma Ogólna (ostatnie 6 meczów):</strong>
+    <div class="form-row">🏠 {home_team}: {home_form_colored} ({home_form_points} pkt)</div>
+    <div class="form-row">✈️ {away_team}: {away_form_colored} ({away_form_points} pkt)</div>
+</div>
+<div class="stats">
+    <strong>🏟️ Forma Home/Away:</strong>
+    <div class="form-row">🏠 {home_team} u siebie: {home_home_colored} ({home_home_points} pkt)</div>
+    <div class="form-row">✈️ {away_team} na wyjeździe: {away_away_colored} ({away_away_points} pkt)</div>
+</div>
+"""
+
+def _sport_h2h(home_team, h2h_win_rate, h2h_total, h2h_wins, h2h_draws, h2h_losses) -> str:
+    return f"""
+<div class="stats">
+    <strong>🤝 Historia Head-to-Head:</strong>
+    <div class="form-row">Win rate {home_team}: {h2h_win_rate:.1f}%</div>
+    <div class="form-row">Mecze: {h2h_total} (W:{h2h_wins} | D:{h2h_draws} | L:{h2h_losses})</div>
+</div>
+"""
+
+def _sport_link(match_url) -> str:
+    return f"""
+    <a href="{match_url}" target="_blank" class="link-button">
+        🔗 Zobacz szczegóły na Forebet
+    </a>
+</div>
+"""
+
+
+# Wspólna stopka
+_FOOTER = """
+        </div>
+        <div class="footer">
+            <p>🤖 Wygenerowane automatycznie przez Forebet Scraper</p>
+            <div class="footer-warning">
+                ⚠️ WAŻNE: To tylko analiza statystyczna oparta na danych historycznych.<br>
+                Nie stanowi gwarancji wyniku ani porady inwestycyjnej!
+            </div>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+
+@lru_cache(maxsize=None)
+def darken_color(hex_color: str, factor: float = 0.8) -> str:
+    """Przyciemnia kolor hex."""
+    hex_color = hex_color.lstrip('#')
+    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    darkened = tuple(int(c * factor) for c in rgb)
+    return f"#{darkened[0]:02x}{darkened[1]:02x}{darkened[2]:02x}"
+
+
+@lru_cache(maxsize=None)
+def sport_stylesheet(sport_color: str, sport_color_dark: str) -> str:
+    """Renderuje CSS emaila sportu (raz na kolor w procesie)."""
+    return _SPORT_STYLESHEET.format(sport_color=sport_color, sport_color_dark=sport_color_dark)
+
+
+@lru_cache(maxsize=1024)
+def colorize_form(form_record: str) -> str:
+    """
+    Koloruje formę drużyny jak na Flashscore:
+    W = zielone, D = żółte, L = czerwone
+    
+    Args:
+        form_record: String formy np. "3W-2D-1L"
+    
+    Returns:
+        HTML z kolorowymi literkami
+    """
+    if form_record == 'N/A' or not form_record:
+        return '<span style="color: #7f8c8d;">N/A</span>'
+    
+    # Wyciągnij kolejność meczów (np. "WWDWWL" z "3W-2D-1L")
+    # Albo jeśli jest już w formacie WWDWWL
+    if '-' in form_record:
+        # Format: "3W-2D-1L"
+        parts = []
+        for part in form_record.split('-'):
+            for letter in ('W', 'D', 'L'):
+                if letter in part:
+                    parts.append(_FORM_LETTERS[letter] * int(part.replace(letter, '')))
+                    break
+        return ''.join(parts)
+    
+    # Format: "WWDWWL"
+    return ''.join([_FORM_LETTERS.get(result, '') for result in form_record])
+
+
+def _prob_text(probs: Dict[str, Any], has_draw: bool) -> str:
+    """Formatowanie prawdopodobieństwa w zależności od sportu."""
+    home_prob = probs.get('home', 0)
+    away_prob = probs.get('away', 0)
+    
+    if has_draw:
+        return f"1: {home_prob}% | X: {probs.get('draw', 0)}% | 2: {away_prob}%"
+    return f"1: {home_prob}% | 2: {away_prob}%"
+
+
+def _h2h_fields(h2h: Dict[str, Any], home_team: str) -> Dict[str, Any]:
+    """Pola szablonu sekcji Head-to-Head."""
+    return {
+        'home_team': home_team,
+        'h2h_win_rate': h2h.get('home_win_rate', 0) * 100,
+        'h2h_total': h2h.get('total_matches', 0),
+        'h2h_wins': h2h.get('home_wins', 0),
+        'h2h_draws': h2h.get('draws', 0),
+        'h2h_losses': h2h.get('away_wins', 0),
+    }
+
+
+def render_summary_email(events: List[Dict[str, Any]], generated_at: Optional[datetime] = None) -> str:
+    """
+    Renderuje email zbiorczy z grupowaniem po sportach.
+    
+    Args:
+        events: Lista kwalifikowanych zdarzeń
+        generated_at: Czas wygenerowania (domyślnie teraz)
+    
+    Returns:
+        HTML emaila
+    """
+    events_by_sport: Dict[str, List[Dict[str, Any]]] = {}
+    for event in events:
+        sport = event.get('event', {}).get('sport', 'unknown')
+        events_by_sport.setdefault(sport, []).append(event)
+    
+    generated_at = generated_at or datetime.now()
+    parts = [
+        _SUMMARY_STYLESHEET,
+        _summary_header(generated_at=generated_at.strftime('%d.%m.%Y %H:%M:%S'), event_count=len(events)),
+    ]
+    append = parts.append
+    
+    # Generuj sekcje dla każdego sportu
+    for sport, sport_events in sorted(events_by_sport.items()):
+        sport_color = SPORT_COLORS.get(sport, '#3498db')
+        has_draw = sport in DRAW_SPORTS
+        
+        append(_summary_sport_section(
+            sport_color=sport_color,
+            sport_color_dark=darken_color(sport_color),
+            sport_icon=SPORT_ICONS.get(sport, '🏆'),
+            sport_name=sport.replace('-', ' ').title(),
+            event_count=len(sport_events),
+        ))
+        
+        for event in sport_events:
+            ev = event.get('event', {})
+            analysis = event.get('analysis', {})
+            home_team = ev.get('home_team', 'N/A')
+            away_team = ev.get('away_team', 'N/A')
+            h2h = analysis.get('h2h', {})
+            
+            append(_summary_event(
+                home_team=home_team,
+                away_team=away_team,
+                league=ev.get('league', 'N/A'),
+                prob_text=_prob_text(ev.get('probabilities', {}), has_draw),
+                home_form_display=analysis.get('home_form', {}).get('display', 'N/A'),
+                away_form_display=analysis.get('away_form', {}).get('display', 'N/A'),
+                home_home_display=analysis.get('home_home_record', {}).get('display', 'N/A'),
+                away_away_display=analysis.get('away_away_record', {}).get('display', 'N/A'),
+            ))
+            
+            if h2h.get('has_history'):
+                append(_summary_h2h(**_h2h_fields(h2h, home_team)))
+            
+            append(_summary_link(match_url=ev.get('match_url', '#')))
+        
+        append("</div>")  # Zamknij sport-section
+    
+    append(_FOOTER)
+    return ''.join(parts)
+
+
+def render_sport_email(sport: str, events: List[Dict[str, Any]], generated_at: Optional[datetime] = None) -> str:
+    """
+    Renderuje email dla pojedynczego sportu z kolorowaniem formy.
+    
+    Args:
+        sport: Nazwa sportu
+        events: Lista wydarzeń (już posortowana godzinowo)
+        generated_at: Czas wygenerowania (domyślnie teraz)
+    
+    Returns:
+        HTML emaila
+    """
+    sport_color = SPORT_COLORS.get(sport, '#3498db')
+    has_draw = sport in DRAW_SPORTS
+    generated_at = generated_at or datetime.now()
+    
+    parts = [
+        sport_stylesheet(sport_color, darken_color(sport_color)),
+        _sport_header(
+            sport_icon=SPORT_ICONS.get(sport, '🏆'),
+            sport_name=sport.replace('-', ' ').title(),
+            generated_at=generated_at.strftime('%d.%m.%Y %H:%M:%S'),
+            event_count=len(events),
+        ),
+    ]
+    append = parts.append
+    
+    for event_data in events:
+        ev = event_data.get('event', {})
+        analysis = event_data.get('analysis', {})
+        home_team = ev.get('home_team', 'N/A')
+        away_team = ev.get('away_team', 'N/A')
+        match_time = ev.get('match_time', '')
+        
+        home_form = analysis.get('home_form', {})
+        away_form = analysis.get('away_form', {})
+        home_home = analysis.get('home_home_record', {})
+        away_away = analysis.get('away_away_record', {})
+        h2h = analysis.get('h2h', {})
+        odds = analysis.get('odds', {})
+        
+        append(_sport_event(
+            home_team=home_team,
+            away_team=away_team,
+            time_display=match_time.split()[-1] if match_time else 'N/A',
+            league=ev.get('league', 'N/A'),
+            prob_text=_prob_text(ev.get('probabilities', {}), has_draw),
+        ))
+        
+        # Dodaj kursy Nordic Bet jeśli są dostępne
+        if odds.get('has_odds'):
+            home_odd = odds.get('home_win', '-')
+            away_odd = odds.get('away_win', '-')
+            
+            if has_draw:
+                odds_text = f"1: {home_odd} | X: {odds.get('draw', '-')} | 2: {away_odd}"
+            else:
+                odds_text = f"1: {home_odd} | 2: {away_odd}"
+            
+            append(_sport_odds(odds_text=odds_text))
+        elif odds.get('unavailable') in _UNAVAILABLE_ODDS:
+            append(_sport_odds(odds_text=_UNAVAILABLE_ODDS[odds['unavailable']]))
+        
+        # Forma z kolorowaniem (W=zielone, D=żółte, L=czerwone)
+        append(_sport_stats(
+            home_team=home_team,
+            away_team=away_team,
+            home_form_colored=colorize_form(home_form.get('record', 'N/A')),
+            away_form_colored=colorize_form(away_form.get('record', 'N/A')),
+            home_home_colored=colorize_form(home_home.get('record', 'N/A')),
+            away_away_colored=colorize_form(away_away.get('record', 'N/A')),
+            home_form_points=home_form.get('points', 0),
+            away_form_points=away_form.get('points', 0),
+            home_home_points=home_home.get('points', 0),
+            away_away_points=away_away.get('points', 0),
+        ))
+        
+        if h2h.get('has_history'):
+            append(_sport_h2h(**_h2h_fields(h2h, home_team)))
+        
+        append(_sport_link(match_url=ev.get('match_url', '#')))
+    
+    append(_FOOTER)
+    return ''.join(parts)
+
+
+__all__ = [
+    'SPORT_ICONS', 'SPORT_COLORS', 'DRAW_SPORTS', 'darken_color', 'sport_stylesheet',
+    'colorize_form', 'render_summary_email', 'render_sport_email',
+]
@@ -0,0 +1,221 @@
+"""
+Kolejka powiadomień - wysyłka emaili w tle, równolegle z analizą.
+"""
+import atexit
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import Settings
+from ..data_management import get_logger, run_log
+from .email_sender import EmailSender
+from .smtp_session import SMTPSession
+
+logger = get_logger(__name__)
+
+# Zadanie: (nazwa do logów, funkcja wysyłająca przez sesję SMTP)
+_Job = Tuple[str, Callable[[SMTPSession], bool]]
+
+_STOP = None
+
+
+class NotificationDispatcher:
+    """
+    Wysyła powiadomienia z wątku w tle przez jedną sesję SMTP.
+    
+    Email sportu jest kolejkowany zaraz po zakończeniu jego analizy, więc
+    handshake i ewentualne ponowienia nakładają się na analizę kolejnych
+    sportów. close() (także przy wyjściu z procesu) czeka na opróżnienie kolejki.
+    """
+    
+    def __init__(
+        self,
+        email_sender: EmailSender,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None
+    ):
+        """
+        Inicjalizacja dispatchera.
+        
+        Args:
+            email_sender: Skonfigurowany EmailSender
+            max_retries: Limit ponowień jednego emaila (domyślnie Settings.EMAIL_MAX_RETRIES)
+            retry_delay: Początkowe opóźnienie ponowienia (domyślnie Settings.EMAIL_RETRY_DELAY)
+        """
+        self.email_sender = email_sender
+        self.max_retries = Settings.EMAIL_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_delay = Settings.EMAIL_RETRY_DELAY if retry_delay is None else retry_delay
+        
+        self.results: List[Dict[str, Any]] = []
+        self._queue: "queue.Queue[Optional[_Job]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def __enter__(self):
+        """Context manager enter - start wątku."""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - dosłanie kolejki i zamknięcie."""
+        self.close()
+    
+    def start(self) -> None:
+        """Uruchamia wątek wysyłający (idempotentne, wznawia martwy wątek)."""
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            
+            if self._worker is None:
+                atexit.register(self.close)
+            else:
+                logger.warning("⚠️  Wątek powiadomień nie działa - uruchamiam ponownie")
+            
+            self._worker = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+            self._worker.start()
+    
+    def submit_sport(self, sport: str, qualified_events: List[Dict[str, Any]]) -> None:
+        """
+        Kolejkuje email z kwalifikowanymi zdarzeniami sportu.
+        
+        Args:
+            sport: Nazwa sportu
+            qualified_events: Finalna lista kwalifikowanych zdarzeń sportu
+        """
+        events = list(qualified_events)
+        self._submit(
+            f"email {sport} ({len(events)} zdarzeń)",
+            lambda session: self.email_sender.send_sport_events(sport, events, session)
+        )
+    
+    def submit_no_events(self) -> None:
+        """Kolejkuje powiadomienie o braku kwalifikowanych zdarzeń."""
+        self._submit("powiadomienie o braku zdarzeń", self.email_sender.send_no_events_notification)
+    
+    def _submit(self, name: str, send: Callable[[SMTPSession], bool]) -> None:
+        """Dodaje zadanie do kolejki."""
+        if self._closed:
+            raise RuntimeError("NotificationDispatcher jest zamknięty")
+        
+        self.start()
+        self._queue.put((name, send))
+        logger.info(f"📨 W kolejce: {name}")
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Czeka aż wszystkie zakolejkowane powiadomienia zostaną obsłużone.
+        
+        Args:
+            timeout: Maksymalny czas oczekiwania (domyślnie Settings.EMAIL_FLUSH_TIMEOUT)
+        
+        Returns:
+            True jeśli kolejka jest pusta i wszystkie wysyłki się powiodły
+        """
+        timeout = Settings.EMAIL_FLUSH_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"❌ Kolejka powiadomień nieopróżniona po {timeout:.0f}s "
+                                 f"({self._queue.unfinished_tasks} w kolejce)")
+                    return False
+                if self._worker is None or not self._worker.is_alive():
+                    logger.error(f"❌ Wątek powiadomień nie działa ({self._queue.unfinished_tasks} w kolejce)")
+                    return False
+                self._queue.all_tasks_done.wait(min(remaining, 0.5))
+        
+        return self.all_succeeded
+    
+    @property
+    def all_succeeded(self) -> bool:
+        """Czy wszystkie obsłużone wysyłki się powiodły."""
+        return all(result['success'] for result in self.results)
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Dosyła kolejkę, zatrzymuje wątek i zamyka sesję SMTP.
+        
+        Args:
+            timeout: Maksymalny czas oczekiwania (domyślnie Settings.EMAIL_FLUSH_TIMEOUT)
+        
+        Returns:
+            True jeśli wszystkie wysyłki się powiodły
+        """
+        with self._lock:
+            if self._closed:
+                return self.all_succeeded
+            self._closed = True
+            worker = self._worker
+        
+        if worker is None:
+            return self.all_succeeded
+        
+        if not worker.is_alive():
+            return self.flush(timeout=0)
+        
+        timeout = Settings.EMAIL_FLUSH_TIMEOUT if timeout is None else timeout
+        self._queue.put(_STOP)
+        worker.join(timeout)
+        
+        if worker.is_alive():
+            logger.error(f"❌ Wątek powiadomień nie zakończył się w {timeout:.0f}s")
+            return False
+        
+        return self.all_succeeded
+    
+    def _run(self) -> None:
+        """Pętla wątku - jedna sesja SMTP dla wszystkich zadań."""
+        with self.email_sender.open_session() as session:
+            while True:
+                job = self._queue.get()
+                try:
+                    if job is _STOP:
+                        return
+                    self._deliver(session, *job)
+                except Exception as e:
+                    # Błąd jednego zadania nie może zatrzymać wątku (flush czekałby w nieskończoność)
+                    name = job[0]
+                    logger.error(f"❌ Błąd obsługi powiadomienia ({name}): {e}", exc_info=True)
+                    self.results.append({'name': name, 'success': False, 'attempts': 0,
+                                         'duration': 0.0, 'error': str(e)})
+                finally:
+                    self._queue.task_done()
+    
+    def _deliver(self, session: SMTPSession, name: str, send: Callable[[SMTPSession], bool]) -> None:
+        """Wysyła jedno powiadomienie z ograniczoną liczbą ponowień."""
+        start = time.perf_counter()
+        success = False
+        attempts = 0
+        
+        with run_log.stage('email', name=name) as record:
+            for attempt in range(self.max_retries + 1):
+                attempts = attempt + 1
+                try:
+                    success = send(session)
+                except Exception as e:
+                    logger.error(f"Błąd wysyłki ({name}): {e}")
+                    success = False
+                
+                if success or attempt >= self.max_retries:
+                    break
+                
+                delay = self.retry_delay * (2 ** attempt)
+                logger.warning(f"⚠️  Ponowienie wysyłki ({name}) za {delay:.0f}s [{attempt + 1}/{self.max_retries}]")
+                time.sleep(delay)
+            
+            record.update(attempts=attempts, status='ok' if success else 'failed')
+        
+        duration = time.perf_counter() - start
+        self.results.append({'name': name, 'success': success, 'attempts': attempts, 'duration': duration})
+        
+        if success:
+            logger.info(f"✅ Wysłano: {name} ({duration:.1f}s)")
+        else:
+            logger.error(f"❌ Nie wysłano: {name} po {attempts} próbach")
+
+
+__all__ = ['NotificationDispatcher']
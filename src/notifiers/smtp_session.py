@@ -0,0 +1,137 @@
+"""
+Sesja SMTP - jedno uwierzytelnione połączenie na cały przebieg.
+"""
+import smtplib
+import time
+from email.message import Message
+from typing import Optional
+
+from ..config import Settings
+from ..data_management import get_logger
+
+logger = get_logger(__name__)
+
+# Błędy, po których warto połączyć się ponownie (zerwane połączenie, 421)
+_TRANSIENT_ERRORS = (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, ConnectionError, TimeoutError)
+
+
+class SMTPSession:
+    """
+    Zarządza jednym połączeniem SMTP (STARTTLS + login raz na przebieg).
+    
+    Połączenie jest otwierane leniwie przy pierwszej wiadomości i ponownie
+    nawiązywane w tle, gdy serwer je zerwie.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        max_reconnects: Optional[int] = None
+    ):
+        """
+        Inicjalizacja sesji.
+        
+        Args:
+            host: Serwer SMTP
+            port: Port SMTP
+            username: Login
+            password: Hasło (App Password dla Gmail)
+            use_tls: Czy używać STARTTLS (domyślnie Settings.USE_TLS)
+            timeout: Timeout połączenia (domyślnie Settings.SMTP_TIMEOUT)
+            max_reconnects: Limit ponownych połączeń na wiadomość
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = Settings.USE_TLS if use_tls is None else use_tls
+        self.timeout = timeout or Settings.SMTP_TIMEOUT
+        self.max_reconnects = Settings.SMTP_MAX_RECONNECTS if max_reconnects is None else max_reconnects
+        
+        self.handshakes = 0
+        self.messages_sent = 0
+        self._server: Optional[smtplib.SMTP] = None
+    
+    def __enter__(self):
+        """Context manager enter."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - zamknięcie połączenia."""
+        self.close()
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Nawiązuje połączenie: connect + STARTTLS + login."""
+        start = time.perf_counter()
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        
+        try:
+            if self.use_tls:
+                server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        
+        self.handshakes += 1
+        logger.debug(f"Połączono z SMTP {self.host}:{self.port} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+        return server
+    
+    def send(self, message: Message) -> None:
+        """
+        Wysyła wiadomość istniejącym połączeniem (łączy ponownie po zerwaniu).
+        
+        Args:
+            message: Gotowa wiadomość MIME z nagłówkami From/To
+        
+        Raises:
+            smtplib.SMTPException: Gdy wysyłka nie powiodła się mimo ponownych połączeń
+        """
+        for attempt in range(self.max_reconnects + 1):
+            try:
+                if self._server is None:
+                    self._server = self._connect()
+                
+                self._server.sendmail(message['From'], message['To'], message.as_string())
+                self.messages_sent += 1
+                return
+                
+            except _TRANSIENT_ERRORS as e:
+                self._drop()
+                if attempt >= self.max_reconnects:
+                    raise
+                logger.warning(f"Połączenie SMTP zerwane ({e}) - ponowne łączenie {attempt + 1}/{self.max_reconnects}")
+            
+            except smtplib.SMTPResponseException as e:
+                # 421 = serwer zamyka kanał, pozostałe kody nie są przejściowe
+                self._drop()
+                if e.smtp_code != 421 or attempt >= self.max_reconnects:
+                    raise
+                logger.warning(f"Serwer SMTP zamknął kanał (421) - ponowne łączenie {attempt + 1}/{self.max_reconnects}")
+    
+    def _drop(self) -> None:
+        """Porzuca bieżące połączenie bez QUIT."""
+        if self._server is not None:
+            try:
+                self._server.close()
+            except Exception:
+                pass
+            self._server = None
+    
+    def close(self) -> None:
+        """Zamyka połączenie (QUIT)."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception as e:
+                logger.debug(f"Błąd zamykania SMTP: {e}")
+            finally:
+                self._server = None
+
+
+__all__ = ['SMTPSession']
@@ -6,11 +6,20 @@ from typing import Dict, List, Optional, Any
 import requests
 import json
 import re
+import time
 from ..config import Settings
-from ..data_management import get_logger, cache_manager
+from ..data_management import get_logger, cache_manager, run_log, metrics
+from ..transport import create_session, circuit_breakers, CircuitOpenError
 
 logger = get_logger(__name__)
 
+_requests = metrics.counter("flashscore_requests_total", "Zapytania do Flashscore wg endpointu i wyniku",
+                            ["endpoint", "result"])
+_request_seconds = metrics.histogram("flashscore_request_seconds", "Czas zapytań do Flashscore", ["endpoint"])
+_odds_lookups = metrics.counter("odds_lookups_total",
+                                "Wyniki pobierania kursów (cache/found/not_found/no_odds/breaker_open/error)",
+                                ["result"])
+
 
 class FlashscoreFetcher:
     """Pobieranie kursów bukmacherskich z Flashscore API."""
@@ -19,8 +28,7 @@ class FlashscoreFetcher:
     NORDIC_BET_ID = 37
     
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_session({
             'User-Agent': Settings.USER_AGENT,
             'Accept': '*/*',
             'Accept-Language': 'pl-PL,pl;q=0.9,en;q=0.8',
@@ -28,7 +36,6 @@ class FlashscoreFetcher:
             'Origin': 'https://www.flashscore.pl',
             'X-Fsign': 'SW9D1eZo'  # Flashscore API signature
         })
-        self.base_url = "https://d.flashscore.com/x/feed"
     
     def fetch_odds(self, match_id: str, home_team: str, away_team: str, sport: str = 'football') -> Optional[Dict[str, Any]]:
         """
@@ -43,22 +50,31 @@ class FlashscoreFetcher:
         Returns:
             Słownik z kursami lub None
         """
-        logger.debug(f"Pobieranie kursów Nordic Bet: {home_team} vs {away_team}")
+        logger.debug("Pobieranie kursów Nordic Bet: %s vs %s", home_team, away_team)
         
         # Sprawdź cache
         cache_key = f"odds_{match_id}_nordicbet"
         cached_odds = cache_manager.load(cache_key)
         
         if cached_odds:
-            logger.debug(f"✓ Kursy z cache dla {match_id}")
+            logger.debug("✓ Kursy z cache dla %s", match_id)
+            run_log.annotate(cache='hit')
+            _odds_lookups.inc(result='cache')
             return cached_odds
         
+        run_log.annotate(cache='miss')
+        
+        # Flashscore blokuje/nie odpowiada - bez zapytań do końca cooldownu breakera
+        if circuit_breakers.is_open(Settings.FLASHSCORE_BASE_URL):
+            return self._unavailable(match_id)
+        
         try:
             # Najpierw musimy znaleźć flashscore_id meczu
             flashscore_id = self._search_match(home_team, away_team, sport)
             
             if not flashscore_id:
-                logger.warning(f"Nie znaleziono meczu w Flashscore: {home_team} vs {away_team}")
+                logger.warning("Nie znaleziono meczu w Flashscore: %s vs %s", home_team, away_team)
+                _odds_lookups.inc(result='not_found')
                 return self._empty_odds(match_id)
             
             # Pobierz kursy dla meczu
@@ -69,15 +85,46 @@ class FlashscoreFetcher:
                 
                 # Cache na 30 minut
                 cache_manager.save(cache_key, odds_data, ttl=1800)
+                _odds_lookups.inc(result='found')
                 return odds_data
             else:
-                logger.warning(f"Brak kursów Nordic Bet dla {match_id}")
+                logger.warning("Brak kursów Nordic Bet dla %s", match_id)
+                _odds_lookups.inc(result='no_odds')
                 return self._empty_odds(match_id)
-            
+        
+        except CircuitOpenError:
+            return self._unavailable(match_id)
+        
         except Exception as e:
             logger.error(f"Błąd pobierania kursów: {e}", exc_info=True)
+            _odds_lookups.inc(result='error')
             return self._empty_odds(match_id)
     
+    def _get(self, endpoint: str, url: str) -> requests.Response:
+        """
+        GET do Flashscore z metrykami i licznikiem bajtów.
+        
+        Args:
+            endpoint: Nazwa endpointu do metryk (search/odds)
+            url: Adres zapytania
+        
+        Returns:
+            Odpowiedź HTTP (status 2xx)
+        """
+        start = time.perf_counter()
+        try:
+            response = self.session.get(url, timeout=Settings.FLASHSCORE_TIMEOUT)
+            response.raise_for_status()
+        except Exception:
+            _requests.inc(endpoint=endpoint, result='error')
+            raise
+        finally:
+            _request_seconds.observe(time.perf_counter() - start, endpoint=endpoint)
+        
+        _requests.inc(endpoint=endpoint, result='ok')
+        run_log.add_bytes(len(response.content))
+        return response
+    
     def _search_match(self, home_team: str, away_team: str, sport: str) -> Optional[str]:
         """
         Wyszukuje mecz w Flashscore i zwraca jego ID.
@@ -93,10 +140,9 @@ class FlashscoreFetcher:
         try:
             # Flashscore search endpoint
             search_query = f"{home_team} {away_team}".replace(' ', '%20')
-            search_url = f"https://www.flashscore.pl/wyszukiwanie/?q={search_query}"
+            search_url = f"{Settings.FLASHSCORE_BASE_URL}/wyszukiwanie/?q={search_query}"
             
-            response = self.session.get(search_url, timeout=10)
-            response.raise_for_status()
+            response = self._get('search', search_url)
             
             # Parsuj HTML w poszukiwaniu ID meczu
             # Format: g_1_<match_id> w atrybucie id
@@ -104,11 +150,14 @@ class FlashscoreFetcher:
             
             if match:
                 flashscore_id = match.group(1)
-                logger.debug(f"✓ Znaleziono Flashscore ID: {flashscore_id}")
+                logger.debug("✓ Znaleziono Flashscore ID: %s", flashscore_id)
                 return flashscore_id
             
             return None
-            
+        
+        except CircuitOpenError:
+            raise
+        
         except Exception as e:
             logger.error(f"Błąd wyszukiwania meczu: {e}")
             return None
@@ -126,10 +175,9 @@ class FlashscoreFetcher:
         try:
             # Flashscore odds endpoint
             # Format: /df_od_1_<match_id>_1_eu_1
-            odds_url = f"{self.base_url}/df_od_1_{flashscore_id}_1_eu_1"
+            odds_url = f"{Settings.FLASHSCORE_FEED_URL}/df_od_1_{flashscore_id}_1_eu_1"
             
-            response = self.session.get(odds_url, timeout=10)
-            response.raise_for_status()
+            response = self._get('odds', odds_url)
             
             # Parsuj odpowiedź API Flashscore
             # Format:特殊 format z separatorami ¬ i ~
@@ -151,7 +199,10 @@ class FlashscoreFetcher:
                 }
             
             return None
-            
+        
+        except CircuitOpenError:
+            raise
+        
         except Exception as e:
             logger.error(f"Błąd pobierania kursów z API: {e}")
             return None
@@ -179,7 +230,8 @@ class FlashscoreFetcher:
                     # Znaleziono Nordic Bet, teraz szukaj kursów
                     # Kursy są kilka linii dalej po znaczniku OE
                     for j in range(i, min(i + 20, len(lines))):
-                        if lines[j] == 'OE' or lines[j].startswith('OE'):
+                        # Znacznik rekordu poprzedza '~' ("~OE" lub "<nazwa>~OE")
+                        if lines[j].rsplit('~', 1)[-1].startswith('OE'):
                             # Następne 3 wartości to kursy: home, draw, away
                             try:
                                 home_odd = float(lines[j + 1])
@@ -192,12 +244,12 @@ class FlashscoreFetcher:
                                     'away': away_odd
                                 }
                             except (ValueError, IndexError) as e:
-                                logger.debug(f"Błąd parsowania kursów: {e}")
+                                logger.debug("Błąd parsowania kursów: %s", e)
                                 continue
             
-            logger.debug(f"Nie znaleziono kursów Nordic Bet w danych")
+            logger.debug("Nie znaleziono kursów Nordic Bet w danych")
             return None
-            
+        
         except Exception as e:
             logger.error(f"Błąd parsowania kursów: {e}")
             return None
@@ -215,6 +267,13 @@ class FlashscoreFetcher:
             'away_win': None
         }
     
+    def _unavailable(self, match_id: str) -> Dict[str, Any]:
+        """Puste kursy oznaczone jako niedostępne - breaker Flashscore otwarty."""
+        logger.debug("Kursy niedostępne (breaker open) dla %s", match_id)
+        run_log.annotate(odds='breaker_open')
+        _odds_lookups.inc(result='breaker_open')
+        return {**self._empty_odds(match_id), 'unavailable': 'breaker_open'}
+    
     def close(self):
         """Zamyka sesję."""
         self.session.close()
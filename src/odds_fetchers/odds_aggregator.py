@@ -7,6 +7,15 @@ from ..data_management import get_logger
 
 logger = get_logger(__name__)
 
+_EMPTY_ODDS = {
+    'source': 'flashscore_nordicbet',
+    'bookmaker': 'Nordic Bet',
+    'has_odds': False,
+    'home_win': None,
+    'draw': None,
+    'away_win': None
+}
+
 
 class OddsAggregator:
     """Agreguje kursy z wielu źródeł."""
@@ -30,18 +39,17 @@ class OddsAggregator:
         # Pobierz z Flashscore (Nordic Bet)
         flashscore_odds = self.flashscore.fetch_odds(match_id, home_team, away_team, sport)
         
-        if flashscore_odds and flashscore_odds.get('has_odds'):
+        # Kursy albo informacja o niedostępności źródła (breaker open)
+        if flashscore_odds and (flashscore_odds.get('has_odds') or flashscore_odds.get('unavailable')):
             return flashscore_odds
         
         # Zwróć puste kursy jeśli nie znaleziono
-        return {
-            'source': 'flashscore_nordicbet',
-            'bookmaker': 'Nordic Bet',
-            'has_odds': False,
-            'home_win': None,
-            'draw': None,
-            'away_win': None
-        }
+        return dict(_EMPTY_ODDS)
+    
+    @staticmethod
+    def unavailable(reason: str) -> Dict[str, Any]:
+        """Puste kursy oznaczone jako niepobrane (np. 'deadline' - pominięte przy końcu budżetu czasu)."""
+        return {**_EMPTY_ODDS, 'unavailable': reason}
     
     def close(self):
         self.flashscore.close()
@@ -0,0 +1,4 @@
+"""Inicjalizacja modułu scheduling."""
+from .deadline import RunDeadline, run_deadline, kickoff_time, event_priority, prioritize
+
+__all__ = ["RunDeadline", "run_deadline", "kickoff_time", "event_priority", "prioritize"]
@@ -0,0 +1,162 @@
+"""
+Deadline przebiegu i kolejność analizy zdarzeń.
+
+Budżet RUN_TIME_BUDGET liczony jest od startu przebiegu; DEADLINE_RESERVE sekund
+zostaje na wysyłkę powiadomień. Gdy pozostały czas (ponad rezerwę) spada poniżej
+progu z DEADLINE_SKIP_INPUTS, opcjonalne dane są pomijane:
+    form  - bez stron meczów, forma z magazynu historii (jeśli jest)
+    h2h   - bez stron meczów, H2H z indeksu par (jeśli jest)
+    odds  - bez zapytań do Flashscore, kursy oznaczone "pominięte (limit czasu)"
+Po wyczerpaniu budżetu kolejne sporty są pomijane, a zakwalifikowane zdarzenia
+wysyłane. Zdarzenia wszystkich sportów analizowane są w jednej kolejce - od
+najbliższego rozpoczęcia i najwyższej przewagi - więc degradacja dotyka
+najpierw tych najmniej pilnych, niezależnie od kolejności sportów.
+"""
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config import Settings
+from ..data_management import get_logger, metrics
+
+logger = get_logger(__name__)
+
+_skipped = metrics.counter("deadline_skipped_total", "Pominięte opcjonalne dane i sporty przy zbliżającym się deadline",
+                           ["input"])
+_remaining = metrics.gauge("run_time_budget_remaining_seconds", "Pozostały budżet czasu na końcu przebiegu")
+
+_DATE_ISO = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_DATE_EU = re.compile(r'(\d{1,2})[/.](\d{1,2})[/.](\d{4})')
+_TIME = re.compile(r'(\d{1,2}):(\d{2})')
+
+
+def kickoff_time(event: Dict[str, Any], now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Czas rozpoczęcia z pola match_time zdarzenia.
+    
+    Obsługuje formaty listingu ("20:45", "19/10/2026 20:45") i JSON XHR ("2026-10-19 20:45:00");
+    sama godzina oznacza dzień przebiegu.
+    
+    Args:
+        event: Zdarzenie z listingu
+        now: Bieżący czas (domyślnie datetime.now())
+    
+    Returns:
+        Czas rozpoczęcia lub None gdy brak/nieczytelny
+    """
+    text = str(event.get('match_time') or '')
+    clock = _TIME.search(text)
+    if not clock:
+        return None
+    
+    now = now or datetime.now()
+    iso, eu = _DATE_ISO.search(text), _DATE_EU.search(text)
+    try:
+        if iso:
+            year, month, day = (int(part) for part in iso.groups())
+        elif eu:
+            day, month, year = (int(part) for part in eu.groups())
+        else:
+            year, month, day = now.year, now.month, now.day
+        return datetime(year, month, day, int(clock.group(1)), int(clock.group(2)))
+    except ValueError:
+        return None
+
+
+def event_priority(event: Dict[str, Any], now: Optional[datetime] = None) -> Tuple:
+    """
+    Klucz sortowania: nadchodzące od najbliższego rozpoczęcia, potem bez godziny,
+    na końcu już rozpoczęte; przy remisie wyższa przewaga (probabilities.max) pierwsza.
+    """
+    now = now or datetime.now()
+    kickoff = kickoff_time(event, now)
+    strength = -event.get('probabilities', {}).get('max', 0)
+    if kickoff is None:
+        return 1, 0.0, strength
+    if kickoff < now:
+        return 2, (now - kickoff).total_seconds(), strength
+    return 0, (kickoff - now).total_seconds(), strength
+
+
+def prioritize(events: List[Dict[str, Any]], now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Zdarzenia w kolejności analizy (event_priority)."""
+    now = now or datetime.now()
+    return sorted(events, key=lambda event: event_priority(event, now))
+
+
+class RunDeadline:
+    """Budżet czasu przebiegu i decyzje o pomijaniu opcjonalnych danych."""
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            clock: Zegar monotoniczny (podmieniany w testach)
+        """
+        self.clock = clock
+        self.budget = 0.0
+        self.started_at: Optional[float] = None
+        self.skipped: Counter = Counter()
+        self._lock = threading.Lock()
+    
+    def start(self, budget: Optional[float] = None):
+        """
+        Rozpoczyna odliczanie (nowy przebieg).
+        
+        Args:
+            budget: Budżet w sekundach (domyślnie Settings.RUN_TIME_BUDGET; 0 = bez limitu)
+        """
+        with self._lock:
+            self.budget = float(Settings.RUN_TIME_BUDGET if budget is None else budget)
+            self.started_at = self.clock()
+            self.skipped.clear()
+        if self.budget:
+            logger.info(f"⏳ Budżet czasu przebiegu: {self.budget:.0f}s (rezerwa na wysyłkę {Settings.DEADLINE_RESERVE}s)")
+    
+    def remaining(self) -> float:
+        """Sekundy do deadline (bez rezerwy); inf gdy brak limitu lub odliczanie nie ruszyło."""
+        if not self.budget or self.started_at is None:
+            return float('inf')
+        return self.budget - (self.clock() - self.started_at)
+    
+    @property
+    def expired(self) -> bool:
+        """Budżet wyczerpany - została tylko rezerwa na wysyłkę."""
+        return self.remaining() <= Settings.DEADLINE_RESERVE
+    
+    def allows(self, name: str) -> bool:
+        """
+        Czy jest czas na opcjonalne dane lub kolejny sport (pominięcie jest zliczane).
+        
+        Args:
+            name: Klucz z DEADLINE_SKIP_INPUTS (form/h2h/odds) lub 'sport' (tylko wyczerpany budżet)
+        """
+        margin = Settings.DEADLINE_SKIP_INPUTS.get(name, 0)
+        if self.remaining() - Settings.DEADLINE_RESERVE > margin:
+            return True
+        
+        with self._lock:
+            self.skipped[name] += 1
+            first = self.skipped[name] == 1
+        _skipped.inc(input=name)
+        if first:
+            logger.warning(f"⏳ Zbliża się deadline ({max(0.0, self.remaining()):.0f}s) - pomijam: {name}")
+        return False
+    
+    def format_summary(self) -> List[str]:
+        """Linia podsumowania do logu (pusta lista gdy przebieg bez limitu)."""
+        if not self.budget or self.started_at is None:
+            return []
+        remaining = self.remaining()
+        _remaining.set(round(remaining, 3))
+        skipped = ", ".join(f"{name} {count}" for name, count in sorted(self.skipped.items())) or "nic"
+        return [f"⏳ Budżet czasu: zużyto {self.budget - remaining:.0f}s z {self.budget:.0f}s - pominięto: {skipped}"]
+
+
+# Globalny singleton
+run_deadline = RunDeadline()
+
+
+__all__ = ['RunDeadline', 'run_deadline', 'kickoff_time', 'event_priority', 'prioritize']
@@ -0,0 +1,107 @@
+"""
+Cykl życia WebDrivera w długich przebiegach: restart po limicie stron lub pamięci.
+
+Chrome prowadzony przez setki stron meczów rośnie w pamięci i zwalnia. BrowserManager
+przed każdym ładowaniem strony sprawdza liczbę stron obsłużonych przez bieżący
+proces i RSS drzewa procesów przeglądarki (browser_profile.browser_rss_bytes);
+po przekroczeniu Settings.BROWSER_MAX_PAGES lub Settings.BROWSER_MAX_RSS_MB
+zamyka przeglądarkę i uruchamia nową - przezroczyście dla scrapera.
+
+Przykład:
+    browser = BrowserManager(start_driver)
+    driver = browser.page()   # przed każdym driver.get
+    driver.get(url)
+"""
+import threading
+from typing import Any, Callable, Optional
+
+from ..config import Settings
+from ..data_management import get_logger, run_log, metrics
+from .browser_profile import browser_rss_bytes
+
+logger = get_logger(__name__)
+
+_restarts = metrics.counter("browser_restarts_total", "Restarty przeglądarki wg powodu", ["reason"])
+_rss = metrics.gauge("browser_rss_bytes", "RSS drzewa procesów przeglądarki przy ostatnim sprawdzeniu")
+_pages = metrics.histogram("browser_pages_per_process", "Strony obsłużone przez jeden proces przeglądarki")
+
+
+class BrowserManager:
+    """Leniwie uruchamiany WebDriver, restartowany po limicie stron lub RSS."""
+    
+    def __init__(self, factory: Callable[[], Any], max_pages: Optional[int] = None,
+                 max_rss_mb: Optional[float] = None, rss: Callable[[Any], int] = browser_rss_bytes):
+        """
+        Args:
+            factory: Tworzy skonfigurowany WebDriver
+            max_pages: Limit stron na proces (domyślnie Settings.BROWSER_MAX_PAGES, 0 = bez limitu)
+            max_rss_mb: Limit RSS w MB (domyślnie Settings.BROWSER_MAX_RSS_MB, 0 = bez limitu)
+            rss: Pomiar RSS przeglądarki w bajtach
+        """
+        self.factory = factory
+        self.max_pages = Settings.BROWSER_MAX_PAGES if max_pages is None else max_pages
+        self.max_rss_mb = Settings.BROWSER_MAX_RSS_MB if max_rss_mb is None else max_rss_mb
+        self.rss = rss
+        self.current = None
+        self.pages = 0
+        self.restarts = 0
+        self._lock = threading.Lock()
+    
+    def ensure(self):
+        """Zwraca działający WebDriver (uruchamia go przy pierwszym użyciu)."""
+        if self.current is None:
+            self.current = self.factory()
+            self.pages = 0
+        return self.current
+    
+    def _recycle_reason(self) -> Optional[str]:
+        """Powód restartu przed kolejną stroną (None gdy przeglądarka może działać dalej)."""
+        if self.max_pages and self.pages >= self.max_pages:
+            return 'pages'
+        if self.max_rss_mb:
+            rss = self.rss(self.current)
+            _rss.set(rss)
+            if rss > self.max_rss_mb * 1024 * 1024:
+                return 'rss'
+        return None
+    
+    def page(self):
+        """
+        WebDriver do załadowania kolejnej strony (po restarcie, jeśli przekroczono limity).
+        
+        Returns:
+            WebDriver
+        """
+        with self._lock:
+            if self.current is not None:
+                reason = self._recycle_reason()
+                if reason:
+                    self.restart(reason)
+            driver = self.ensure()
+            self.pages += 1
+            return driver
+    
+    def restart(self, reason: str):
+        """Zamyka bieżącą przeglądarkę; nowa startuje przy następnej stronie."""
+        logger.info(f"♻️  Restart przeglądarki ({reason}) po {self.pages} stronach")
+        _restarts.inc(reason=reason)
+        run_log.annotate(browser_restart=reason)
+        self.restarts += 1
+        self.quit()
+    
+    def quit(self):
+        """Zamyka przeglądarkę (bezpieczne, gdy nie działa)."""
+        if self.current is None:
+            return
+        _pages.observe(self.pages)
+        try:
+            self.current.quit()
+            logger.debug("WebDriver zamknięty")
+        except Exception as e:
+            logger.error(f"Błąd zamykania WebDriver: {e}")
+        finally:
+            self.current = None
+            self.pages = 0
+
+
+__all__ = ['BrowserManager']
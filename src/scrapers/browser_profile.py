@@ -0,0 +1,139 @@
+"""
+Profil przeglądarki Chrome dla Selenium: pełny lub lekki (tylko tekst DOM).
+
+Lekki profil (Settings.BROWSER_LEAN_PROFILE):
+    - strategia ładowania `eager` (DOMContentLoaded, bez czekania na obrazy i ramki)
+    - brak obrazów, powiadomień i rozszerzeń, mniejsze okno
+    - blokada URL przez CDP Network.setBlockedURLs (obrazy, media, fonty, reklamy, trackery)
+
+Przy Settings.LISTING_SOURCE innym niż dom włączany jest log wydajności
+(goog:loggingPrefs), z którego xhr_capture odczytuje odpowiedzi JSON.
+
+Pamięć przeglądarki (RSS całego drzewa procesów chromedriver → Chrome) jest
+czytana z /proc, bez dodatkowych zależności.
+"""
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from ..config import Settings
+from ..data_management import get_logger
+
+logger = get_logger(__name__)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def chrome_options(lean: Optional[bool] = None) -> Options:
+    """
+    Opcje Chrome dla scrapera.
+    
+    Args:
+        lean: Lekki profil (domyślnie Settings.BROWSER_LEAN_PROFILE)
+    
+    Returns:
+        Skonfigurowane Options
+    """
+    lean = Settings.BROWSER_LEAN_PROFILE if lean is None else lean
+    options = Options()
+    
+    if Settings.HEADLESS_BROWSER:
+        options.add_argument('--headless')
+    
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-gpu')
+    options.add_argument(f'user-agent={Settings.USER_AGENT}')
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    
+    if Settings.LISTING_SOURCE != 'dom':
+        # Log wydajności z zdarzeniami Network.* - przechwytywanie XHR (xhr_capture)
+        options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    
+    if not lean:
+        options.add_argument('--window-size=1920,1080')
+        return options
+    
+    options.page_load_strategy = 'eager'
+    options.add_argument('--window-size=1280,800')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--blink-settings=imagesEnabled=false')
+    options.add_argument('--mute-audio')
+    options.add_argument('--disable-background-networking')
+    options.add_argument('--disable-component-update')
+    options.add_argument('--disable-default-apps')
+    options.add_argument('--disable-sync')
+    options.add_argument('--no-first-run')
+    options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+        'profile.default_content_setting_values.geolocation': 2,
+        'profile.default_content_setting_values.media_stream': 2,
+    })
+    return options
+
+
+def block_resources(driver, patterns: Optional[List[str]] = None) -> bool:
+    """
+    Blokuje pobieranie zasobów zbędnych do odczytu DOM (CDP Network.setBlockedURLs).
+    
+    Args:
+        driver: WebDriver Chrome
+        patterns: Wzorce URL (domyślnie Settings.BROWSER_BLOCKED_URLS)
+    
+    Returns:
+        True jeśli blokada została włączona
+    """
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns or Settings.BROWSER_BLOCKED_URLS})
+        return True
+    except (WebDriverException, AttributeError) as e:
+        logger.warning(f"⚠️  Blokada zasobów CDP niedostępna: {e}")
+        return False
+
+
+def _children(pid: int) -> List[int]:
+    """Procesy potomne (z /proc/<pid>/task/*/children)."""
+    children = []
+    for task in Path(f"/proc/{pid}/task").glob("*"):
+        try:
+            children.extend(int(child) for child in (task / "children").read_text().split())
+        except OSError:
+            continue
+    return children
+
+
+def process_tree_rss(pid: int) -> int:
+    """
+    RSS procesu i wszystkich jego potomków w bajtach (0 gdy /proc niedostępny).
+    
+    Args:
+        pid: PID korzenia drzewa (np. chromedriver)
+    """
+    total = 0
+    stack, seen = [pid], set()
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        try:
+            total += int(Path(f"/proc/{current}/statm").read_text().split()[1]) * _PAGE_SIZE
+        except (OSError, IndexError, ValueError):
+            continue
+        stack.extend(_children(current))
+    return total
+
+
+def browser_rss_bytes(driver) -> int:
+    """RSS przeglądarki sterowanej przez driver (chromedriver + Chrome + renderery)."""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    pid = getattr(process, 'pid', None)
+    return process_tree_rss(pid) if pid else 0
+
+
+__all__ = ['chrome_options', 'block_resources', 'process_tree_rss', 'browser_rss_bytes']
@@ -10,17 +10,33 @@ import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.webdriver import WebDriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException
-from tenacity import retry, stop_after_attempt, wait_exponential
+from selenium.common.exceptions import InvalidSessionIdException, WebDriverException
 
 from ..config import Settings, Sport
-from ..data_management import get_logger, cache_manager
+from ..data_management import get_logger, get_hot_logger, cache_manager, run_log, metrics
+from ..transport import create_session, rate_limiter, retry_policy, circuit_breakers
+from .browser_manager import BrowserManager
+from .browser_profile import chrome_options, block_resources
+from .page_readiness import wait_until_ready
+from .xhr_capture import (
+    capture_json_responses, drain_performance_log, events_from_captured, is_stale, parse_prediction_payload,
+    xhr_endpoints
+)
 
 logger = get_logger(__name__)
+hot_logger = get_hot_logger(__name__)
+
+_listing_fetches = metrics.counter("listing_fetches_total", "Pobrania listingów wg sportu i źródła (cache/network)",
+                                   ["sport", "source"])
+_listing_seconds = metrics.histogram("listing_fetch_seconds", "Czas pobrania i parsowania listingu z sieci",
+                                     ["sport"])
+_events_parsed = metrics.counter("events_parsed_total", "Zdarzenia sparsowane z listingów", ["sport"])
+_rows_skipped = metrics.counter("listing_rows_skipped_total", "Wiersze listingu pominięte (brak danych/błąd)",
+                                ["sport"])
+_listing_sources = metrics.counter("listing_source_total",
+                                  "Źródło danych listingu (xhr_replay/xhr_capture/dom)", ["sport", "source"])
+_form_pages = metrics.counter("form_pages_total", "Pobrania stron meczów z formą wg wyniku", ["result"])
+_form_page_seconds = metrics.histogram("form_page_seconds", "Czas pobrania i parsowania strony formy")
 
 
 class ForebtScraper:
@@ -34,15 +50,24 @@ class ForebtScraper:
             use_selenium: Czy używać Selenium (dla dynamicznego JS)
         """
         self.use_selenium = use_selenium
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.session = create_session({
             'User-Agent': Settings.USER_AGENT,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'pl-PL,pl;q=0.9,en;q=0.8',
             'Accept-Encoding': 'gzip, deflate, br',
             'Connection': 'keep-alive',
         })
-        self.driver: Optional[WebDriver] = None
+        # WebDriver uruchamiany leniwie, restartowany po limicie stron/RSS (BrowserManager)
+        self.browser = BrowserManager(self._start_driver)
+    
+    @property
+    def driver(self) -> Optional[WebDriver]:
+        """Bieżący WebDriver (None gdy przeglądarka nie działa)."""
+        return self.browser.current
+    
+    @driver.setter
+    def driver(self, driver: Optional[WebDriver]):
+        self.browser.current = driver
     
     def __enter__(self):
         """Context manager enter."""
@@ -52,53 +77,40 @@ class ForebtScraper:
         """Context manager exit - cleanup."""
         self.close()
     
-    def _init_driver(self):
-        """Inicjalizuje WebDriver Selenium."""
-        if self.driver:
-            return
-        
+    def _start_driver(self) -> WebDriver:
+        """Uruchamia i konfiguruje WebDriver Selenium (fabryka dla BrowserManager)."""
         try:
-            chrome_options = Options()
-            
-            if Settings.HEADLESS_BROWSER:
-                chrome_options.add_argument('--headless')
+            driver = webdriver.Chrome(options=chrome_options())
+            driver.implicitly_wait(Settings.IMPLICIT_WAIT)
+            driver.set_page_load_timeout(Settings.PAGE_LOAD_TIMEOUT)
             
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument(f'user-agent={Settings.USER_AGENT}')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
-            self.driver.implicitly_wait(Settings.IMPLICIT_WAIT)
-            self.driver.set_page_load_timeout(Settings.PAGE_LOAD_TIMEOUT)
-            
-            logger.info("✓ WebDriver Selenium zainicjalizowany")
+            if Settings.BROWSER_LEAN_PROFILE:
+                block_resources(driver)
             
+            logger.info("✓ WebDriver Selenium zainicjalizowany (profil: %s)",
+                        "lekki" if Settings.BROWSER_LEAN_PROFILE else "pełny")
+            return driver
+        
         except Exception as e:
             logger.error(f"Błąd inicjalizacji WebDriver: {e}")
             raise
     
+    def _init_driver(self):
+        """Inicjalizuje WebDriver Selenium (jeśli jeszcze nie działa)."""
+        self.browser.ensure()
+    
     def close(self):
         """Zamyka połączenia i cleanup."""
-        if self.driver:
-            try:
-                self.driver.quit()
-                logger.debug("WebDriver zamknięty")
-            except Exception as e:
-                logger.error(f"Błąd zamykania WebDriver: {e}")
-            finally:
-                self.driver = None
-        
+        self.browser.quit()
         self.session.close()
     
-    @retry(stop=stop_after_attempt(Settings.MAX_RETRIES), 
-           wait=wait_exponential(multiplier=1, min=Settings.RETRY_DELAY, max=60))
     def fetch_events_by_sport(self, sport: Sport) -> List[Dict[str, Any]]:
         """
         Pobiera wszystkie zdarzenia dla danego sportu.
         
+        Błędy przejściowe są ponawiane na poziomie pojedynczego zapytania/strony
+        (retry_policy); pozostałe błędy (np. parsowania) są zgłaszane od razu.
+        
         Args:
             sport: Sport do pobrania
         
@@ -113,15 +125,25 @@ class ForebtScraper:
         
         if cached_events:
             logger.info(f"✓ Znaleziono w cache: {len(cached_events)} zdarzeń")
+            run_log.annotate(cache='hit', events=len(cached_events))
+            _listing_fetches.inc(sport=sport.value, source='cache')
             return cached_events
         
+        run_log.annotate(cache='miss')
+        _listing_fetches.inc(sport=sport.value, source='network')
+        
         try:
             url = Settings.get_sport_url(sport)
             
-            if self.use_selenium:
-                events = self._fetch_with_selenium(url, sport)
-            else:
-                events = self._fetch_with_requests(url, sport)
+            with _listing_seconds.time(sport=sport.value):
+                # Najpierw dane JSON z odkrytych endpointów XHR, potem przeglądarka / HTML
+                events = self._fetch_from_xhr_endpoints(url, sport) if Settings.LISTING_SOURCE != 'dom' else []
+                if not events and self.use_selenium:
+                    events = self._fetch_with_selenium(url, sport)
+                elif not events and Settings.LISTING_SOURCE != 'xhr':
+                    events = self._fetch_with_requests(url, sport)
+            
+            run_log.annotate(events=len(events))
             
             # Zapisz do cache
             if events:
@@ -130,43 +152,135 @@ class ForebtScraper:
             else:
                 logger.warning(f"⚠️  Brak zdarzeń dla {sport.value}")
             
-            # Rate limiting
-            time.sleep(Settings.REQUEST_DELAY)
-            
             return events
-            
+        
         except Exception as e:
             logger.error(f"Błąd pobierania zdarzeń {sport.value}: {e}")
             raise
     
+    def _fetch_from_xhr_endpoints(self, url: str, sport: Sport) -> List[Dict[str, Any]]:
+        """
+        Pobiera zdarzenia bezpośrednio z odkrytych wcześniej endpointów XHR (bez przeglądarki i HTML).
+        
+        Args:
+            url: Adres listingu (Referer i baza względnych linków)
+            sport: Sport
+        
+        Returns:
+            Lista zdarzeń (pusta gdy brak endpointów lub nie zwróciły danych)
+        """
+        endpoints = xhr_endpoints.get(sport)
+        events = []
+        for endpoint in endpoints:
+            try:
+                response = self.session.get(endpoint, timeout=Settings.FOREBET_TIMEOUT, headers={
+                    'Accept': 'application/json, text/javascript, */*; q=0.01',
+                    'X-Requested-With': 'XMLHttpRequest',
+                    'Referer': requests.utils.requote_uri(url),
+                })
+                response.raise_for_status()
+                run_log.add_bytes(len(response.content))
+                with run_log.stage('parse', sport=sport.value):
+                    parsed = parse_prediction_payload(response.json(), sport, url)
+                if is_stale(parsed):
+                    logger.warning(f"⚠️  Endpoint XHR {endpoint} zwraca nieaktualne prognozy - pomijam")
+                    continue
+                events.extend(parsed)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning(f"⚠️  Endpoint XHR {endpoint} niedostępny: {e}")
+        
+        if events:
+            _listing_sources.inc(sport=sport.value, source='xhr_replay')
+            run_log.annotate(listing_source='xhr_replay')
+            logger.info(f"📡 {sport.value}: {len(events)} zdarzeń z endpointów XHR (bez renderowania)")
+        elif endpoints:
+            # Endpointy przestały zwracać prognozy - odkrywamy je ponownie w przeglądarce
+            xhr_endpoints.forget(sport)
+        return events
+    
     def _fetch_with_requests(self, url: str, sport: Sport) -> List[Dict[str, Any]]:
         """Pobiera zdarzenia używając requests (statyczny HTML)."""
         response = self.session.get(url, timeout=Settings.FOREBET_TIMEOUT)
         response.raise_for_status()
+        run_log.add_bytes(len(response.content))
         
-        soup = BeautifulSoup(response.content, 'lxml')
-        return self._parse_events(soup, sport)
+        _listing_sources.inc(sport=sport.value, source='dom')
+        with run_log.stage('parse', sport=sport.value):
+            soup = BeautifulSoup(response.content, 'lxml')
+            return self._parse_events(soup, sport)
+    
+    def _load_page(self, url: str, page: str) -> WebDriver:
+        """
+        Ładuje stronę w przeglądarce i czeka na gotowość.
+        
+        Błędy przejściowe są ponawiane (retry_policy), a wynik trafia do breakera hosta.
+        Log wydajności jest opróżniany przed ładowaniem - przy listingu zostają w nim
+        tylko odpowiedzi XHR tej strony.
+        
+        Args:
+            url: Adres strony
+            page: Typ strony dla wait_until_ready (listing, match)
+        
+        Returns:
+            WebDriver z załadowaną stroną
+        """
+        def load() -> WebDriver:
+            driver = self.browser.page()
+            circuit_breakers.before(url)
+            rate_limiter.acquire(url)
+            if Settings.LISTING_SOURCE != 'dom':
+                drain_performance_log(driver)
+            try:
+                driver.get(url)
+            except InvalidSessionIdException:
+                # Przeglądarka padła - kolejna próba dostanie nową
+                circuit_breakers.after(url, ok=False)
+                self.browser.restart('crash')
+                raise
+            except WebDriverException:
+                circuit_breakers.after(url, ok=False)
+                raise
+            circuit_breakers.after(url, ok=True)
+            wait_until_ready(driver, page)
+            return driver
+        
+        return retry_policy.call(load, url)
     
     def _fetch_with_selenium(self, url: str, sport: Sport) -> List[Dict[str, Any]]:
         """Pobiera zdarzenia używając Selenium (dynamiczny JS)."""
-        self._init_driver()
+        # Czeka aż tabela prognoz przestanie rosnąć (wiersze dorysowywane przez JS)
+        driver = self._load_page(url, 'listing')
         
-        if not self.driver:
-            raise RuntimeError("WebDriver nie został zainicjalizowany")
+        if Settings.LISTING_SOURCE != 'dom':
+            events = self._events_from_xhr_capture(url, sport)
+            if events or Settings.LISTING_SOURCE == 'xhr':
+                return events
         
-        self.driver.get(url)
+        page_source = driver.page_source
+        run_log.add_bytes(len(page_source.encode('utf-8')))
+        _listing_sources.inc(sport=sport.value, source='dom')
         
-        # Czekaj na załadowanie tabeli z prognozami
+        with run_log.stage('parse', sport=sport.value):
+            soup = BeautifulSoup(page_source, 'lxml')
+            return self._parse_events(soup, sport)
+    
+    def _events_from_xhr_capture(self, url: str, sport: Sport) -> List[Dict[str, Any]]:
+        """Zdarzenia z odpowiedzi JSON przechwyconych przy ładowaniu listingu (zapamiętuje endpointy)."""
         try:
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".schema, .rcnt, tr[data-tid]"))
-            )
-            time.sleep(2)  # Dodatkowy czas na JS
-        except TimeoutException:
-            logger.warning(f"Timeout czekania na elementy dla {sport.value}")
-        
-        soup = BeautifulSoup(self.driver.page_source, 'lxml')
-        return self._parse_events(soup, sport)
+            captured = capture_json_responses(self.driver, document_urls=(url, self.driver.current_url))
+        except WebDriverException as e:
+            logger.warning(f"⚠️  Log wydajności Chrome niedostępny - parsowanie DOM: {e.msg}")
+            return []
+        
+        with run_log.stage('parse', sport=sport.value):
+            events, sources = events_from_captured(captured, sport, url)
+        
+        if events:
+            xhr_endpoints.remember(sport, sources)
+            _listing_sources.inc(sport=sport.value, source='xhr_capture')
+            run_log.annotate(listing_source='xhr_capture')
+            logger.info(f"📡 {sport.value}: {len(events)} zdarzeń z przechwyconych XHR ({len(sources)} endpointów)")
+        return events
     
     def _parse_events(self, soup: BeautifulSoup, sport: Sport) -> List[Dict[str, Any]]:
         """
@@ -187,25 +301,25 @@ class ForebtScraper:
         # Metoda 1: data-tid attribute
         match_rows = soup.find_all('tr', attrs={'data-tid': True})
         if match_rows:
-            logger.debug(f"Znaleziono {len(match_rows)} meczów (data-tid)")
+            logger.debug("Znaleziono %d meczów (data-tid)", len(match_rows))
         
         # Metoda 2: klasa rcnt
         if not match_rows:
             match_rows = soup.find_all('div', class_='rcnt')
             if match_rows:
-                logger.debug(f"Znaleziono {len(match_rows)} meczów (rcnt)")
+                logger.debug("Znaleziono %d meczów (rcnt)", len(match_rows))
         
         # Metoda 3: tabela z prognozami
         if not match_rows:
             match_rows = soup.select('table.table tr')
             if match_rows:
-                logger.debug(f"Znaleziono {len(match_rows)} wierszy tabeli")
+                logger.debug("Znaleziono %d wierszy tabeli", len(match_rows))
         
         # Metoda 4: ogólne wiersze z meczami
         if not match_rows:
             match_rows = soup.select('div[class*="match"], tr[class*="match"]')
             if match_rows:
-                logger.debug(f"Znaleziono {len(match_rows)} elementów match")
+                logger.debug("Znaleziono %d elementów match", len(match_rows))
         
         if not match_rows:
             logger.warning(f"⚠️  Brak elementów meczów w HTML dla {sport.value}")
@@ -216,20 +330,29 @@ class ForebtScraper:
             logger.info(f"📝 HTML zapisany do: {debug_file}")
             return []
         
-        logger.debug(f"Parsowanie {len(match_rows)} wierszy...")
+        total = len(match_rows)
+        logger.debug("Parsowanie %d wierszy...", total)
+        
+        # Logi per-wiersz: jedno sprawdzenie poziomu na listing, argumenty tylko gdy DEBUG
+        debug_rows = hot_logger.enabled()
         
         for i, row in enumerate(match_rows, 1):
             try:
                 event_data = self._parse_single_event(row, sport)
                 if event_data:
                     events.append(event_data)
-                    logger.debug(f"  [{i}/{len(match_rows)}] ✅ {event_data.get('home_team')} vs {event_data.get('away_team')}")
-                else:
-                    logger.debug(f"  [{i}/{len(match_rows)}] ❌ Pomięto (brak danych)")
+                    if debug_rows:
+                        hot_logger.sampled(i, "  [%d/%d] ✅ %s vs %s", i, total,
+                                           event_data['home_team'], event_data['away_team'])
+                elif debug_rows:
+                    hot_logger.sampled(i, "  [%d/%d] ❌ Pomięto (brak danych)", i, total)
             except Exception as e:
-                logger.debug(f"  [{i}/{len(match_rows)}] ❌ Błąd: {e}")
+                if debug_rows:
+                    hot_logger.sampled(i, "  [%d/%d] ❌ Błąd: %s", i, total, e)
                 continue
         
+        _events_parsed.inc(len(events), sport=sport.value)
+        _rows_skipped.inc(total - len(events), sport=sport.value)
         logger.info(f"✅ Poprawnie sparsowano {len(events)} zdarzeń z {len(match_rows)} wierszy")
         return events
     
@@ -278,9 +401,9 @@ class ForebtScraper:
                 'match_time': match_time,
                 'scraped_at': datetime.now().isoformat(),
             }
-            
+        
         except Exception as e:
-            logger.debug(f"Błąd parsowania pojedynczego zdarzenia: {e}")
+            logger.debug("Błąd parsowania pojedynczego zdarzenia: %s", e)
             return None
     
     def _extract_teams(self, element) -> Optional[Dict[str, str]]:
@@ -322,9 +445,9 @@ class ForebtScraper:
                     return {'home': home, 'away': away}
             
             return None
-            
+        
         except Exception as e:
-            logger.debug(f"Błąd ekstraktowania drużyn: {e}")
+            logger.debug("Błąd ekstraktowania drużyn: %s", e)
             return None
     
     def _extract_probabilities(self, element) -> Optional[Dict[str, Any]]:
@@ -387,9 +510,9 @@ class ForebtScraper:
                     }
             
             return None
-            
+        
         except Exception as e:
-            logger.debug(f"Błąd ekstraktowania prawdopodobieństw: {e}")
+            logger.debug("Błąd ekstraktowania prawdopodobieństw: %s", e)
             return None
     
     def _extract_match_url(self, element) -> Optional[str]:
@@ -408,9 +531,9 @@ class ForebtScraper:
                 return href
             
             return None
-            
+        
         except Exception as e:
-            logger.debug(f"Błąd ekstraktowania URL meczu: {e}")
+            logger.debug("Błąd ekstraktowania URL meczu: %s", e)
             return None
     
     def _extract_league(self, element) -> Optional[str]:
@@ -423,7 +546,7 @@ class ForebtScraper:
                 return league_elem.get('title')
             
             return "Unknown League"
-            
+        
         except Exception:
             return "Unknown League"
     
@@ -437,7 +560,7 @@ class ForebtScraper:
                 return time_elem.get_text(strip=True)
             
             return None
-            
+        
         except Exception:
             return None
     
@@ -466,55 +589,79 @@ class ForebtScraper:
         if not match_url:
             return {'home_form': [], 'away_form': []}
         
+        start = time.perf_counter()
         try:
-            logger.debug(f"Pobieranie formy z: {match_url}")
+            logger.debug("Pobieranie formy z: %s", match_url)
             
-            # Użyj Selenium jeśli dostępny
-            if self.use_selenium and self.driver:
-                self.driver.get(match_url)
-                time.sleep(2)  # Poczekaj na JS
-                soup = BeautifulSoup(self.driver.page_source, 'lxml')
+            # Użyj Selenium (WebDriver uruchamiany leniwie, restartowany po limicie stron/RSS)
+            if self.use_selenium:
+                # Sekcje formy/H2H renderowane przez JS (albo bezczynna sieć, gdy strona ich nie ma)
+                driver = self._load_page(match_url, 'match')
+                page_source = driver.page_source
+                run_log.add_bytes(len(page_source.encode('utf-8')))
+                soup = BeautifulSoup(page_source, 'lxml')
             else:
                 response = self.session.get(match_url, timeout=Settings.FOREBET_TIMEOUT)
                 response.raise_for_status()
+                run_log.add_bytes(len(response.content))
                 soup = BeautifulSoup(response.content, 'lxml')
             
-            # Szukaj sekcji z ostatnimi meczami (form)
-            # Forebet często ma tabele z klasą "table_match_info" lub "form"
-            form_sections = soup.find_all('div', class_=re.compile(r'.*(form|last.*match).*', re.I))
-            
-            home_matches = []
-            away_matches = []
-            
-            # Parsuj form dla każdej drużyny
-            for section in form_sections:
-                matches = self._parse_form_section(section)
-                
-                # Pierwsza sekcja = gospodarze, druga = goście
-                if not home_matches:
-                    home_matches = matches
-                elif not away_matches:
-                    away_matches = matches
-                    break
-            
-            # Jeśli nie znaleziono w sekcjach, szukaj tabel z wynikami
-            if not home_matches or not away_matches:
-                result_tables = soup.find_all('table', class_=re.compile(r'.*(result|form).*', re.I))
-                
-                if len(result_tables) >= 2:
-                    home_matches = self._parse_results_table(result_tables[0])
-                    away_matches = self._parse_results_table(result_tables[1])
-            
-            logger.debug(f"Forma: gospodarze={len(home_matches)} meczów, goście={len(away_matches)} meczów")
+            form = self._parse_team_form(soup)
             
-            return {
-                'home_form': home_matches[:6],  # Ostatnie 6 meczów
-                'away_form': away_matches[:6]
-            }
+            logger.debug("Forma: gospodarze=%d meczów, goście=%d meczów",
+                         len(form['home_form']), len(form['away_form']))
+            _form_pages.inc(result='ok')
             
+            return form
+        
         except Exception as e:
             logger.warning(f"Błąd pobierania formy: {e}")
+            _form_pages.inc(result='error')
             return {'home_form': [], 'away_form': []}
+        
+        finally:
+            _form_page_seconds.observe(time.perf_counter() - start)
+    
+    def _parse_team_form(self, soup: BeautifulSoup) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parsuje formę obu drużyn ze strony szczegółów meczu.
+        
+        Args:
+            soup: BeautifulSoup strony meczu
+        
+        Returns:
+            Słownik z formą obu drużyn {'home_form': [...], 'away_form': [...]}
+        """
+        # Szukaj sekcji z ostatnimi meczami (form)
+        # Forebet często ma tabele z klasą "table_match_info" lub "form"
+        form_sections = soup.find_all('div', class_=re.compile(r'.*(form|last.*match).*', re.I))
+        
+        home_matches = []
+        away_matches = []
+        
+        # Parsuj form dla każdej drużyny
+        for section in form_sections:
+            matches = self._parse_form_section(section)
+            
+            # Pierwsza sekcja = gospodarze, druga = goście
+            if not home_matches:
+                home_matches = matches
+            elif not away_matches:
+                away_matches = matches
+                break
+        
+        # Jeśli nie znaleziono w sekcjach, szukaj tabel z wynikami
+        if not home_matches or not away_matches:
+            result_tables = soup.find_all('table', class_=re.compile(r'.*(result|form).*', re.I))
+            
+            if len(result_tables) >= 2:
+                home_matches = self._parse_results_table(result_tables[0])
+                away_matches = self._parse_results_table(result_tables[1])
+        
+        return {
+            'home_form': home_matches[:6],  # Ostatnie 6 meczów
+            'away_form': away_matches[:6]
+        }
     
     def _parse_form_section(self, section) -> List[Dict[str, Any]]:
         """Parsuje sekcję z formą drużyny."""
@@ -544,9 +691,9 @@ class ForebtScraper:
                 for char in text:
                     if char in ['W', 'D', 'L']:
                         matches.append({'result': char})
-            
+        
         except Exception as e:
-            logger.debug(f"Błąd parsowania formy: {e}")
+            logger.debug("Błąd parsowania formy: %s", e)
         
         return matches[:6]  # Max 6 ostatnich meczów
     
@@ -582,7 +729,7 @@ class ForebtScraper:
                         matches.append({'result': result, 'score': score_text})
         
         except Exception as e:
-            logger.debug(f"Błąd parsowania tabeli wyników: {e}")
+            logger.debug("Błąd parsowania tabeli wyników: %s", e)
         
         return matches
 
@@ -0,0 +1,147 @@
+"""
+Warunki gotowości stron Forebet w Selenium (zamiast stałych pauz po driver.get).
+
+Każdy typ strony ma własny warunek dla WebDriverWait:
+    listing - tabela prognoz obecna i liczba wierszy stabilna przez kilka odpytań
+    match   - sekcje formy/H2H obecne i stabilne albo sieć bezczynna (strona bez sekcji)
+
+Warunki odpytują DOM przez execute_script - find_elements czekałby implicit wait
+(Settings.IMPLICIT_WAIT) przy każdym pustym odpytaniu.
+
+Przykład:
+    driver.get(url)
+    ready, seconds = wait_until_ready(driver, 'match')
+"""
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from ..config import Settings
+from ..data_management import get_logger, run_log, metrics
+
+logger = get_logger(__name__)
+
+_ready_seconds = metrics.histogram("page_ready_seconds", "Czas od driver.get do gotowości strony", ["page"])
+_ready_timeouts = metrics.counter("page_ready_timeouts_total", "Strony bez gotowości w READINESS_TIMEOUT", ["page"])
+
+LISTING_ROWS = "tr[data-tid], .rcnt"
+LISTING_CONTAINERS = ".schema, .rcnt, tr[data-tid]"
+# Odpowiednik regexu sekcji formy w _parse_team_form i sekcji H2H w _parse_h2h_page
+MATCH_CONTAINERS = "div[class*='form' i], div[class*='last' i][class*='match' i], div[class*='h2h' i]"
+
+_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+_NETWORK_JS = "return [document.readyState, performance.getEntriesByType('resource').length];"
+
+
+class ContainersPresent:
+    """Co najmniej jeden element selektora jest w DOM."""
+    
+    def __init__(self, selector: str):
+        self.selector = selector
+    
+    def __call__(self, driver) -> bool:
+        return driver.execute_script(_COUNT_JS, self.selector) > 0
+
+
+class DomStable:
+    """Liczba elementów selektora > 0 i niezmieniona przez `polls` kolejnych odpytań."""
+    
+    def __init__(self, selector: str, polls: Optional[int] = None):
+        self.selector = selector
+        self.polls = polls or Settings.READINESS_STABLE_POLLS
+        self.last = -1
+        self.stable = 0
+    
+    def __call__(self, driver) -> bool:
+        count = driver.execute_script(_COUNT_JS, self.selector)
+        self.stable = self.stable + 1 if count and count == self.last else 0
+        self.last = count
+        return self.stable >= self.polls
+
+
+class NetworkIdle:
+    """Dokument załadowany i brak nowych zasobów sieciowych (Resource Timing) przez `idle` sekund."""
+    
+    def __init__(self, idle: Optional[float] = None):
+        self.idle = Settings.READINESS_IDLE_SECONDS if idle is None else idle
+        self.last = -1
+        self.since = time.monotonic()
+    
+    def __call__(self, driver) -> bool:
+        state, resources = driver.execute_script(_NETWORK_JS)
+        now = time.monotonic()
+        if state != 'complete' or resources != self.last:
+            self.last = resources
+            self.since = now
+            return False
+        return now - self.since >= self.idle
+
+
+class AllOf:
+    """Wszystkie warunki spełnione (każdy odpytywany - warunki stanowe liczą odpytania)."""
+    
+    def __init__(self, *conditions: Callable[[Any], bool]):
+        self.conditions = conditions
+    
+    def __call__(self, driver) -> bool:
+        return all([condition(driver) for condition in self.conditions])
+
+
+class AnyOf:
+    """Którykolwiek warunek spełniony (każdy odpytywany)."""
+    
+    def __init__(self, *conditions: Callable[[Any], bool]):
+        self.conditions = conditions
+    
+    def __call__(self, driver) -> bool:
+        return any([condition(driver) for condition in self.conditions])
+
+
+# Fabryki warunków (warunki są stanowe - nowy obiekt na każdą stronę)
+READINESS: Dict[str, Callable[[], Callable[[Any], bool]]] = {
+    'listing': lambda: AllOf(ContainersPresent(LISTING_CONTAINERS), DomStable(LISTING_ROWS)),
+    'match': lambda: AnyOf(
+        AllOf(ContainersPresent(MATCH_CONTAINERS), DomStable(MATCH_CONTAINERS)),
+        NetworkIdle(),
+    ),
+}
+
+
+def wait_until_ready(driver, page: str, timeout: Optional[float] = None) -> Tuple[bool, float]:
+    """
+    Czeka na gotowość strony wczytanej przez driver.get.
+    
+    Args:
+        driver: WebDriver Selenium
+        page: Typ strony (klucz READINESS: listing, match)
+        timeout: Limit oczekiwania (domyślnie Settings.READINESS_TIMEOUT)
+    
+    Returns:
+        (czy gotowa, sekundy oczekiwania) - po timeoucie strona jest parsowana w obecnym stanie
+    """
+    condition = READINESS[page]()
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout or Settings.READINESS_TIMEOUT,
+                      poll_frequency=Settings.READINESS_POLL).until(condition)
+        ready = True
+    except TimeoutException:
+        ready = False
+    except WebDriverException as e:
+        logger.debug("Błąd sprawdzania gotowości strony %s: %s", page, e)
+        ready = False
+    
+    seconds = time.perf_counter() - start
+    _ready_seconds.observe(seconds, page=page)
+    run_log.annotate(ready_ms=round(seconds * 1000, 1))
+    if not ready:
+        _ready_timeouts.inc(page=page)
+        logger.warning(f"⚠️  Strona {page} niegotowa po {seconds:.1f}s - parsowanie obecnego DOM")
+    return ready, seconds
+
+
+__all__ = [
+    'ContainersPresent', 'DomStable', 'NetworkIdle', 'AllOf', 'AnyOf', 'READINESS', 'wait_until_ready',
+]
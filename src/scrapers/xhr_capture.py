@@ -0,0 +1,233 @@
+"""
+Dane prognoz z zapytań XHR/fetch Forebet zamiast renderowanego DOM.
+
+Listing Forebet dociąga prognozy skryptem; ten moduł:
+    1. przechwytuje odpowiedzi JSON (XHR/fetch) z logu wydajności Chrome i CDP
+       Network.getResponseBody (capture_json_responses),
+    2. zapamiętuje endpointy, z których dało się odczytać zdarzenia (XhrEndpointStore),
+    3. w kolejnych przebiegach pobiera te endpointy bezpośrednio przez HTTP -
+       bez przeglądarki, renderowania i parsowania HTML,
+    4. mapuje wiersze JSON na słowniki zdarzeń jak _parse_single_event
+       (parse_prediction_payload, nazwy pól wg _FIELD_ALIASES).
+
+Log wydajności obejmuje całą sesję przeglądarki, dlatego jest opróżniany przed
+każdym ładowaniem strony (drain_performance_log), a przy listingu brane są tylko
+odpowiedzi zapytań wysłanych przez dokument listingu. Odpowiedzi z datami sprzed
+wczoraj (is_stale) nie są traktowane jako prognozy bieżącego dnia.
+"""
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+from selenium.common.exceptions import WebDriverException
+
+from ..config import Settings, Sport
+from ..data_management import get_logger, cache_manager
+from ..scheduling import kickoff_time
+
+logger = get_logger(__name__)
+
+# Nazwy pól spotykane w danych prognoz (porównywane bez wielkości liter)
+_FIELD_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'home': ('host_name', 'home_team', 'hometeam', 'home', 'host'),
+    'away': ('guest_name', 'away_team', 'awayteam', 'away', 'guest'),
+    'p_home': ('pred_1', 'prob_1', 'home_prob', 'p1', 'probability_home'),
+    'p_draw': ('pred_x', 'prob_x', 'draw_prob', 'px', 'probability_draw'),
+    'p_away': ('pred_2', 'prob_2', 'away_prob', 'p2', 'probability_away'),
+    'match_id': ('id', 'match_id', 'tid', 'event_id'),
+    'match_url': ('url', 'match_url', 'link', 'href'),
+    'league': ('league', 'league_name', 'short_tag', 'tournament', 'competition'),
+    'match_time': ('date_bah', 'match_time', 'kickoff', 'start_time', 'date'),
+}
+
+_JSON_TYPES = ('XHR', 'Fetch')
+
+
+def make_probabilities(home: float, draw: float, away: float) -> Dict[str, Any]:
+    """Słownik prawdopodobieństw jak w _extract_probabilities (z max i typem prognozy)."""
+    max_prob = max(home, draw, away)
+    prediction = 'home' if home == max_prob else ('draw' if draw == max_prob else 'away')
+    return {'home': home, 'draw': draw, 'away': away, 'max': max_prob, 'prediction': prediction}
+
+
+def _field(row: Dict[str, Any], name: str) -> Any:
+    lowered = {str(key).lower(): value for key, value in row.items()}
+    for alias in _FIELD_ALIASES[name]:
+        value = lowered.get(alias)
+        if value not in (None, ''):
+            return value
+    return None
+
+
+def _rows(payload: Any) -> Iterator[Dict[str, Any]]:
+    """Wszystkie słowniki w drzewie JSON, które mają obie drużyny."""
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if _field(node, 'home') is not None and _field(node, 'away') is not None:
+                yield node
+            else:
+                stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def parse_prediction_payload(payload: Any, sport: Sport, base_url: str = "") -> List[Dict[str, Any]]:
+    """
+    Mapuje dane prognoz JSON na zdarzenia.
+    
+    Args:
+        payload: Zdekodowany JSON odpowiedzi XHR
+        sport: Sport listingu
+        base_url: Adres strony (dla względnych linków meczów)
+    
+    Returns:
+        Lista zdarzeń (wiersze bez drużyn lub prawdopodobieństw są pomijane)
+    """
+    events = []
+    scraped_at = datetime.now().isoformat()
+    for row in _rows(payload):
+        try:
+            probabilities = make_probabilities(
+                float(_field(row, 'p_home')), float(_field(row, 'p_draw') or 0), float(_field(row, 'p_away'))
+            )
+        except (TypeError, ValueError):
+            continue
+        
+        match_url = _field(row, 'match_url')
+        match_id = _field(row, 'match_id')
+        events.append({
+            'match_id': str(match_id) if match_id is not None else None,
+            'sport': sport.value,
+            'home_team': str(_field(row, 'home')).strip(),
+            'away_team': str(_field(row, 'away')).strip(),
+            'probabilities': probabilities,
+            'match_url': urljoin(base_url, match_url) if match_url else None,
+            'league': _field(row, 'league') or "Unknown League",
+            'match_time': _field(row, 'match_time'),
+            'scraped_at': scraped_at,
+        })
+    return events
+
+
+def _normalize_url(url: str) -> str:
+    """URL bez fragmentu, ze znakami spoza ASCII zakodowanymi jak w logu Chrome."""
+    return requests.utils.requote_uri(url.split('#', 1)[0])
+
+
+def drain_performance_log(driver) -> int:
+    """
+    Opróżnia bufor logu wydajności (wpisy poprzednich stron nie trafią do kolejnego
+    odczytu ani nie gromadzą się w chromedriverze).
+    
+    Returns:
+        Liczba usuniętych wpisów (0 gdy log niedostępny)
+    """
+    try:
+        return len(driver.get_log('performance'))
+    except WebDriverException:
+        return 0
+
+
+def capture_json_responses(driver, document_urls: Optional[Iterable[str]] = None) -> List[Tuple[str, Any]]:
+    """
+    Odpowiedzi JSON zapytań XHR/fetch od ostatniego odczytu logu wydajności.
+    
+    Wymaga capability goog:loggingPrefs {'performance': 'ALL'} (browser_profile.chrome_options).
+    
+    Args:
+        driver: WebDriver Chrome
+        document_urls: Tylko zapytania wysłane przez dokument o jednym z tych adresów
+            (documentURL z Network.requestWillBeSent; domyślnie wszystkie)
+    
+    Returns:
+        Lista (URL, zdekodowany JSON)
+    """
+    documents = {_normalize_url(url) for url in document_urls} if document_urls is not None else None
+    requests_by_document: Dict[str, str] = {}
+    captured = []
+    for entry in driver.get_log('performance'):
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        params = message.get('params', {})
+        if message.get('method') == 'Network.requestWillBeSent':
+            requests_by_document[params.get('requestId')] = params.get('documentURL', '')
+            continue
+        if message.get('method') != 'Network.responseReceived':
+            continue
+        
+        response = params.get('response', {})
+        if params.get('type') not in _JSON_TYPES or 'json' not in response.get('mimeType', ''):
+            continue
+        document = requests_by_document.get(params.get('requestId'), '')
+        if documents is not None and _normalize_url(document) not in documents:
+            continue
+        
+        try:
+            body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+            captured.append((response['url'], json.loads(body['body'])))
+        except Exception as e:
+            logger.debug("Pominięto odpowiedź XHR %s: %s", response.get('url'), e)
+    return captured
+
+
+class XhrEndpointStore:
+    """Odkryte endpointy danych prognoz per sport (cache_manager, TTL Settings.XHR_ENDPOINT_TTL)."""
+    
+    @staticmethod
+    def _key(sport: Sport) -> str:
+        return f"xhr_endpoints_{sport.value}"
+    
+    def get(self, sport: Sport) -> List[str]:
+        """Endpointy zapamiętane dla sportu (pusta lista gdy brak)."""
+        return cache_manager.load(self._key(sport)) or []
+    
+    def remember(self, sport: Sport, urls: List[str]):
+        """Zapamiętuje endpointy, z których odczytano zdarzenia."""
+        if urls:
+            cache_manager.save(self._key(sport), sorted(set(urls)), ttl=Settings.XHR_ENDPOINT_TTL)
+            logger.info(f"📡 Zapamiętano endpointy XHR dla {sport.value}: {len(set(urls))}")
+    
+    def forget(self, sport: Sport):
+        """Usuwa endpointy (np. gdy przestały zwracać dane)."""
+        cache_manager.delete(self._key(sport))
+
+
+def is_stale(events: List[Dict[str, Any]], now: Optional[datetime] = None) -> bool:
+    """Wszystkie zdarzenia mają datę sprzed wczoraj - dane nie dotyczą bieżącego dnia."""
+    now = now or datetime.now()
+    cutoff = (now - timedelta(days=1)).date()
+    kickoffs = [kickoff_time(event, now) for event in events]
+    return bool(kickoffs) and all(kickoff is not None and kickoff.date() < cutoff for kickoff in kickoffs)
+
+
+def events_from_captured(captured: List[Tuple[str, Any]], sport: Sport,
+                         base_url: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Zdarzenia z przechwyconych odpowiedzi (odpowiedzi z nieaktualnymi datami pomijane).
+    
+    Returns:
+        (zdarzenia, URL-e odpowiedzi, które je zawierały)
+    """
+    events, sources = [], []
+    for url, payload in captured:
+        parsed = parse_prediction_payload(payload, sport, base_url)
+        if parsed and not is_stale(parsed):
+            events.extend(parsed)
+            sources.append(url)
+    return events, sources
+
+
+# Globalny singleton
+xhr_endpoints = XhrEndpointStore()
+
+
+__all__ = [
+    'make_probabilities', 'parse_prediction_payload', 'drain_performance_log', 'capture_json_responses',
+    'is_stale', 'events_from_captured', 'XhrEndpointStore', 'xhr_endpoints',
+]
@@ -0,0 +1,17 @@
+"""Inicjalizacja modułu transport - wspólna warstwa HTTP dla scraperów i fetcherów."""
+from .response_store import ResponseStore, response_store, request_key
+from .replay_adapter import RecordReplayAdapter, ReplayMissError
+from .session import create_session
+from .rate_limiter import TokenBucket, HostRateLimiter, rate_limiter
+from .async_engine import AsyncFetchEngine, fetch_engine, host_of
+from .circuit_breaker import CircuitBreaker, CircuitBreakers, CircuitOpenError, circuit_breakers
+from .retry_policy import RetryPolicy, retry_policy, transient_reason
+from . import http_cache
+
+__all__ = [
+    "ResponseStore", "response_store", "request_key", "RecordReplayAdapter", "ReplayMissError",
+    "create_session", "AsyncFetchEngine", "fetch_engine", "host_of",
+    "TokenBucket", "HostRateLimiter", "rate_limiter", "http_cache",
+    "RetryPolicy", "retry_policy", "transient_reason",
+    "CircuitBreaker", "CircuitBreakers", "CircuitOpenError", "circuit_breakers",
+]
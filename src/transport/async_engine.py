@@ -0,0 +1,203 @@
+"""
+Silnik asynchronicznego pobierania - setki stron meczów i kursów równolegle.
+
+Pętla asyncio planuje zapytania z limitem równoczesności na host (forebet.com,
+flashscore) i globalnym limitem połączeń. Każde zapytanie idzie przez wspólną
+sesję requests (pula połączeń, warstwa transportu) i jest wykonywane w puli
+wykonawców pętli, więc wywołujący widzi synchroniczną fasadę (fetch_all, map).
+
+Każde zadanie ma skończony limit czasu (task_timeout). Po jego przekroczeniu
+wywołujący dostaje TimeoutError, a limity hosta są zwalniane - ale wątku nie da
+się przerwać: zadanie działa dalej w tle i zajmuje miejsce w puli wykonawców aż
+do zakończenia (zapytania same kończą się po timeoutach sesji i WebDrivera).
+
+Przykład:
+    responses = fetch_engine.fetch_all(session, urls)
+    forms = fetch_engine.map(scraper.fetch_team_form, urls, host=forebet_host)
+"""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+from urllib.parse import urlsplit
+
+import requests
+
+from ..config import Settings
+from ..data_management import get_logger, metrics
+
+logger = get_logger(__name__)
+
+_engine_calls = metrics.counter("fetch_engine_calls_total", "Zadania silnika pobierania wg hosta i wyniku",
+                                ["host", "result"])
+_engine_in_flight = metrics.gauge("fetch_engine_in_flight", "Zadania silnika pobierania w toku")
+
+T = TypeVar("T")
+Outcome = Union[T, BaseException]
+
+
+def host_of(url: str) -> str:
+    """Host z URL (klucz limitu równoczesności)."""
+    return urlsplit(url).netloc
+
+
+class AsyncFetchEngine:
+    """Równoległe pobieranie z limitami na host i synchroniczną fasadą."""
+    
+    def __init__(self, max_connections: Optional[int] = None, per_host: Optional[int] = None):
+        """
+        Args:
+            max_connections: Limit wszystkich zadań w toku (domyślnie Settings.HTTP_MAX_CONNECTIONS)
+            per_host: Limit zadań w toku na host (domyślnie Settings.HTTP_MAX_PER_HOST)
+        """
+        self._max_connections = max_connections
+        self._per_host = per_host
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+    
+    @property
+    def max_connections(self) -> int:
+        return self._max_connections or Settings.HTTP_MAX_CONNECTIONS
+    
+    @property
+    def per_host(self) -> int:
+        return self._per_host or Settings.HTTP_MAX_PER_HOST
+    
+    @property
+    def task_timeout(self) -> float:
+        """
+        Domyślny limit czasu zadania: Settings.FETCH_TASK_TIMEOUT lub (gdy 0) czas najgorszego
+        przypadku dwóch zapytań/stron (np. wyszukiwanie + feed kursów) ze wszystkimi próbami.
+        """
+        if Settings.FETCH_TASK_TIMEOUT:
+            return float(Settings.FETCH_TASK_TIMEOUT)
+        attempt = max(Settings.FOREBET_TIMEOUT, Settings.FLASHSCORE_TIMEOUT,
+                      Settings.PAGE_LOAD_TIMEOUT + Settings.READINESS_TIMEOUT)
+        retries = Settings.MAX_RETRIES
+        return 2.0 * (attempt * retries + Settings.RETRY_MAX_DELAY * (retries - 1))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_connections, thread_name_prefix="fetch")
+            return self._executor
+    
+    def _track(self, delta: int):
+        with self._lock:
+            self._in_flight += delta
+            _engine_in_flight.set(self._in_flight)
+    
+    async def gather(self, calls: Sequence[Tuple[str, Callable[[], T]]], per_host: Optional[int] = None,
+                     timeout: Optional[float] = None) -> List[Outcome]:
+        """
+        Wykonuje blokujące wywołania równolegle (w kolejności wejścia).
+        
+        Args:
+            calls: Pary (host, wywołanie bez argumentów)
+            per_host: Limit równoczesności na host dla tego wywołania (domyślnie self.per_host)
+            timeout: Limit czasu jednego zadania w sekundach (domyślnie task_timeout); zadanie po
+                przekroczeniu dokańcza się w swoim wątku, wynik to TimeoutError
+        
+        Returns:
+            Wyniki lub wyjątki (jak asyncio.gather z return_exceptions=True)
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        total = asyncio.Semaphore(self.max_connections)
+        hosts: Dict[str, asyncio.Semaphore] = {}
+        limit = per_host or self.per_host
+        timeout = timeout or self.task_timeout
+        
+        async def run(host: str, call: Callable[[], T]) -> T:
+            semaphore = hosts.setdefault(host, asyncio.Semaphore(limit))
+            async with semaphore, total:
+                # Kopia kontekstu - etapy run_log (contextvars) widoczne w wątku wykonawcy
+                context = contextvars.copy_context()
+                self._track(1)
+                try:
+                    future = loop.run_in_executor(executor, functools.partial(context.run, call))
+                    result = await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    _engine_calls.inc(host=host, result='timeout')
+                    logger.warning(f"⏱️  Zadanie ({host}) przekroczyło {timeout:.0f}s - wynik pominięty, "
+                                   f"wątek dokończy je w tle")
+                    raise
+                except BaseException:
+                    _engine_calls.inc(host=host, result='error')
+                    raise
+                finally:
+                    self._track(-1)
+                _engine_calls.inc(host=host, result='ok')
+                return result
+        
+        return await asyncio.gather(*(run(host, call) for host, call in calls), return_exceptions=True)
+    
+    def run(self, calls: Sequence[Tuple[str, Callable[[], T]]], per_host: Optional[int] = None,
+            timeout: Optional[float] = None) -> List[Outcome]:
+        """Synchroniczna fasada gather (własna pętla; z wnętrza działającej pętli - w osobnym wątku)."""
+        if not calls:
+            return []
+        coroutine = self.gather(calls, per_host, timeout)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        
+        with ThreadPoolExecutor(1, thread_name_prefix="fetch-loop") as runner:
+            return runner.submit(asyncio.run, coroutine).result()
+    
+    def map(self, func: Callable[..., T], items: Sequence[Any], host: str,
+            per_host: Optional[int] = None, timeout: Optional[float] = None) -> List[Outcome]:
+        """
+        Wywołuje func(item) dla każdego elementu równolegle (jeden host).
+        
+        Args:
+            func: Blokująca funkcja jednego elementu (np. fetch_team_form)
+            items: Argumenty kolejnych wywołań
+            host: Host, do którego odwołuje się func (klucz limitu)
+            per_host: Limit równoczesności (1 = sekwencyjnie, np. dla Selenium)
+            timeout: Limit czasu jednego wywołania w sekundach (domyślnie task_timeout)
+        
+        Returns:
+            Wyniki lub wyjątki w kolejności items
+        """
+        return self.run([(host, functools.partial(func, item)) for item in items], per_host, timeout)
+    
+    def fetch_all(self, session: requests.Session, urls: Sequence[str],
+                  timeout: Optional[float] = None) -> List[Outcome]:
+        """
+        Pobiera URL-e równolegle przez wspólną sesję (GET, status 2xx).
+        
+        Args:
+            session: Sesja requests (create_session - pula połączeń i transport)
+            urls: Adresy do pobrania
+            timeout: Limit czasu zapytania (domyślnie Settings.FOREBET_TIMEOUT)
+        
+        Returns:
+            Odpowiedzi lub wyjątki (requests.RequestException) w kolejności urls
+        """
+        timeout = timeout or Settings.FOREBET_TIMEOUT
+        
+        def get(url: str) -> requests.Response:
+            response = session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response
+        
+        return self.run([(host_of(url), functools.partial(get, url)) for url in urls])
+    
+    def close(self):
+        """Zamyka pulę wykonawców."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# Globalny singleton
+fetch_engine = AsyncFetchEngine()
+
+
+__all__ = ['AsyncFetchEngine', 'fetch_engine', 'host_of']
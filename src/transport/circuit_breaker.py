@@ -0,0 +1,156 @@
+"""
+Circuit breaker per host dla zapytań HTTP i ładowań stron w przeglądarce.
+
+Stany (grupy hostów jak w Settings.RATE_LIMITS):
+    closed    - zapytania przechodzą, kolejne błędy są liczone
+    open      - po BREAKER_FAILURE_THRESHOLD kolejnych błędach; zapytania odrzucane
+                od razu (CircuitOpenError) przez BREAKER_COOLDOWN sekund
+    half_open - po cooldownie przechodzi jedno zapytanie próbne: sukces zamyka
+                breaker, błąd otwiera go ponownie
+
+Błąd to wyjątek sieci/WebDrivera albo status z FAILURE_STATUSES (np. 401/403 przy
+blokadzie Flashscore). Odrzucenie kosztuje mikrosekundy zamiast timeoutu zapytania.
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+from ..config import Settings
+from ..data_management import get_logger, metrics
+from .rate_limiter import HostRateLimiter
+
+logger = get_logger(__name__)
+
+_state = metrics.gauge("breaker_open", "Stan breakera hosta (0 = zamknięty, 1 = otwarty/próba)", ["host"])
+_transitions = metrics.counter("breaker_transitions_total", "Zmiany stanu breakera", ["host", "state"])
+_rejections = metrics.counter("breaker_rejections_total", "Zapytania odrzucone przez otwarty breaker", ["host"])
+
+# Statusy oznaczające blokadę lub awarię serwisu (404 = serwis odpowiada poprawnie)
+FAILURE_STATUSES = (401, 403, 429, 500, 502, 503, 504)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Zapytanie odrzucone bez wysyłania - breaker hosta otwarty."""
+
+
+class CircuitBreaker:
+    """Breaker jednego hosta (licznik kolejnych błędów i stan)."""
+    
+    def __init__(self, host: str, threshold: Optional[int] = None, cooldown: Optional[float] = None):
+        """
+        Args:
+            host: Klucz hosta (HostRateLimiter.host_key)
+            threshold: Kolejne błędy otwierające breaker (domyślnie Settings.BREAKER_FAILURE_THRESHOLD)
+            cooldown: Czas otwarcia w sekundach (domyślnie Settings.BREAKER_COOLDOWN)
+        """
+        self.host = host
+        self.threshold = threshold or Settings.BREAKER_FAILURE_THRESHOLD
+        self.cooldown = Settings.BREAKER_COOLDOWN if cooldown is None else cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def _transition(self, state: str):
+        self.state = state
+        _transitions.inc(host=self.host, state=state)
+        _state.set(0 if state == CLOSED else 1, host=self.host)
+    
+    def allow(self) -> bool:
+        """Czy zapytanie może zostać wysłane (w half_open - tylko jedno próbne naraz)."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self._transition(HALF_OPEN)
+                self._probing = False
+            if self.state == CLOSED:
+                return True
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+        _rejections.inc(host=self.host)
+        return False
+    
+    def record_success(self):
+        """Udane zapytanie - zeruje licznik, zamyka breaker po próbie."""
+        with self._lock:
+            self.failures = 0
+            if self.state != CLOSED:
+                self._transition(CLOSED)
+                logger.info(f"✅ Breaker {self.host} zamknięty - serwis odpowiada")
+    
+    def record_failure(self):
+        """Błąd zapytania - otwiera breaker po progu (lub po nieudanej próbie)."""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.threshold):
+                self.opened_at = time.monotonic()
+                self._probing = False
+                self._transition(OPEN)
+                logger.warning(f"🔌 Breaker {self.host} otwarty po {self.failures} błędach - "
+                               f"zapytania wstrzymane na {self.cooldown:.0f}s")
+    
+    @property
+    def is_open(self) -> bool:
+        """Otwarty i w cooldownie (zapytania byłyby odrzucone)."""
+        with self._lock:
+            return self.state == OPEN and time.monotonic() - self.opened_at < self.cooldown
+
+
+class CircuitBreakers:
+    """Breakery per host, współdzielone przez sesje HTTP i WebDriver."""
+    
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def for_url(self, url: str) -> CircuitBreaker:
+        """Breaker hosta z URL (tworzony przy pierwszym zapytaniu)."""
+        key = HostRateLimiter.host_key(url)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(key)
+            return breaker
+    
+    def before(self, url: str):
+        """
+        Sprawdza breaker przed zapytaniem.
+        
+        Raises:
+            CircuitOpenError: Breaker hosta otwarty
+        """
+        breaker = self.for_url(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Breaker {breaker.host} otwarty - pominięto {url}")
+    
+    def after(self, url: str, ok: bool):
+        """Zapisuje wynik zapytania w breakerze hosta."""
+        breaker = self.for_url(url)
+        if ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+    
+    def is_open(self, url: str) -> bool:
+        """Czy breaker hosta z URL jest otwarty."""
+        return self.for_url(url).is_open
+    
+    def reset(self):
+        """Usuwa breakery (wszystkie hosty zamknięte)."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Globalny singleton
+circuit_breakers = CircuitBreakers()
+
+
+__all__ = [
+    'CircuitBreaker', 'CircuitBreakers', 'CircuitOpenError', 'circuit_breakers', 'FAILURE_STATUSES',
+    'CLOSED', 'OPEN', 'HALF_OPEN',
+]
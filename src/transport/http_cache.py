@@ -0,0 +1,121 @@
+"""
+Reguły cache HTTP (Cache-Control, Expires, ETag, Last-Modified) dla trybu live transportu.
+
+Odpowiedzi GET z walidatorami lub czasem świeżości są zapisywane w magazynie
+odpowiedzi (ResponseStore). Przy kolejnym zapytaniu:
+    świeża (max-age / Expires)   - odpowiedź z magazynu, bez ruchu sieciowego
+    z walidatorem                - zapytanie warunkowe (If-None-Match / If-Modified-Since);
+                                   304 = treść z magazynu, pobrane tylko nagłówki
+    no-store                     - nigdy nie zapisywana
+
+Bez heurystycznej świeżości: strona bez max-age/Expires jest zawsze rewalidowana,
+więc zmiany prognoz i kursów są widoczne od razu.
+"""
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..data_management import metrics
+
+_requests = metrics.counter("http_cache_requests_total",
+                            "Zapytania GET wg wyniku cache HTTP (fresh/revalidated/modified/miss)", ["result"])
+_bytes_saved = metrics.counter("http_cache_bytes_saved_total", "Bajty treści niepobrane dzięki cache HTTP")
+
+RESULTS = ("fresh", "revalidated", "modified", "miss")
+
+
+def _cache_control(headers) -> Dict[str, Optional[str]]:
+    """Dyrektywy Cache-Control jako słownik (nazwy małymi literami)."""
+    directives = {}
+    for part in (headers.get('Cache-Control') or '').split(','):
+        name, _, value = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _http_date(value: Optional[str]) -> Optional[float]:
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers) -> float:
+    """
+    Czas świeżości odpowiedzi w sekundach (0 = rewaliduj przy każdym użyciu).
+    
+    Args:
+        headers: Nagłówki odpowiedzi
+    """
+    directives = _cache_control(headers)
+    if 'no-cache' in directives:
+        return 0.0
+    for name in ('s-maxage', 'max-age'):
+        value = directives.get(name)
+        if value and value.isdigit():
+            return float(value)
+    expires, date = _http_date(headers.get('Expires')), _http_date(headers.get('Date'))
+    if expires is not None:
+        return max(0.0, expires - (date or time.time()))
+    return 0.0
+
+
+def is_storable(response: requests.Response) -> bool:
+    """Odpowiedź 200 bez no-store, z walidatorem albo czasem świeżości."""
+    if response.status_code != 200 or 'no-store' in _cache_control(response.headers):
+        return False
+    headers = response.headers
+    return bool(headers.get('ETag') or headers.get('Last-Modified') or freshness_lifetime(headers))
+
+
+def is_fresh(entry: Dict[str, Any], now: Optional[float] = None) -> bool:
+    """Czy zapisana odpowiedź może być użyta bez kontaktu z serwerem."""
+    age = (now or time.time()) - entry['stored_at']
+    return age < freshness_lifetime(CaseInsensitiveDict(entry['headers']))
+
+
+def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+    """Nagłówki zapytania warunkowego z walidatorów zapisanej odpowiedzi."""
+    headers = {}
+    stored = CaseInsensitiveDict(entry['headers'])
+    if stored.get('ETag'):
+        headers['If-None-Match'] = stored['ETag']
+    if stored.get('Last-Modified'):
+        headers['If-Modified-Since'] = stored['Last-Modified']
+    return headers
+
+
+def record(result: str, saved_bytes: int = 0):
+    """Zlicza wynik cache (RESULTS) i zaoszczędzone bajty."""
+    _requests.inc(result=result)
+    if saved_bytes:
+        _bytes_saved.inc(saved_bytes)
+
+
+def summary() -> Dict[str, float]:
+    """Wyniki cache HTTP bieżącego przebiegu ({wynik: liczba, 'bytes_saved': bajty})."""
+    stats = {result: _requests.value(result=result) for result in RESULTS}
+    stats['bytes_saved'] = _bytes_saved.value()
+    return stats
+
+
+def format_summary() -> List[str]:
+    """Linia podsumowania do logu (pusta lista gdy cache nie był użyty)."""
+    stats = summary()
+    if not any(stats[result] for result in RESULTS):
+        return []
+    return [
+        f"💾 Cache HTTP: {stats['fresh']:.0f} świeżych, {stats['revalidated']:.0f} niezmienionych (304), "
+        f"{stats['modified']:.0f} zmienionych, {stats['miss']:.0f} nowych - "
+        f"zaoszczędzono {stats['bytes_saved'] / 1024 / 1024:.2f} MB"
+    ]
+
+
+__all__ = [
+    'freshness_lifetime', 'is_storable', 'is_fresh', 'conditional_headers', 'record', 'summary',
+    'format_summary', 'RESULTS',
+]
@@ -0,0 +1,160 @@
+"""
+Limit zapytań per host (token bucket) dla wszystkich fetcherów i Selenium.
+
+Każdy host (grupa hostów wg Settings.RATE_LIMITS, np. www.forebet.com i
+forebet.com, flashscore.pl i d.flashscore.com) ma własny kubełek: zapytania
+przechodzą od razu dopóki są tokeny (burst), potem w tempie `rate` na sekundę.
+Odpowiedzi 429/503 obniżają tempo o połowę (i wstrzymują host na Retry-After),
+kolejne udane odpowiedzi przywracają je stopniowo do skonfigurowanego.
+"""
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from ..config import Settings
+from ..data_management import get_logger, metrics
+
+logger = get_logger(__name__)
+
+_wait_seconds = metrics.histogram("rate_limit_wait_seconds", "Oczekiwanie na token limitu zapytań", ["host"])
+_backoffs = metrics.counter("rate_limit_backoffs_total", "Obniżenia tempa po 429/503", ["host", "status"])
+_current_rate = metrics.gauge("rate_limit_requests_per_second", "Bieżące tempo zapytań hosta", ["host"])
+
+# Statusy oznaczające przeciążenie serwera - zwolnij
+THROTTLE_STATUSES = (429, 503)
+
+
+class TokenBucket:
+    """Kubełek tokenów z adaptacyjnym tempem (AIMD: połowa po 429/503, +1% po sukcesie)."""
+    
+    def __init__(self, rate: float, burst: Optional[float] = None, min_rate: Optional[float] = None):
+        """
+        Args:
+            rate: Docelowe tempo (zapytania na sekundę)
+            burst: Pojemność kubełka (domyślnie max(1, rate))
+            min_rate: Dolna granica tempa po obniżeniach (domyślnie Settings.RATE_LIMIT_MIN)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self.min_rate = min(min_rate or Settings.RATE_LIMIT_MIN, rate)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def acquire(self) -> float:
+        """
+        Pobiera token, czekając jeśli trzeba.
+        
+        Returns:
+            Czas oczekiwania w sekundach
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    wait = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return now - start
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+    
+    def throttle(self, retry_after: Optional[float] = None):
+        """Obniża tempo o połowę; Retry-After wstrzymuje host na podany czas."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+    
+    def recover(self):
+        """Po udanej odpowiedzi tempo rośnie o 1% docelowego (do max_rate)."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.01)
+
+
+class HostRateLimiter:
+    """Kubełki tokenów per host, współdzielone przez sesje HTTP i WebDriver."""
+    
+    def __init__(self):
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Klucz kubełka: fragment hosta z Settings.RATE_LIMITS lub pełny host."""
+        host = urlsplit(url).hostname or url
+        for pattern in Settings.RATE_LIMITS:
+            if pattern in host:
+                return pattern
+        return host
+    
+    def bucket(self, url: str) -> TokenBucket:
+        """Kubełek hosta z URL (tworzony przy pierwszym zapytaniu)."""
+        key = self.host_key(url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate = Settings.RATE_LIMITS.get(key, Settings.RATE_LIMIT_DEFAULT)
+                bucket = self._buckets[key] = TokenBucket(rate)
+                _current_rate.set(rate, host=key)
+            return bucket
+    
+    def acquire(self, url: str) -> float:
+        """
+        Czeka na token hosta przed zapytaniem.
+        
+        Args:
+            url: Adres zapytania
+        
+        Returns:
+            Czas oczekiwania w sekundach
+        """
+        waited = self.bucket(url).acquire()
+        _wait_seconds.observe(waited, host=self.host_key(url))
+        return waited
+    
+    def feedback(self, url: str, status: int, retry_after: Optional[str] = None):
+        """
+        Dostosowuje tempo hosta do odpowiedzi.
+        
+        Args:
+            url: Adres zapytania
+            status: Status HTTP
+            retry_after: Nagłówek Retry-After (sekundy), jeśli był
+        """
+        bucket = self.bucket(url)
+        key = self.host_key(url)
+        if status in THROTTLE_STATUSES:
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else None
+            bucket.throttle(delay)
+            _backoffs.inc(host=key, status=str(status))
+            logger.warning(f"⚠️  {key}: HTTP {status} - tempo obniżone do {bucket.rate:.2f} zapytań/s")
+        else:
+            bucket.recover()
+        _current_rate.set(round(bucket.rate, 3), host=key)
+    
+    def reset(self):
+        """Usuwa kubełki (tempo wraca do konfiguracji)."""
+        with self._lock:
+            self._buckets.clear()
+
+
+# Globalny singleton
+rate_limiter = HostRateLimiter()
+
+
+__all__ = ['TokenBucket', 'HostRateLimiter', 'rate_limiter', 'THROTTLE_STATUSES']
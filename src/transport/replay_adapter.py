@@ -0,0 +1,162 @@
+"""
+Adapter requests z nagrywaniem i odtwarzaniem odpowiedzi (Settings.TRANSPORT_MODE).
+
+Tryby:
+    live    - zapytania sieciowe; przy Settings.HTTP_CACHE GET-y rewalidowane wg nagłówków
+              cache HTTP (ETag/Last-Modified/Cache-Control, patrz http_cache)
+    record  - zapytania sieciowe, odpowiedzi zapisywane w magazynie
+    replay  - wyłącznie magazyn; brak wpisu = ReplayMissError (zero ruchu sieciowego)
+    cache   - magazyn jako długotrwały cache HTTP (TRANSPORT_CACHE_TTL), brak/przeterminowany = sieć + zapis
+
+Każde zapytanie sieciowe przechodzi przez breaker hosta (circuit_breakers) i czeka na
+token hosta (rate_limiter); GET/HEAD po błędach przejściowych są ponawiane wg retry_policy.
+"""
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from ..config import Settings
+from ..data_management import get_logger, metrics
+from . import http_cache
+from .circuit_breaker import FAILURE_STATUSES, circuit_breakers
+from .rate_limiter import rate_limiter
+from .retry_policy import retry_policy
+from .response_store import ResponseStore, response_store, request_key
+
+logger = get_logger(__name__)
+
+_transport = metrics.counter("http_transport_total", "Zapytania HTTP wg trybu transportu i wyniku", ["mode", "result"])
+
+MODES = ("live", "record", "replay", "cache")
+
+
+class ReplayMissError(requests.ConnectionError):
+    """Brak nagranej odpowiedzi w trybie replay (obsługiwany jak błąd połączenia)."""
+
+
+class RecordReplayAdapter(HTTPAdapter):
+    """HTTPAdapter nagrywający lub odtwarzający odpowiedzi z magazynu adresowanego treścią."""
+    
+    def __init__(self, store: Optional[ResponseStore] = None, mode: Optional[str] = None, **kwargs):
+        """
+        Args:
+            store: Magazyn odpowiedzi (domyślnie globalny response_store)
+            mode: Tryb transportu (domyślnie Settings.TRANSPORT_MODE w chwili zapytania)
+            **kwargs: Parametry HTTPAdapter (pool_connections, pool_maxsize, ...)
+        """
+        super().__init__(**kwargs)
+        self.store = store or response_store
+        self._mode = mode
+    
+    @property
+    def mode(self) -> str:
+        mode = self._mode or Settings.TRANSPORT_MODE
+        if mode not in MODES:
+            raise ValueError(f"Nieznany tryb transportu: {mode} (dozwolone: {', '.join(MODES)})")
+        return mode
+    
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        mode = self.mode
+        if mode == "live" and Settings.HTTP_CACHE and request.method == "GET":
+            return self._send_http_cached(request, **kwargs)
+        if mode == "live" or request.method not in ("GET", "HEAD"):
+            return self._send_network(request, **kwargs)
+        
+        key = request_key(request.method, request.url)
+        if mode in ("replay", "cache"):
+            stored = self.store.get(key)
+            if stored is not None:
+                entry, body = stored
+                if mode == "replay" or time.time() - entry['stored_at'] <= Settings.TRANSPORT_CACHE_TTL:
+                    _transport.inc(mode=mode, result='hit')
+                    return self._build_stored_response(request, entry, body)
+            if mode == "replay":
+                _transport.inc(mode=mode, result='miss')
+                raise ReplayMissError(f"Brak nagrania dla {request.method} {request.url}", request=request)
+        
+        response = self._send_network(request, **kwargs)
+        # Błędy przejściowe (429/5xx) nie trafiają do magazynu - odtwarzanie ich nie ma sensu
+        if response.status_code < 500 and response.status_code != 429:
+            self.store.put(key, response, origin=mode)
+            _transport.inc(mode=mode, result='recorded')
+        else:
+            _transport.inc(mode=mode, result='not_recorded')
+        return response
+    
+    def _send_http_cached(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """GET z cache HTTP: świeża odpowiedź z magazynu, w przeciwnym razie zapytanie warunkowe."""
+        key = request_key(request.method, request.url)
+        stored = self.store.get(key)
+        if stored is None:
+            response = self._send_network(request, **kwargs)
+            http_cache.record('miss')
+            if http_cache.is_storable(response):
+                self.store.put(key, response, origin='http_cache')
+            return response
+        
+        entry, body = stored
+        if http_cache.is_fresh(entry):
+            http_cache.record('fresh', len(body))
+            return self._build_stored_response(request, entry, body)
+        
+        conditional = request.copy()
+        conditional.headers.update(http_cache.conditional_headers(entry))
+        response = self._send_network(conditional, **kwargs)
+        
+        if response.status_code == 304:
+            # Nagłówki 304 (ETag, Cache-Control, Date) aktualizują zapisany wpis, treść bez zmian
+            response.close()
+            headers = CaseInsensitiveDict(entry['headers'])
+            headers.update({k: v for k, v in response.headers.items()
+                            if k.lower() not in ('content-length', 'content-encoding', 'transfer-encoding')})
+            entry['headers'] = dict(headers)
+            revalidated = self._build_stored_response(request, entry, body)
+            self.store.put(key, revalidated, origin='http_cache')
+            http_cache.record('revalidated', len(body))
+            return revalidated
+        
+        response.request = request
+        http_cache.record('modified')
+        if http_cache.is_storable(response):
+            self.store.put(key, response, origin='http_cache')
+        return response
+    
+    def _send_network(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Zapytanie sieciowe; idempotentne metody ponawiane po błędach przejściowych (retry_policy)."""
+        if request.method in ("GET", "HEAD"):
+            return retry_policy.call(lambda: self._send_once(request, **kwargs), request.url)
+        return self._send_once(request, **kwargs)
+    
+    def _send_once(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Jedno zapytanie w limicie tempa hosta (odpowiedzi z magazynu nie zużywają tokenów)."""
+        circuit_breakers.before(request.url)
+        rate_limiter.acquire(request.url)
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            circuit_breakers.after(request.url, ok=False)
+            raise
+        circuit_breakers.after(request.url, ok=response.status_code not in FAILURE_STATUSES)
+        rate_limiter.feedback(request.url, response.status_code, response.headers.get('Retry-After'))
+        return response
+    
+    def _build_stored_response(self, request: requests.PreparedRequest, entry: dict, body: bytes) -> requests.Response:
+        """Odpowiedź requests zbudowana z wpisu magazynu."""
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry.get('reason')
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response._content = body
+        response._content_consumed = True
+        return response
+
+
+__all__ = ['RecordReplayAdapter', 'ReplayMissError', 'MODES']
@@ -0,0 +1,197 @@
+"""
+Magazyn odpowiedzi HTTP adresowany treścią (nagrywanie/odtwarzanie ruchu).
+
+Układ katalogu (Settings.TRANSPORT_STORE_DIR):
+    objects/<ab>/<sha256 treści>        - treść odpowiedzi, zapisana raz dla identycznych stron
+    requests/<cd>/<sha256 zapytania>.json - status, nagłówki i hash treści dla METHOD + URL
+
+Wpisy mają pochodzenie (origin): nagrania ('record') są trwałe, wpisy cache HTTP
+trybu live ('http_cache') i trybu cache ('cache') usuwa prune() - po
+HTTP_CACHE_MAX_AGE lub od najstarszych, gdy magazyn przekracza HTTP_CACHE_MAX_BYTES.
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from ..config import Settings
+from ..data_management import get_logger
+
+logger = get_logger(__name__)
+
+# Treść jest zapisywana po dekompresji - nagłówki kodowania nie pasowałyby do odtworzonej odpowiedzi
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie'}
+
+# Pochodzenie wpisów usuwanych przez prune() (nagrania 'record' i wpisy bez pochodzenia są trwałe)
+PRUNABLE_ORIGINS = ('http_cache', 'cache')
+
+
+def request_key(method: str, url: str) -> str:
+    """Klucz zapytania (sha256 z metody i pełnego URL)."""
+    return hashlib.sha256(f"{method.upper()} {url}".encode('utf-8')).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Zapis przez plik tymczasowy - równoległe wątki nie widzą połowy pliku."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class ResponseStore:
+    """Odpowiedzi HTTP na dysku: indeks zapytań + treści adresowane hashem."""
+    
+    def __init__(self, root: Optional[Path] = None):
+        """
+        Args:
+            root: Katalog magazynu (domyślnie Settings.TRANSPORT_STORE_DIR w chwili użycia)
+        """
+        self._root = root
+    
+    @property
+    def root(self) -> Path:
+        return self._root or Settings.TRANSPORT_STORE_DIR
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.root / "requests" / key[:2] / f"{key}.json"
+    
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+    
+    def put(self, key: str, response: requests.Response, origin: str = 'record') -> str:
+        """
+        Zapisuje odpowiedź pod kluczem zapytania.
+        
+        Args:
+            key: Klucz z request_key
+            response: Odpowiedź (treść jest wczytywana w całości)
+            origin: Pochodzenie wpisu (record/cache/http_cache - PRUNABLE_ORIGINS usuwane przez prune)
+        
+        Returns:
+            Hash sha256 treści
+        """
+        body = response.content
+        digest = hashlib.sha256(body).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            _write_atomic(object_path, body)
+        
+        entry = {
+            'method': response.request.method if response.request else 'GET',
+            'url': response.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'body': digest,
+            'stored_at': time.time(),
+            'origin': origin,
+        }
+        _write_atomic(self._entry_path(key), json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        return digest
+    
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """
+        Wczytuje zapisaną odpowiedź.
+        
+        Args:
+            key: Klucz z request_key
+        
+        Returns:
+            (wpis z metadanymi, treść) lub None gdy brak/uszkodzony wpis
+        """
+        try:
+            entry = json.loads(self._entry_path(key).read_text(encoding='utf-8'))
+            return entry, self._object_path(entry['body']).read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"⚠️  Uszkodzony wpis magazynu HTTP {key[:12]}: {e}")
+            return None
+    
+    def stats(self) -> Dict[str, int]:
+        """Liczba zapisanych zapytań, unikalnych treści i ich łączny rozmiar."""
+        objects = [p for p in (self.root / "objects").glob("*/*") if p.is_file()]
+        return {
+            'requests': sum(1 for _ in (self.root / "requests").glob("*/*.json")),
+            'objects': len(objects),
+            'bytes': sum(p.stat().st_size for p in objects),
+        }
+    
+    
+    def prune(self, max_age: Optional[float] = None, max_bytes: Optional[int] = None,
+              now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Usuwa stare wpisy cache (PRUNABLE_ORIGINS) i treści, do których nic się już nie odwołuje.
+        
+        Args:
+            max_age: Wiek wpisu w sekundach (domyślnie Settings.HTTP_CACHE_MAX_AGE; 0 = bez limitu)
+            max_bytes: Limit rozmiaru treści (domyślnie Settings.HTTP_CACHE_MAX_BYTES; 0 = bez limitu);
+                po przekroczeniu usuwane są najstarsze wpisy cache, nagrania zostają
+            now: Bieżący czas (testy)
+        
+        Returns:
+            Liczba usuniętych wpisów ('requests') i treści ('objects') oraz zwolnione bajty
+        """
+        max_age = Settings.HTTP_CACHE_MAX_AGE if max_age is None else max_age
+        max_bytes = Settings.HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        now = now or time.time()
+        removed = {'requests': 0, 'objects': 0, 'bytes': 0}
+        
+        entries: List[Tuple[float, Path, str, bool]] = []
+        for path in (self.root / "requests").glob("*/*.json"):
+            try:
+                entry = json.loads(path.read_text(encoding='utf-8'))
+                entries.append((entry['stored_at'], path, entry['body'], entry.get('origin') in PRUNABLE_ORIGINS))
+            except (OSError, ValueError, KeyError):
+                path.unlink(missing_ok=True)
+                removed['requests'] += 1
+        
+        def drop(item):
+            item[1].unlink(missing_ok=True)
+            references[item[2]] -= 1
+            removed['requests'] += 1
+        
+        references = Counter(digest for _, _, digest, _ in entries)
+        entries.sort()
+        kept = []
+        for item in entries:
+            if item[3] and max_age and now - item[0] > max_age:
+                drop(item)
+            else:
+                kept.append(item)
+        
+        sizes = {digest: self._size(digest) for digest in references}
+        total = sum(sizes[digest] for digest, count in references.items() if count > 0)
+        for item in kept:
+            if not max_bytes or total <= max_bytes:
+                break
+            if item[3]:
+                drop(item)
+                if references[item[2]] == 0:
+                    total -= sizes[item[2]]
+        
+        for path in (self.root / "objects").glob("*/*"):
+            if path.is_file() and references[path.name] <= 0:
+                removed['bytes'] += path.stat().st_size
+                path.unlink(missing_ok=True)
+                removed['objects'] += 1
+        return removed
+    
+    def _size(self, digest: str) -> int:
+        try:
+            return self._object_path(digest).stat().st_size
+        except OSError:
+            return 0
+
+
+# Globalny singleton
+response_store = ResponseStore()
+
+
+__all__ = ['ResponseStore', 'response_store', 'request_key', 'PRUNABLE_ORIGINS']
@@ -0,0 +1,165 @@
+"""
+Ponowienia pojedynczych zapytań i ładowań stron przy błędach przejściowych.
+
+Ponawiane są tylko błędy, które mogą minąć same:
+    sieć      - zerwane połączenie, timeout, statusy 429/500/502/503/504
+    WebDriver - timeout ładowania, błędy sieci Chrome (net::ERR_*), utracona sesja
+Pozostałe wyjątki (np. błąd parsowania, 404, otwarty breaker) są zgłaszane od razu.
+
+Opóźnienie: full jitter - losowo 0..min(RETRY_MAX_DELAY, RETRY_DELAY * 2^próba).
+Budżety ponowień (cały przebieg i host, grupy hostów jak w RATE_LIMITS) chronią
+przed mnożeniem ruchu, gdy serwis leży - po wyczerpaniu błąd wraca od razu.
+"""
+import random
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Optional
+
+import requests
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+
+from ..config import Settings
+from ..data_management import get_logger, metrics
+from .circuit_breaker import CircuitOpenError
+from .rate_limiter import HostRateLimiter
+
+logger = get_logger(__name__)
+
+_retries = metrics.counter("retries_total", "Ponowienia po błędach przejściowych", ["host", "reason"])
+_giveups = metrics.counter("retry_giveups_total", "Błędy przejściowe bez dalszych ponowień", ["host", "cause"])
+
+# Statusy HTTP oznaczające chwilowy problem serwera
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+
+def transient_reason(error: BaseException) -> Optional[str]:
+    """
+    Klasyfikuje wyjątek.
+    
+    Args:
+        error: Wyjątek zapytania lub WebDrivera
+    
+    Returns:
+        Powód błędu przejściowego (etykieta metryki) lub None gdy błąd trwały
+    """
+    from .replay_adapter import ReplayMissError
+    
+    if isinstance(error, (ReplayMissError, CircuitOpenError)):
+        return None
+    if isinstance(error, requests.Timeout):
+        return 'timeout'
+    if isinstance(error, (requests.ConnectionError, requests.exceptions.ChunkedEncodingError)):
+        return 'connection'
+    if isinstance(error, TimeoutException):
+        return 'driver_timeout'
+    if isinstance(error, InvalidSessionIdException):
+        return 'driver_crash'
+    if isinstance(error, WebDriverException) and 'net::ERR_' in (error.msg or ''):
+        return 'driver_network'
+    return None
+
+
+class RetryPolicy:
+    """Ponowienia z full jitter i budżetami per przebieg i per host."""
+    
+    def __init__(self, attempts: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None, run_budget: Optional[int] = None,
+                 host_budget: Optional[int] = None, sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            attempts: Maksymalna liczba prób (domyślnie Settings.MAX_RETRIES)
+            base_delay: Bazowe opóźnienie (domyślnie Settings.RETRY_DELAY)
+            max_delay: Górna granica opóźnienia (domyślnie Settings.RETRY_MAX_DELAY)
+            run_budget: Ponowienia w całym przebiegu (domyślnie Settings.RETRY_BUDGET_RUN)
+            host_budget: Ponowienia na host (domyślnie Settings.RETRY_BUDGET_HOST)
+            sleep: Funkcja oczekiwania (podmieniana w testach)
+        """
+        self._attempts = attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._run_budget = run_budget
+        self._host_budget = host_budget
+        self.sleep = sleep
+        self.spent: Counter = Counter()
+        self._lock = threading.Lock()
+        self._rng = random.Random()
+    
+    @property
+    def attempts(self) -> int:
+        return self._attempts or Settings.MAX_RETRIES
+    
+    def delay(self, attempt: int) -> float:
+        """Opóźnienie przed ponowieniem po próbie `attempt` (1 = pierwsza próba)."""
+        base = Settings.RETRY_DELAY if self._base_delay is None else self._base_delay
+        cap = Settings.RETRY_MAX_DELAY if self._max_delay is None else self._max_delay
+        with self._lock:
+            return self._rng.uniform(0, min(cap, base * 2 ** (attempt - 1)))
+    
+    def _spend(self, host: str) -> bool:
+        """Zużywa jedno ponowienie z budżetów (False gdy któryś wyczerpany)."""
+        run_budget = Settings.RETRY_BUDGET_RUN if self._run_budget is None else self._run_budget
+        host_budget = Settings.RETRY_BUDGET_HOST if self._host_budget is None else self._host_budget
+        with self._lock:
+            if self.spent[None] >= run_budget or self.spent[host] >= host_budget:
+                return False
+            self.spent[None] += 1
+            self.spent[host] += 1
+            return True
+    
+    def _retry_or_give_up(self, host: str, reason: str, attempt: int, url: str) -> bool:
+        """Decyzja o ponowieniu (z oczekiwaniem) po błędzie przejściowym."""
+        if attempt >= self.attempts:
+            _giveups.inc(host=host, cause='attempts')
+            return False
+        if not self._spend(host):
+            _giveups.inc(host=host, cause='budget')
+            logger.warning(f"⚠️  Budżet ponowień wyczerpany ({host}) - bez ponowienia {url}")
+            return False
+        delay = self.delay(attempt)
+        _retries.inc(host=host, reason=reason)
+        logger.debug("Ponowienie %d/%d (%s) za %.2fs: %s", attempt + 1, self.attempts, reason, delay, url)
+        self.sleep(delay)
+        return True
+    
+    def call(self, func: Callable[[], Any], url: str) -> Any:
+        """
+        Wywołuje func, ponawiając po błędach przejściowych.
+        
+        Wynik ze statusem z TRANSIENT_STATUSES (atrybut status_code) jest ponawiany jak
+        błąd; po ostatniej próbie zwracany bez zmian (wywołujący sprawdza status).
+        
+        Args:
+            func: Zapytanie lub ładowanie strony
+            url: Adres (host do budżetu i metryk)
+        
+        Returns:
+            Wynik func
+        """
+        host = HostRateLimiter.host_key(url)
+        attempt = 1
+        while True:
+            try:
+                result = func()
+            except Exception as e:
+                reason = transient_reason(e)
+                if reason is None or not self._retry_or_give_up(host, reason, attempt, url):
+                    raise
+            else:
+                status = getattr(result, 'status_code', None)
+                if status not in TRANSIENT_STATUSES or not self._retry_or_give_up(host, str(status), attempt, url):
+                    return result
+                result.close()
+            attempt += 1
+    
+    def reset(self):
+        """Zeruje zużycie budżetów (nowy przebieg)."""
+        with self._lock:
+            self.spent.clear()
+
+
+# Globalny singleton
+retry_policy = RetryPolicy()
+
+
+__all__ = ['RetryPolicy', 'retry_policy', 'transient_reason', 'TRANSIENT_STATUSES']
@@ -0,0 +1,38 @@
+"""
+Fabryka sesji HTTP dla scraperów i fetcherów (wspólna warstwa transportu).
+"""
+from typing import Dict, Optional
+
+import requests
+
+from ..config import Settings
+from .replay_adapter import RecordReplayAdapter
+from .response_store import ResponseStore
+
+
+def create_session(headers: Optional[Dict[str, str]] = None, store: Optional[ResponseStore] = None,
+                   mode: Optional[str] = None) -> requests.Session:
+    """
+    Tworzy sesję requests z adapterem record/replay dla http i https.
+    
+    Pula połączeń na host mieści HTTP_MAX_CONNECTIONS, więc równoległe zadania
+    silnika pobierania (fetch_engine) używają ponownie tych samych połączeń.
+    
+    Args:
+        headers: Nagłówki domyślne sesji (User-Agent, Accept, ...)
+        store: Magazyn odpowiedzi (domyślnie globalny response_store)
+        mode: Stały tryb transportu (domyślnie Settings.TRANSPORT_MODE w chwili zapytania)
+    
+    Returns:
+        Skonfigurowana sesja requests
+    """
+    session = requests.Session()
+    adapter = RecordReplayAdapter(store, mode, pool_maxsize=Settings.HTTP_MAX_CONNECTIONS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+__all__ = ['create_session']
@@ -0,0 +1,43 @@
+"""
+Wspólna konfiguracja testów - logi, dziennik przebiegu i cache w katalogach tymczasowych, stan breakerów per test.
+"""
+import pytest
+
+from src.config import Settings
+from src.data_management import Logger, cache_manager, run_log
+from src.transport import circuit_breakers
+
+
+@pytest.fixture(scope="session", autouse=True)
+def session_logs_dir(tmp_path_factory):
+    """Przekierowuje sinki logowania i run_log poza katalog logs/ repozytorium."""
+    logs_dir = tmp_path_factory.mktemp("logs")
+    original_logs_dir, original_run_log_path = Settings.LOGS_DIR, run_log.path
+    
+    Settings.LOGS_DIR = logs_dir
+    Logger.restart()
+    run_log.close()
+    run_log.path = logs_dir / "run_log.jsonl"
+    
+    yield logs_dir
+    
+    run_log.close()
+    run_log.path = original_run_log_path
+    Settings.LOGS_DIR = original_logs_dir
+    Logger.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Breakery są per host (wszystkie mocki to 127.0.0.1) - otwarty breaker nie przechodzi do kolejnego testu."""
+    circuit_breakers.reset()
+    yield
+    circuit_breakers.reset()
+
+
+@pytest.fixture(autouse=True)
+def isolated_runtime_cache(monkeypatch, tmp_path):
+    """Cache plików i magazyn HTTP w tmp_path - testy nie zapisują nic w cache/ repozytorium."""
+    (tmp_path / "cache").mkdir()
+    monkeypatch.setattr(cache_manager, 'cache_dir', tmp_path / "cache")
+    monkeypatch.setattr(Settings, 'TRANSPORT_STORE_DIR', tmp_path / "http")
@@ -0,0 +1,53 @@
+"""
+Testy dla analyzerów formy i home/away.
+"""
+import pytest
+from src.config import Settings
+from src.analyzers import FormAnalyzer, HomeAwayAnalyzer, score_results
+
+
+def _matches(results: str):
+    return [{'result': r} for r in results]
+
+
+TEAMS = [
+    ("Alpha", _matches("WWDLW")),
+    ("Beta", _matches("LLDWU")),
+    ("Gamma", []),
+    ("Delta", _matches("WDWDWDWD")),
+]
+
+
+def test_form_batch_matches_per_call():
+    """Test zgodności batch z analyze_form."""
+    analyzer = FormAnalyzer()
+    batch = analyzer.analyze_form_batch(TEAMS)
+    
+    for (team, matches), result in zip(TEAMS, batch):
+        single = analyzer.analyze_form(team, matches)
+        for key, value in single.items():
+            assert result[key] == value
+
+
+def test_home_away_batch_matches_per_call():
+    """Test zgodności batch z analyze_home_record."""
+    analyzer = HomeAwayAnalyzer()
+    batch = analyzer.analyze_records_batch(TEAMS, "home")
+    
+    for (team, matches), result in zip(TEAMS, batch):
+        single = analyzer.analyze_home_record(team, matches)
+        for key, value in single.items():
+            assert result[key] == value
+
+
+def test_score_results_trend():
+    """Test trendu formy - nowsze mecze mają większą wagę."""
+    scores = score_results([_matches("WWWLLL"), _matches("LLLWWW")], Settings.MATCHES_TO_ANALYZE)
+    
+    assert list(scores['points']) == [9, 9]
+    assert scores['trend'][0] > 0
+    assert scores['trend'][1] < 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
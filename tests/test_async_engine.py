@@ -0,0 +1,106 @@
+"""
+Testy silnika równoległego pobierania (limity na host, kolejność, fasada synchroniczna).
+"""
+import threading
+import time
+
+import pytest
+
+from src.config import Settings
+from src.data_management import run_log
+from src.transport import AsyncFetchEngine, create_session
+from benchmarks.mock_server import MockServer
+
+
+def test_map_respects_per_host_limit_and_order():
+    """Wyniki w kolejności wejścia, najwyżej per_host wywołań naraz, wyjątki zwracane."""
+    engine = AsyncFetchEngine(max_connections=8, per_host=3)
+    lock = threading.Lock()
+    state = {'now': 0, 'peak': 0}
+    
+    def work(n):
+        with lock:
+            state['now'] += 1
+            state['peak'] = max(state['peak'], state['now'])
+        time.sleep(0.02)
+        with lock:
+            state['now'] -= 1
+        if n == 5:
+            raise ValueError("błąd zadania")
+        return n * n
+    
+    results = engine.map(work, range(10), host="forebet")
+    engine.close()
+    
+    assert results[:5] == [0, 1, 4, 9, 16] and results[6:] == [36, 49, 64, 81]
+    assert isinstance(results[5], ValueError)
+    assert state['peak'] == 3
+
+
+def test_tasks_see_run_log_stage():
+    """Etapy run_log (contextvars) są widoczne w wątkach wykonawcy."""
+    engine = AsyncFetchEngine(per_host=2)
+    
+    def annotate(n):
+        with run_log.stage('engine_test', n=n) as record:
+            run_log.annotate(done=True)
+            return record
+    
+    records = engine.map(annotate, [1, 2], host="local")
+    engine.close()
+    
+    assert [r['done'] for r in records] == [True, True]
+
+
+def test_fetch_all_downloads_concurrently():
+    """Strony z mocka z opóźnieniem pobierane równolegle przez jedną sesję."""
+    engine = AsyncFetchEngine(per_host=8)
+    with MockServer(latency=0.1) as server:
+        session = create_session(mode="live")
+        urls = [f"{server.url}/en/hockey/matches/team-a-team-b-{n}" for n in range(8)]
+        
+        start = time.perf_counter()
+        responses = engine.fetch_all(session, urls + [f"{server.url}/nie-ma"])
+        elapsed = time.perf_counter() - start
+        session.close()
+    engine.close()
+    
+    assert all(r.status_code == 200 for r in responses[:8])
+    assert isinstance(responses[8], Exception)
+    assert elapsed < 0.5  # sekwencyjnie ≥ 0.9 s
+
+
+def test_stuck_task_times_out_without_blocking_stage():
+    """Zawieszone zadanie → TimeoutError po limicie, pozostałe wyniki zwrócone; domyślny limit skończony."""
+    engine = AsyncFetchEngine(max_connections=4, per_host=2)
+    release = threading.Event()
+    
+    def work(n):
+        if n == 0:
+            release.wait(5)
+        return n
+    
+    start = time.perf_counter()
+    results = engine.map(work, range(4), host="flashscore", timeout=0.2)
+    elapsed = time.perf_counter() - start
+    release.set()
+    engine.close()
+    
+    assert isinstance(results[0], TimeoutError) and results[1:] == [1, 2, 3]
+    assert elapsed < 2
+    assert 0 < AsyncFetchEngine().task_timeout < float('inf')
+
+
+def test_default_timeout_follows_request_timeouts(monkeypatch):
+    """Bez FETCH_TASK_TIMEOUT limit wynika z timeoutów stron i liczby prób; jawne ustawienie wygrywa."""
+    monkeypatch.setattr(Settings, 'MAX_RETRIES', 1)
+    monkeypatch.setattr(Settings, 'PAGE_LOAD_TIMEOUT', 30)
+    monkeypatch.setattr(Settings, 'READINESS_TIMEOUT', 15)
+    assert AsyncFetchEngine().task_timeout == 90.0
+    
+    monkeypatch.setattr(Settings, 'FETCH_TASK_TIMEOUT', 12)
+    assert AsyncFetchEngine().task_timeout == 12.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
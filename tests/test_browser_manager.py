@@ -0,0 +1,101 @@
+"""
+Testy cyklu życia przeglądarki: restart po limicie stron i RSS w długim przebiegu na lokalnym serwerze.
+"""
+import pytest
+import requests
+
+from src.config import Settings, Sport
+from src.scrapers import ForebtScraper
+from src.scrapers.browser_manager import BrowserManager
+from benchmarks.mock_server import MockServer
+
+
+class PageServerDriver:
+    """WebDriver ładujący strony przez HTTP; "pamięć" rośnie o `leak` bajtów na stronę."""
+    
+    def __init__(self, leak: int = 0):
+        self.leak = leak
+        self.rss = 100 << 20
+        self.page_source = ""
+        self.loaded = 0
+        self.closed = False
+    
+    def get(self, url):
+        assert not self.closed, "strona ładowana w zamkniętej przeglądarce"
+        self.page_source = requests.get(url, timeout=5).text
+        self.loaded += 1
+        self.rss += self.leak
+    
+    def execute_script(self, script, *args):
+        return ['complete', 1] if 'readyState' in script else 1
+    
+    def get_log(self, kind):
+        return []
+    
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def synthetic_server(monkeypatch):
+    """Mock z dniem syntetycznym, Settings skierowane na niego."""
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    monkeypatch.setattr(Settings, 'READINESS_POLL', 0.001)
+    monkeypatch.setattr(Settings, 'READINESS_IDLE_SECONDS', 0.0)
+    
+    with MockServer(synthetic=30) as server:
+        Settings.override_endpoints(server.url)
+        yield server
+
+
+def _scraper(drivers, leak: int = 0, **limits) -> ForebtScraper:
+    """Scraper Selenium z przeglądarkami-atrapami zbieranymi w `drivers`."""
+    def factory():
+        drivers.append(PageServerDriver(leak))
+        return drivers[-1]
+    
+    scraper = ForebtScraper(use_selenium=True)
+    scraper.browser = BrowserManager(factory, rss=lambda driver: driver.rss, **limits)
+    return scraper
+
+
+def test_long_run_recycles_by_page_count(synthetic_server):
+    """120 stron meczów z limitem 25 stron: 5 przeglądarek, każda zamknięta, forma z każdej strony."""
+    drivers = []
+    with _scraper(drivers, max_pages=25, max_rss_mb=0) as scraper:
+        with ForebtScraper(use_selenium=False) as http:
+            events = http._fetch_with_requests(Settings.get_sport_url(Sport.FOOTBALL), Sport.FOOTBALL)
+        urls = [event['match_url'] for event in events] * 4
+        forms = [scraper.fetch_team_form(url) for url in urls]
+    
+    assert len(forms) == 120 and all(form['home_form'] for form in forms)
+    assert [driver.loaded for driver in drivers] == [25, 25, 25, 25, 20]
+    assert all(driver.closed for driver in drivers)
+    assert scraper.browser.restarts == 4
+
+
+def test_rss_ceiling_restarts_before_next_page(synthetic_server):
+    """RSS rośnie o 60 MB na stronę, limit 400 MB: restart po 6 stronach, nigdy strona ponad limitem."""
+    drivers = []
+    with _scraper(drivers, max_pages=0, max_rss_mb=400, leak=60 << 20) as scraper:
+        url = Settings.get_sport_url(Sport.FOOTBALL)
+        for _ in range(20):
+            scraper.fetch_team_form(url)
+    
+    assert [driver.loaded for driver in drivers] == [6, 6, 6, 2]
+    assert all(driver.rss - driver.leak <= 400 << 20 for driver in drivers)
+
+
+def test_quit_without_browser_and_lazy_start():
+    """Bez stron przeglądarka nie startuje; quit bez przeglądarki jest bezpieczne."""
+    started = []
+    browser = BrowserManager(lambda: started.append(1) or PageServerDriver())
+    
+    browser.quit()
+    assert browser.current is None and not started
+    assert browser.page() is browser.page() and len(started) == 1 and browser.pages == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
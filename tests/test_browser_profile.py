@@ -0,0 +1,61 @@
+"""
+Testy profilu przeglądarki (opcje Chrome, blokada zasobów CDP, RSS drzewa procesów).
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.config import Settings
+from src.scrapers.browser_profile import chrome_options, block_resources, process_tree_rss
+
+
+def test_lean_profile_options():
+    """Lekki profil: eager, bez rozszerzeń i obrazów; pełny profil bez zmian."""
+    lean, full = chrome_options(lean=True), chrome_options(lean=False)
+    
+    assert lean.page_load_strategy == 'eager'
+    assert '--disable-extensions' in lean.arguments
+    assert lean.experimental_options['prefs']['profile.managed_default_content_settings.images'] == 2
+    assert full.page_load_strategy == 'normal'
+    assert '--window-size=1920,1080' in full.arguments
+
+
+def test_block_resources_sends_cdp_commands():
+    """Network.enable + Network.setBlockedURLs z wzorcami z Settings."""
+    class FakeDriver:
+        def __init__(self):
+            self.commands = []
+        
+        def execute_cdp_cmd(self, command, params):
+            self.commands.append((command, params))
+    
+    driver = FakeDriver()
+    
+    assert block_resources(driver)
+    assert driver.commands == [('Network.enable', {}),
+                               ('Network.setBlockedURLs', {'urls': Settings.BROWSER_BLOCKED_URLS})]
+    assert not block_resources(object())
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="wymaga /proc")
+def test_process_tree_rss_includes_children():
+    """RSS drzewa procesów obejmuje procesy potomne; zakończony proces = 0."""
+    script = "import sys, time; b = bytearray(64 << 20); print('ok', flush=True); time.sleep(10)"
+    child = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE, text=True)
+    try:
+        child.stdout.readline()
+        child_rss = process_tree_rss(child.pid)
+        tree_rss = process_tree_rss(os.getpid())
+    finally:
+        child.kill()
+        child.wait()
+    
+    assert child_rss >= 64 << 20
+    assert tree_rss > child_rss
+    assert process_tree_rss(child.pid) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,112 @@
+"""
+Testy circuit breakera per host (stany, próba po cooldownie) i kursów przy zablokowanym Flashscore.
+"""
+import time
+
+import pytest
+
+from src.config import Settings
+from src.data_management import cache_manager
+from src.odds_fetchers import FlashscoreFetcher, OddsAggregator
+from src.transport import CircuitBreaker, CircuitOpenError, circuit_breakers, create_session, rate_limiter, retry_policy
+from src.transport.circuit_breaker import CLOSED, HALF_OPEN, OPEN
+from benchmarks.mock_server import MockServer
+
+
+@pytest.fixture
+def failing_flashscore(monkeypatch, tmp_path):
+    """Mock odpowiadający 503 na wszystko, Settings skierowane na niego, ponowienia bez czekania."""
+    monkeypatch.setattr(cache_manager, 'cache_dir', tmp_path)
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    monkeypatch.setattr(Settings, 'RATE_LIMIT_DEFAULT', 1000.0)
+    monkeypatch.setattr(retry_policy, 'sleep', lambda seconds: None)
+    retry_policy.reset()
+    rate_limiter.reset()
+    
+    with MockServer(error_rate=1.0) as server:
+        Settings.override_endpoints(server.url)
+        yield server
+    
+    retry_policy.reset()
+    rate_limiter.reset()
+
+
+def test_opens_after_threshold_and_probes_after_cooldown():
+    """Próg kolejnych błędów otwiera; po cooldownie jedna próba - sukces zamyka, błąd otwiera ponownie."""
+    breaker = CircuitBreaker("flashscore", threshold=3, cooldown=0.05)
+    for _ in range(2):
+        breaker.record_failure()
+    breaker.record_success()
+    for _ in range(3):
+        assert breaker.allow()
+        breaker.record_failure()
+    
+    assert breaker.state == OPEN and breaker.is_open and not breaker.allow()
+    
+    time.sleep(0.06)
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CLOSED and breaker.allow()
+
+
+def test_session_rejected_without_request_when_open(failing_flashscore):
+    """Po BREAKER_FAILURE_THRESHOLD błędach kolejne zapytania nie trafiają do serwera."""
+    session = create_session(mode="live")
+    url = f"{failing_flashscore.url}/wyszukiwanie/?q=a"
+    for _ in range(3):
+        try:
+            session.get(url)
+        except CircuitOpenError:
+            pass
+    session.close()
+    
+    assert sum(failing_flashscore.stats.values()) == Settings.BREAKER_FAILURE_THRESHOLD
+    assert circuit_breakers.is_open(url)
+
+
+def test_odds_unavailable_when_flashscore_down(failing_flashscore):
+    """Zablokowany Flashscore: kilka zapytań, potem kursy "niedostępne (breaker open)" bez ruchu sieciowego."""
+    aggregator = OddsAggregator()
+    start = time.perf_counter()
+    results = [aggregator.aggregate_odds(f"m{i}", f"Home {i}", f"Away {i}") for i in range(20)]
+    elapsed = time.perf_counter() - start
+    aggregator.close()
+    
+    assert sum(failing_flashscore.stats.values()) == Settings.BREAKER_FAILURE_THRESHOLD
+    assert sum(result.get('unavailable') == 'breaker_open' for result in results) >= 19
+    assert not any(result['has_odds'] for result in results)
+    assert elapsed < 2
+
+
+def test_breaker_closes_when_service_recovers(monkeypatch, tmp_path):
+    """Po cooldownie udane zapytanie próbne zamyka breaker - kursy znowu pobierane."""
+    monkeypatch.setattr(cache_manager, 'cache_dir', tmp_path)
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    monkeypatch.setattr(Settings, 'BREAKER_COOLDOWN', 0.05)
+    
+    with MockServer() as server:
+        Settings.override_endpoints(server.url)
+        breaker = circuit_breakers.for_url(server.url)
+        for _ in range(Settings.BREAKER_FAILURE_THRESHOLD):
+            breaker.record_failure()
+        fetcher = FlashscoreFetcher()
+        blocked = fetcher.fetch_odds("x1", "Arsenal", "Chelsea")
+        time.sleep(0.06)
+        recovered = fetcher.fetch_odds("x2", "Arsenal", "Chelsea")
+        fetcher.close()
+    
+    assert blocked['unavailable'] == 'breaker_open'
+    assert 'unavailable' not in recovered
+    assert breaker.state == CLOSED
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
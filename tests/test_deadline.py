@@ -0,0 +1,115 @@
+"""
+Testy deadline przebiegu (budżet czasu, pomijanie opcjonalnych danych) i kolejności analizy zdarzeń.
+"""
+from datetime import datetime
+
+import pytest
+
+from src.analyzers import head_to_head_analyzer
+from src.config import Settings, Sport
+from src.data_management import H2HIndex, TeamHistoryStore, cache_manager
+from src.notifiers.email_templates import render_sport_email
+from src.scheduling import RunDeadline, event_priority, kickoff_time, prioritize
+from src.scrapers import ForebtScraper
+from benchmarks.mock_server import MockServer
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+class Clock:
+    """Ręcznie przesuwany zegar monotoniczny."""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+def _event(match_time, prob):
+    return {'match_time': match_time, 'probabilities': {'max': prob}}
+
+
+def test_kickoff_formats():
+    """Godzina z listingu, data europejska i ISO z JSON XHR; brak godziny → None."""
+    assert kickoff_time(_event("20:45", 60), NOW) == datetime(2026, 10, 19, 20, 45)
+    assert kickoff_time(_event("20/10/2026 01:30", 60), NOW) == datetime(2026, 10, 20, 1, 30)
+    assert kickoff_time(_event("2026-10-21 18:00:00", 60), NOW) == datetime(2026, 10, 21, 18, 0)
+    assert kickoff_time(_event(None, 60), NOW) is None
+    assert kickoff_time(_event("FT", 60), NOW) is None
+
+
+def test_priority_order():
+    """Nadchodzące od najbliższego (przy remisie wyższa przewaga), potem bez godziny, na końcu rozpoczęte."""
+    late, soon_weak, soon_strong, unknown, started = (
+        _event("21:00", 90), _event("13:00", 62), _event("13:00", 75), _event(None, 99), _event("09:00", 99)
+    )
+    ordered = prioritize([started, unknown, late, soon_weak, soon_strong], NOW)
+    
+    assert ordered == [soon_strong, soon_weak, late, unknown, started]
+    assert event_priority(soon_strong, NOW) < event_priority(soon_weak, NOW)
+
+
+def test_inputs_skipped_as_deadline_nears(monkeypatch):
+    """Kolejno pomijane: forma, H2H, kursy, sporty; bez budżetu wszystko dozwolone."""
+    monkeypatch.setattr(Settings, 'DEADLINE_RESERVE', 60)
+    monkeypatch.setattr(Settings, 'DEADLINE_SKIP_INPUTS', {'form': 300, 'h2h': 200, 'odds': 100})
+    clock = Clock()
+    deadline = RunDeadline(clock=clock)
+    assert deadline.allows('form') and deadline.remaining() == float('inf')
+    
+    deadline.start(1000)
+    allowed = []
+    for elapsed in (0, 700, 750, 850, 950):
+        clock.now = 1000.0 + elapsed
+        allowed.append([deadline.allows(name) for name in ('form', 'h2h', 'odds', 'sport')])
+    
+    assert allowed == [
+        [True, True, True, True],
+        [False, True, True, True],
+        [False, False, True, True],
+        [False, False, False, True],
+        [False, False, False, False],
+    ]
+    assert deadline.expired
+    assert deadline.skipped == {'form': 4, 'h2h': 3, 'odds': 2, 'sport': 1}
+    assert "form 4" in deadline.format_summary()[0]
+    
+    deadline.start(0)
+    assert deadline.allows('odds') and not deadline.expired and deadline.format_summary() == []
+
+
+def test_near_deadline_qualified_events_sent_without_optional_inputs(monkeypatch, tmp_path):
+    """Tuż przed deadline: bez stron meczów i kursów, zakwalifikowane zdarzenia dalej trafiają do emaila."""
+    import main as pipeline
+    
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    monkeypatch.setattr(cache_manager, 'cache_dir', tmp_path)
+    history = TeamHistoryStore(db_path=tmp_path / "history.sqlite3")
+    index = H2HIndex(db_path=tmp_path / "h2h.sqlite3")
+    monkeypatch.setattr(pipeline, 'team_history_store', history)
+    monkeypatch.setattr(head_to_head_analyzer, 'h2h_index', index)
+    deadline = RunDeadline()
+    deadline.start(Settings.DEADLINE_RESERVE + 30)
+    monkeypatch.setattr(pipeline, 'run_deadline', deadline)
+    
+    with MockServer(synthetic=30) as server:
+        Settings.override_endpoints(server.url)
+        with ForebtScraper(use_selenium=False) as scraper:
+            events = scraper.fetch_events_by_sport(Sport.FOOTBALL)
+            history.record_events(events)
+            filtered = [e for e in events if e['probabilities']['max'] >= Settings.NOTIFICATION_THRESHOLD]
+            qualified = pipeline.analyze_and_qualify_events(filtered, scraper)
+    history.close()
+    
+    routes = {route for route, _ in server.stats}
+    assert filtered and qualified
+    assert routes.isdisjoint({'match', 'search', 'odds'})
+    assert all(item['analysis']['odds']['unavailable'] == 'deadline' for item in qualified)
+    assert deadline.skipped['form'] and deadline.skipped['h2h'] == len(filtered)
+    assert "kursy pominięte (limit czasu przebiegu)" in render_sport_email('football', qualified)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
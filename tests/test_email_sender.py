@@ -0,0 +1,175 @@
+"""
+Testy wysyłki emaili na lokalnym serwerze SMTP (zamiast Gmail).
+"""
+import socketserver
+import threading
+import time
+
+import pytest
+from src.config import Settings
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimalna obsługa protokołu SMTP (EHLO, AUTH, MAIL, RCPT, DATA, QUIT)."""
+    
+    def _reply(self, line: str):
+        self.wfile.write(f"{line}\r\n".encode())
+    
+    def handle(self):
+        stats = self.server.stats
+        stats['connections'] += 1
+        self._reply("220 localhost ESMTP stand-in")
+        
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            
+            verb = line.decode(errors='replace').strip().split(' ')[0].upper()
+            
+            if verb == 'EHLO':
+                self._reply("250-localhost")
+                self._reply("250 AUTH PLAIN")
+            elif verb == 'HELO':
+                self._reply("250 localhost")
+            elif verb == 'AUTH':
+                stats['logins'] += 1
+                self._reply("235 Authentication successful")
+            elif verb in ('MAIL', 'RCPT', 'RSET', 'NOOP'):
+                self._reply("250 OK")
+            elif verb == 'DATA':
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                stats['messages'] += 1
+                self._reply("250 OK queued")
+                
+                # Symulacja zerwanego połączenia po N wiadomościach
+                if stats['drop_after'] and stats['messages'] % stats['drop_after'] == 0:
+                    break
+            elif verb == 'QUIT':
+                self._reply("221 Bye")
+                break
+            else:
+                self._reply("502 Command not implemented")
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    """Lokalny serwer SMTP na losowym porcie."""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+    server.daemon_threads = True
+    server.stats = {'connections': 0, 'logins': 0, 'messages': 0, 'drop_after': 0}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    
+    monkeypatch.setenv("GMAIL_USER", "scraper@example.com")
+    monkeypatch.setenv("GMAIL_PASSWORD", "secret")
+    monkeypatch.setenv("RECIPIENT_EMAIL", "me@example.com")
+    monkeypatch.setattr(Settings, "SMTP_SERVER", "127.0.0.1")
+    monkeypatch.setattr(Settings, "SMTP_PORT", server.server_address[1])
+    monkeypatch.setattr(Settings, "USE_TLS", False)
+    
+    yield server
+    
+    server.shutdown()
+    server.server_close()
+
+
+def _qualified(sport: str, count: int):
+    return [
+        {
+            'event': {'sport': sport, 'home_team': f"Home {i}", 'away_team': f"Away {i}",
+                      'match_time': f"{10 + i}:00", 'probabilities': {'home': 65, 'draw': 20, 'away': 15}},
+            'analysis': {},
+        }
+        for i in range(count)
+    ]
+
+
+def test_one_handshake_for_all_sports(smtp_server):
+    """Test jednego połączenia SMTP dla emaili wszystkich sportów."""
+    from src.notifiers import EmailSender
+    
+    events = _qualified('football', 3) + _qualified('basketball', 2) + _qualified('hockey', 1)
+    sender = EmailSender()
+    
+    start = time.perf_counter()
+    with sender.open_session() as session:
+        assert sender.send_qualified_events(events, session=session)
+        assert sender.send_no_events_notification(session=session)
+    elapsed = time.perf_counter() - start
+    
+    assert smtp_server.stats['messages'] == 4
+    assert smtp_server.stats['connections'] == 1
+    assert smtp_server.stats['logins'] == 1
+    assert session.handshakes == 1
+    print(f"\n4 wiadomości, {session.handshakes} handshake, {elapsed * 1000:.1f} ms")
+
+
+def test_reconnect_after_dropped_connection(smtp_server):
+    """Test ponownego połączenia gdy serwer zerwie połączenie."""
+    from src.notifiers import EmailSender
+    
+    smtp_server.stats['drop_after'] = 1
+    sender = EmailSender()
+    
+    assert sender.send_qualified_events(_qualified('football', 1) + _qualified('volleyball', 1))
+    assert smtp_server.stats['messages'] == 2
+    assert smtp_server.stats['connections'] == 2
+
+
+def test_dispatcher_sends_in_background(smtp_server):
+    """Test wysyłki z kolejki w tle - submit nie czeka na SMTP, flush dosyła wszystko."""
+    from src.notifiers import EmailSender, NotificationDispatcher
+    
+    with NotificationDispatcher(EmailSender(), max_retries=1, retry_delay=0) as dispatcher:
+        dispatcher.submit_sport('football', _qualified('football', 2))
+        dispatcher.submit_sport('basketball', _qualified('basketball', 1))
+        assert dispatcher.flush()
+        assert smtp_server.stats['messages'] == 2
+        
+        dispatcher.submit_no_events()
+    
+    assert dispatcher.all_succeeded
+    assert smtp_server.stats['messages'] == 3
+    assert smtp_server.stats['connections'] == 1
+    assert [result['attempts'] for result in dispatcher.results] == [1, 1, 1]
+
+
+def test_dispatcher_bounded_retries(smtp_server):
+    """Test ograniczonej liczby ponowień nieudanej wysyłki."""
+    from src.notifiers import EmailSender, NotificationDispatcher
+    
+    dispatcher = NotificationDispatcher(EmailSender(), max_retries=2, retry_delay=0)
+    dispatcher.submit_sport('football', [{'event': None}])  # Błąd renderowania
+    
+    assert not dispatcher.close()
+    assert dispatcher.results[0]['attempts'] == 3
+    assert smtp_server.stats['messages'] == 0
+
+
+def test_dispatcher_survives_failing_job(smtp_server, monkeypatch):
+    """Test że wyjątek w zadaniu nie zatrzymuje wątku i flush się kończy."""
+    from src.notifiers import EmailSender, NotificationDispatcher
+    
+    dispatcher = NotificationDispatcher(EmailSender(), max_retries=0, retry_delay=0)
+    deliver = dispatcher._deliver
+    
+    def failing_deliver(session, name, send):
+        if 'football' in name:
+            raise RuntimeError("bug w notifierze")
+        deliver(session, name, send)
+    
+    monkeypatch.setattr(dispatcher, '_deliver', failing_deliver)
+    dispatcher.submit_sport('football', _qualified('football', 1))
+    dispatcher.submit_sport('hockey', _qualified('hockey', 1))
+    
+    assert not dispatcher.flush(timeout=10)
+    assert [result['success'] for result in dispatcher.results] == [False, True]
+    assert not dispatcher.close(timeout=10)
+    assert smtp_server.stats['messages'] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
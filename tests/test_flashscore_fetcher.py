@@ -0,0 +1,26 @@
+"""
+Testy parsowania feedów kursów Flashscore.
+"""
+import pytest
+
+from src.odds_fetchers import FlashscoreFetcher
+from benchmarks import corpus
+
+
+def test_parse_flashscore_odds_record_separators():
+    """Kursy Nordic Bet z feedu df_od - znacznik OE poprzedzony separatorem rekordu '~'."""
+    fetcher = FlashscoreFetcher()
+    feeds = corpus.odds_feeds()
+    
+    odds = fetcher._parse_flashscore_odds(feeds['KxGt7mYq'], fetcher.NORDIC_BET_ID)
+    inline = fetcher._parse_flashscore_odds("OD¬AA¬37¬Nordic Bet~OE¬1.9¬3.3¬4.1¬", fetcher.NORDIC_BET_ID)
+    missing = fetcher._parse_flashscore_odds(feeds['Ht9sNc2R'], fetcher.NORDIC_BET_ID)
+    fetcher.close()
+    
+    assert odds == {'home': 2.96, 'draw': 3.16, 'away': 3.36}
+    assert inline == {'home': 1.9, 'draw': 3.3, 'away': 4.1}
+    assert missing is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
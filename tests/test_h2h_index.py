@@ -0,0 +1,57 @@
+"""
+Testy dla indeksu historii H2H.
+"""
+import pytest
+from src.data_management import TeamHistoryStore, H2HIndex
+from src.analyzers import HeadToHeadAnalyzer
+
+
+@pytest.fixture
+def index(tmp_path):
+    h2h = H2HIndex(db_path=tmp_path / "history.sqlite3")
+    yield h2h
+    h2h.close()
+
+
+H2H_MATCHES = [
+    {'date': '01.05.2025', 'home_team': 'Wisła Kraków', 'away_team': 'Cracovia', 'score': '2-0'},
+    {'date': '10.11.2024', 'home_team': 'Cracovia', 'away_team': 'Wisła Kraków', 'score': '1-1'},
+    {'date': '03.03.2024', 'home_team': 'Cracovia', 'away_team': 'Wisła Kraków', 'score': '0-1'},
+]
+
+
+def test_h2h_pair_is_unordered(index):
+    """Test wspólnego wpisu indeksu dla A-B i B-A."""
+    index.record_matches("Wisła Kraków", "Cracovia", H2H_MATCHES)
+    
+    assert not index.needs_refresh("Cracovia", "Wisła Kraków")
+    assert index.get_matches("Cracovia", "Wisła Kraków") == H2H_MATCHES
+    assert len(index.get_matches("Wisła Kraków", "Cracovia", limit=2)) == 2
+
+
+def test_h2h_stats_any_orientation(index):
+    """Test statystyk H2H liczonych z indeksu w obu orientacjach."""
+    index.record_matches("Wisła Kraków", "Cracovia", H2H_MATCHES)
+    analyzer = HeadToHeadAnalyzer()
+    
+    wisla = analyzer._calculate_h2h_stats(index.get_matches("Wisła Kraków", "Cracovia"), "Wisła Kraków")
+    cracovia = analyzer._calculate_h2h_stats(index.get_matches("Cracovia", "Wisła Kraków"), "Cracovia")
+    analyzer.close()
+    
+    assert (wisla['home_wins'], wisla['draws'], wisla['away_wins']) == (2, 1, 0)
+    assert (cracovia['home_wins'], cracovia['draws'], cracovia['away_wins']) == (0, 1, 2)
+
+
+def test_stores_share_one_connection(index, tmp_path):
+    """Test jednego połączenia SQLite dla magazynu formy i indeksu H2H."""
+    store = TeamHistoryStore(db_path=tmp_path / "history.sqlite3")
+    store.record_form("Wisła Kraków", "football", [{'result': 'W'}])
+    index.record_matches("Wisła Kraków", "Cracovia", H2H_MATCHES)
+    
+    assert store._shared is index._shared
+    assert store._connect() is index._connect()
+    assert len(index.get_matches("Wisła Kraków", "Cracovia")) == 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
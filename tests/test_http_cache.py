@@ -0,0 +1,126 @@
+"""
+Testy cache HTTP trybu live (ETag/Last-Modified, Cache-Control, zapytania warunkowe) na lokalnym mocku.
+"""
+import json
+import time
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.config import Settings
+from src.transport import ResponseStore, create_session, http_cache, request_key
+from benchmarks.mock_server import MockServer
+
+LISTING = "/en/hockey/predictions-today"
+
+
+def _session(tmp_path):
+    return create_session(store=ResponseStore(tmp_path / "http"), mode="live")
+
+
+def test_unchanged_page_revalidated_with_304(tmp_path):
+    """Druga wizyta: If-None-Match → 304, treść z magazynu, bajty zaoszczędzone."""
+    before = http_cache.summary()
+    with MockServer(validators=True) as server:
+        session = _session(tmp_path)
+        first = session.get(f"{server.url}{LISTING}")
+        second = session.get(f"{server.url}{LISTING}")
+    
+    after = http_cache.summary()
+    assert server.stats[('listing', 200)] == 1 and server.stats[('listing', 304)] == 1
+    assert second.status_code == 200 and second.content == first.content
+    assert second.headers['ETag'] == first.headers['ETag']
+    assert after['revalidated'] - before['revalidated'] == 1
+    assert after['bytes_saved'] - before['bytes_saved'] == len(first.content)
+
+
+def test_changed_page_downloaded_and_stored(tmp_path):
+    """Zmieniona strona (inny ETag) → pełna odpowiedź 200 i nowa treść w magazynie."""
+    with MockServer(validators=True) as server:
+        session = _session(tmp_path)
+        session.get(f"{server.url}{LISTING}")
+        pattern = next(key for key in server._listings if LISTING.endswith(key))
+        server._listings[pattern] = "<html><body>nowe prognozy</body></html>"
+        changed = session.get(f"{server.url}{LISTING}")
+        again = session.get(f"{server.url}{LISTING}")
+    
+    assert changed.text == again.text == "<html><body>nowe prognozy</body></html>"
+    assert server.stats[('listing', 200)] == 2 and server.stats[('listing', 304)] == 1
+
+
+def test_pages_without_validators_not_stored(tmp_path, monkeypatch):
+    """Bez ETag/Last-Modified/max-age (lub z HTTP_CACHE=False) nic nie trafia do magazynu."""
+    with MockServer() as plain, MockServer(validators=True) as validating:
+        _session(tmp_path).get(f"{plain.url}{LISTING}")
+        monkeypatch.setattr(Settings, 'HTTP_CACHE', False)
+        _session(tmp_path).get(f"{validating.url}{LISTING}")
+    
+    assert ResponseStore(tmp_path / "http").stats()['requests'] == 0
+
+
+def test_freshness_rules():
+    """max-age i Expires dają świeżość, no-cache wymusza rewalidację, no-store blokuje zapis."""
+    now = time.time()
+    fresh = {'stored_at': now - 30, 'headers': {'cache-control': 'public, max-age=60'}}
+    stale = {'stored_at': now - 90, 'headers': {'Cache-Control': 'max-age=60'}}
+    no_cache = {'stored_at': now, 'headers': {'Cache-Control': 'no-cache, max-age=600'}}
+    expires = CaseInsensitiveDict({'Date': 'Mon, 19 Oct 2026 06:00:00 GMT',
+                                   'Expires': 'Mon, 19 Oct 2026 06:05:00 GMT'})
+    
+    assert http_cache.is_fresh(fresh, now) and not http_cache.is_fresh(stale, now)
+    assert not http_cache.is_fresh(no_cache, now)
+    assert http_cache.freshness_lifetime(expires) == 300
+    no_store = requests.Response()
+    no_store.status_code = 200
+    no_store.headers = CaseInsensitiveDict({'ETag': '"x"', 'Cache-Control': 'no-store'})
+    assert not http_cache.is_storable(no_store)
+    assert http_cache.conditional_headers({'headers': {'etag': '"x"', 'Last-Modified': 'Mon'}}) == {
+        'If-None-Match': '"x"', 'If-Modified-Since': 'Mon'}
+
+
+def test_fresh_response_served_without_request(tmp_path):
+    """Odpowiedź z max-age w czasie świeżości - bez zapytania do serwera."""
+    store = ResponseStore(tmp_path / "http")
+    with MockServer(validators=True) as server:
+        session = create_session(store=store, mode="live")
+        url = f"{server.url}{LISTING}"
+        response = session.get(url)
+        response.headers['Cache-Control'] = 'max-age=3600'
+        store.put(request_key("GET", url), response)
+        cached = session.get(url)
+    
+    assert cached.content == response.content
+    assert sum(server.stats.values()) == 1
+
+
+def test_prune_removes_old_and_oversized_cache_entries_keeps_recordings(tmp_path):
+    """Stare wpisy cache usuwane, limit rozmiaru od najstarszych; nagrania i ich treści zostają."""
+    store = ResponseStore(tmp_path / "http")
+    with MockServer(validators=True) as server:
+        session = _session(tmp_path)
+        pages = [f"{server.url}/en/{sport}/predictions-today" for sport in ('hockey', 'basketball', 'volleyball')]
+        for page in pages:
+            session.get(page)
+        recorder = create_session(store=store, mode="record")
+        recorder.get(f"{server.url}/en/handball/predictions-today")
+    
+    now = time.time()
+    old_key = request_key("GET", pages[0])
+    entry, body = store.get(old_key)
+    entry['stored_at'] = now - 30 * 24 * 3600
+    (tmp_path / "http" / "requests" / old_key[:2] / f"{old_key}.json").write_text(json.dumps(entry), encoding='utf-8')
+    
+    removed = store.prune(max_age=7 * 24 * 3600, max_bytes=0, now=now)
+    assert removed['requests'] == 1 and store.get(old_key) is None
+    assert store.stats()['requests'] == 3
+    
+    recording_size = len(store.get(request_key("GET", f"{server.url}/en/handball/predictions-today"))[1])
+    store.prune(max_age=0, max_bytes=recording_size, now=now)
+    assert store.stats()['requests'] == 1
+    assert store.get(request_key("GET", f"{server.url}/en/handball/predictions-today")) is not None
+    assert store.stats()['bytes'] == recording_size
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
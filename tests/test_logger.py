@@ -0,0 +1,98 @@
+"""
+Testy logowania przez wspólną kolejkę.
+"""
+import logging
+import threading
+
+import pytest
+
+from src.config import Settings
+from src.data_management.logger import Logger, HotPathLogger
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    """Wspólne sinki logowania w katalogu tymczasowym testu."""
+    monkeypatch.setattr(Settings, "LOGS_DIR", tmp_path)
+    Logger.restart()
+    yield tmp_path
+    monkeypatch.undo()
+    Logger.restart()  # Z powrotem do katalogu logów sesji testowej
+
+
+def test_loggers_share_one_queue_handler(logs_dir):
+    """Test jednego handlera kolejki i jednego pliku dla wszystkich loggerów."""
+    first = Logger.get_logger("test.logger.first")
+    second = Logger.get_logger("test.logger.second")
+    
+    assert first.handlers == second.handlers == [Logger.get_queue_handler()]
+    
+    file_handlers = [h for h in Logger._listener.handlers
+                     if isinstance(h, logging.FileHandler) and h.level == logging.NOTSET]
+    assert len(file_handlers) == 1
+
+
+def test_concurrent_logging_is_not_lost(logs_dir):
+    """Test zapisu rekordów z wielu wątków do wspólnego pliku."""
+    logger = Logger.get_logger("test.logger.threads")
+    
+    def worker(index):
+        for i in range(50):
+            logger.info("wątek %d rekord %d", index, i)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    logger.error("błąd testowy")
+    Logger.shutdown()
+    
+    lines = (logs_dir / "forebet_scraper.log").read_text(encoding="utf-8").splitlines()
+    assert sum("test.logger.threads" in line for line in lines) == 201
+    assert "błąd testowy" in (logs_dir / "forebet_scraper_errors.log").read_text(encoding="utf-8")
+
+
+def test_records_after_shutdown_are_not_dropped(logs_dir):
+    """Test zapisu rekordów zalogowanych po zatrzymaniu listenera."""
+    logger = Logger.get_logger("test.logger.late")
+    Logger.shutdown()
+    
+    logger.warning("rekord po shutdown")
+    
+    assert "rekord po shutdown" in (logs_dir / "forebet_scraper.log").read_text(encoding="utf-8")
+
+
+def test_hot_logger_is_lazy_and_sampled():
+    """Test leniwego formatowania na INFO i próbkowania logów per-wiersz."""
+    class Loud:
+        formatted = 0
+        
+        def __str__(self):
+            Loud.formatted += 1
+            return "loud"
+    
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    log = logging.getLogger("test.logger.hot")
+    log.propagate = False
+    log.addHandler(handler)
+    hot = HotPathLogger(log, sample_every=3)
+    
+    log.setLevel(logging.INFO)
+    for i in range(1, 10):
+        hot.sampled(i, "wiersz %d: %s", i, Loud())
+    assert records == [] and Loud.formatted == 0
+    
+    log.setLevel(logging.DEBUG)
+    for i in range(1, 10):
+        hot.sampled(i, "wiersz %d", i)
+    assert [record.getMessage() for record in records] == ["wiersz 1", "wiersz 4", "wiersz 7"]
+    
+    log.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
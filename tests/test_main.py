@@ -0,0 +1,118 @@
+"""
+Testy przebiegu orchestratora (main.run) z atrapami listingu i wysyłki emaili.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.config import Settings, Sport
+
+
+class FakeScraper:
+    """Scraper zwracający przygotowane listingi sportów."""
+    
+    listings = {}
+    
+    def __init__(self, use_selenium=True):
+        self.use_selenium = use_selenium
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def fetch_events_by_sport(self, sport):
+        return self.listings.get(sport, [])
+
+
+class FakeDispatcher:
+    """Kolejka powiadomień zapisująca zlecone emaile; flush zwraca `success`."""
+    
+    success = True
+    
+    def __init__(self, email_sender):
+        self.submitted = []
+        FakeDispatcher.last = self
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+    
+    def submit_sport(self, sport, qualified_events):
+        self.submitted.append((sport, [item['event']['home_team'] for item in qualified_events]))
+    
+    def submit_no_events(self):
+        self.submitted.append(('no_events', []))
+    
+    def flush(self):
+        return self.success
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """main z atrapami scrapera, wysyłki, sekretów i magazynów historii."""
+    import main
+    
+    monkeypatch.setattr(main, 'ForebtScraper', FakeScraper)
+    monkeypatch.setattr(main, 'NotificationDispatcher', FakeDispatcher)
+    monkeypatch.setattr(main, 'EmailSender', lambda: None)
+    monkeypatch.setattr(main.secrets, 'validate_required_secrets', lambda: True)
+    monkeypatch.setattr(main.cache_manager, 'cleanup_expired', lambda: 0)
+    monkeypatch.setattr(main.response_store, 'prune', lambda: {'requests': 0, 'objects': 0, 'bytes': 0})
+    monkeypatch.setattr(main.team_history_store, 'record_events', lambda events: None)
+    monkeypatch.setattr(main.h2h_index, 'record_events', lambda events: None)
+    monkeypatch.setattr(Settings, 'SUPPORTED_SPORTS', [Sport.FOOTBALL, Sport.HOCKEY])
+    monkeypatch.setattr(FakeScraper, 'listings', {})
+    monkeypatch.setattr(FakeDispatcher, 'success', True)
+    return main
+
+
+def _event(sport, home, kickoff, prob=70):
+    return {'sport': sport.value, 'home_team': home, 'away_team': 'X',
+            'match_time': kickoff.strftime('%Y-%m-%d %H:%M'), 'probabilities': {'max': prob}}
+
+
+def test_events_of_all_sports_analyzed_in_one_priority_order(pipeline, monkeypatch):
+    """Wcześniejsze rozpoczęcie w późniejszym sporcie analizowane przed późnym meczem pierwszego sportu."""
+    soon = datetime.now() + timedelta(hours=1)
+    FakeScraper.listings = {
+        Sport.FOOTBALL: [_event(Sport.FOOTBALL, 'Late FC', soon + timedelta(hours=8)),
+                         _event(Sport.FOOTBALL, 'Weak', soon, 40)],
+        Sport.HOCKEY: [_event(Sport.HOCKEY, 'Early HC', soon)],
+    }
+    analyzed = []
+    
+    def analyze(events, scraper=None):
+        analyzed.extend(event['home_team'] for event in events)
+        return [{'event': event, 'analysis': {}, 'qualification_reason': 'ok'} for event in events]
+    
+    monkeypatch.setattr(pipeline, 'analyze_and_qualify_events', analyze)
+    
+    assert pipeline.run() == 0
+    assert analyzed == ['Early HC', 'Late FC']
+    assert FakeDispatcher.last.submitted == [('football', ['Late FC']), ('hockey', ['Early HC'])]
+
+
+def test_no_events_exit_code_ignores_notification_failure(pipeline):
+    """Brak zdarzeń: powiadomienie w kolejce, kod 0 także gdy jego wysyłka się nie powiodła."""
+    FakeDispatcher.success = False
+    
+    assert pipeline.run() == 0
+    assert FakeDispatcher.last.submitted == [('no_events', [])]
+
+
+def test_failed_sport_email_returns_error(pipeline, monkeypatch):
+    """Kwalifikowane zdarzenia i nieudana wysyłka emaila → kod 1."""
+    FakeScraper.listings = {Sport.HOCKEY: [_event(Sport.HOCKEY, 'Early HC', datetime.now() + timedelta(hours=1))]}
+    monkeypatch.setattr(pipeline, 'analyze_and_qualify_events', lambda events, scraper=None: [
+        {'event': event, 'analysis': {}, 'qualification_reason': 'ok'} for event in events])
+    FakeDispatcher.success = False
+    
+    assert pipeline.run() == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
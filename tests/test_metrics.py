@@ -0,0 +1,89 @@
+"""
+Testy rejestru metryk i pliku textfile Prometheusa.
+"""
+import re
+
+import pytest
+
+from src.data_management import CacheManager, MetricsRegistry, metrics
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(.*)\})? (\S+)$')
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def _parse_textfile(text):
+    """Minimalny parser formatu tekstowego: {(nazwa, etykiety): wartość} i typy."""
+    samples, types = {}, {}
+    for line in text.splitlines():
+        if line.startswith('# TYPE '):
+            _, _, name, metric_type = line.split(' ')
+            types[name] = metric_type
+            continue
+        if line.startswith('#') or not line:
+            continue
+        match = _SAMPLE.match(line)
+        assert match, f"Niepoprawna linia: {line!r}"
+        name, _, labels, value = match.groups()
+        key = (name, tuple(sorted(_LABEL.findall(labels or ''))))
+        assert key not in samples, f"Zduplikowana próbka: {line!r}"
+        samples[key] = float(value)
+    return samples, types
+
+
+def test_textfile_is_parseable(tmp_path):
+    """Test formatu: liczniki, gauge i histogram z kumulatywnymi kubełkami."""
+    registry = MetricsRegistry(namespace="test")
+    requests_total = registry.counter("requests_total", "Zapytania", ["endpoint", "result"])
+    requests_total.inc(endpoint="search", result="ok")
+    requests_total.inc(2, endpoint="search", result="ok")
+    requests_total.inc(endpoint='odds "feed"', result="error")
+    registry.gauge("run_duration_seconds", "Czas").set(12.5)
+    latency = registry.histogram("latency_seconds", "Opóźnienie", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 3.0):
+        latency.observe(value)
+    
+    path = registry.write_textfile(tmp_path / "forebet.prom")
+    samples, types = _parse_textfile(path.read_text(encoding='utf-8'))
+    
+    assert types == {'test_requests_total': 'counter', 'test_run_duration_seconds': 'gauge',
+                     'test_latency_seconds': 'histogram'}
+    assert samples[('test_requests_total', (('endpoint', 'search'), ('result', 'ok')))] == 3
+    assert samples[('test_requests_total', (('endpoint', 'odds \\"feed\\"'), ('result', 'error')))] == 1
+    assert samples[('test_run_duration_seconds', ())] == 12.5
+    assert samples[('test_latency_seconds_bucket', (('le', '0.1'),))] == 1
+    assert samples[('test_latency_seconds_bucket', (('le', '1'),))] == 2
+    assert samples[('test_latency_seconds_bucket', (('le', '+Inf'),))] == 3
+    assert samples[('test_latency_seconds_count', ())] == 3
+    assert samples[('test_latency_seconds_sum', ())] == pytest.approx(3.55)
+    assert not list(tmp_path.glob('.*.tmp'))
+
+
+def test_labels_are_validated():
+    """Test odrzucenia brakujących etykiet i rejestracji z innym typem."""
+    registry = MetricsRegistry(namespace="test")
+    counter = registry.counter("events_total", "Zdarzenia", ["sport"])
+    
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        registry.gauge("events_total", "Zdarzenia", ["sport"])
+    assert registry.counter("events_total", "Zdarzenia", ["sport"]) is counter
+
+
+def test_cache_manager_is_instrumented(tmp_path):
+    """Test metryk cache w globalnym rejestrze i pliku textfile."""
+    cache = CacheManager(cache_dir=tmp_path / "cache")
+    lookups = metrics.counter("cache_lookups_total", "Odczyty cache wg wyniku (hit/miss/expired/error)", ["result"])
+    hits, misses = lookups.value(result='hit'), lookups.value(result='miss')
+    
+    assert cache.load("events_football") is None
+    cache.save("events_football", [{'match_id': '1'}])
+    assert cache.load("events_football") == [{'match_id': '1'}]
+    
+    samples, _ = _parse_textfile(metrics.write_textfile(tmp_path / "forebet.prom").read_text(encoding='utf-8'))
+    assert samples[('forebet_cache_lookups_total', (('result', 'hit'),))] == hits + 1
+    assert samples[('forebet_cache_lookups_total', (('result', 'miss'),))] == misses + 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,58 @@
+"""
+Testy lokalnego mocka Forebet/Flashscore i nadpisania endpointów w Settings.
+"""
+import pytest
+import requests
+
+from src.config import Settings, Sport
+from src.scrapers import ForebtScraper
+from src.odds_fetchers import FlashscoreFetcher
+from benchmarks import corpus
+from benchmarks.mock_server import MockServer
+
+
+@pytest.fixture
+def mock_endpoints(monkeypatch):
+    """Mock uruchomiony w tle, Settings skierowane na niego (przywracane po teście)."""
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    
+    with MockServer() as server:
+        Settings.override_endpoints(server.url)
+        yield server
+
+
+def test_scraper_and_fetcher_follow_override(mock_endpoints):
+    """Listing, strona meczu, wyszukiwarka i feed kursów serwowane przez mock."""
+    with ForebtScraper(use_selenium=False) as scraper:
+        events = scraper._fetch_with_requests(Settings.get_sport_url(Sport.HOCKEY), Sport.HOCKEY)
+        form = scraper.fetch_team_form(events[0]['match_url'])
+    
+    fetcher = FlashscoreFetcher()
+    flashscore_id = fetcher._search_match("Arsenal", "Chelsea", "football")
+    odds = fetcher._fetch_match_odds(flashscore_id)
+    fetcher.close()
+    
+    assert events and events[0]['match_url'].startswith(mock_endpoints.url)
+    assert form['home_form'] and form['away_form']
+    assert flashscore_id in corpus.odds_feeds()
+    assert mock_endpoints.stats[('listing', 200)] == 1
+    assert mock_endpoints.stats[('odds', 200)] == 1
+    assert odds is None or odds['match_id'] == flashscore_id
+
+
+def test_rate_limit_errors_and_fsign():
+    """429 po przekroczeniu limitu, 503 przy error_rate=1, 401 dla feedu bez X-Fsign."""
+    feed = "/x/feed/df_od_1_KxGt7mYq_1_eu_1"
+    with MockServer(rate_limit=2) as limited, MockServer(error_rate=1.0) as failing, MockServer() as plain:
+        statuses = [requests.get(f"{limited.url}{feed}", headers={'X-Fsign': 'x'}).status_code for _ in range(4)]
+        unsigned = requests.get(f"{plain.url}{feed}")
+        broken = requests.get(f"{failing.url}/en/hockey/predictions-today")
+    
+    assert statuses[:2] == [200, 200] and 429 in statuses[2:]
+    assert unsigned.status_code == 401
+    assert broken.status_code == 503
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
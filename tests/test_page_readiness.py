@@ -0,0 +1,76 @@
+"""
+Testy warunków gotowości stron Selenium (atrapa WebDrivera z DOM zmieniającym się w czasie).
+"""
+import time
+
+import pytest
+
+from src.config import Settings
+from src.scrapers.page_readiness import DomStable, NetworkIdle, wait_until_ready
+
+
+class FakeDriver:
+    """WebDriver z liczbą elementów i zasobów rosnącą do `final` przez `grow_for` sekund."""
+    
+    def __init__(self, final: int, grow_for: float, resources: int = 5):
+        self.start = time.monotonic()
+        self.final = final
+        self.grow_for = grow_for
+        self.resources = resources
+        self.scripts = 0
+    
+    def _progress(self) -> float:
+        return min(1.0, (time.monotonic() - self.start) / self.grow_for) if self.grow_for else 1.0
+    
+    def execute_script(self, script, *args):
+        self.scripts += 1
+        if 'readyState' in script:
+            state = 'complete' if self._progress() >= 1.0 else 'interactive'
+            return [state, int(self.resources * self._progress())]
+        return int(self.final * self._progress())
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(monkeypatch):
+    monkeypatch.setattr(Settings, 'READINESS_POLL', 0.02)
+    monkeypatch.setattr(Settings, 'READINESS_IDLE_SECONDS', 0.1)
+
+
+def test_listing_ready_after_rows_stop_growing():
+    """Listing gotowy dopiero gdy liczba wierszy przestaje rosnąć (nie przy pierwszym wierszu)."""
+    driver = FakeDriver(final=40, grow_for=0.3)
+    ready, seconds = wait_until_ready(driver, 'listing', timeout=2)
+    
+    assert ready
+    assert 0.3 <= seconds < 0.6
+
+
+def test_match_without_sections_ready_on_network_idle():
+    """Strona meczu bez sekcji formy/H2H - gotowość po bezczynności sieci, nie po timeoucie."""
+    driver = FakeDriver(final=0, grow_for=0.1)
+    ready, seconds = wait_until_ready(driver, 'match', timeout=2)
+    
+    assert ready
+    assert seconds < 0.5
+
+
+def test_timeout_reports_not_ready():
+    """DOM rosnący dłużej niż timeout - (False, ~timeout)."""
+    driver = FakeDriver(final=10_000, grow_for=5)
+    ready, seconds = wait_until_ready(driver, 'listing', timeout=0.2)
+    
+    assert not ready
+    assert 0.2 <= seconds < 0.5
+
+
+def test_conditions_are_stateful_per_page():
+    """DomStable liczy kolejne niezmienione odpytania; NetworkIdle mierzy czas od ostatniego zasobu."""
+    condition = DomStable("tr", polls=2)
+    driver = FakeDriver(final=3, grow_for=0)
+    
+    assert [condition(driver) for _ in range(3)] == [False, False, True]
+    assert not NetworkIdle(idle=0.05)(driver)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,62 @@
+"""
+Testy limitu zapytań per host (token bucket z adaptacją na 429/503).
+"""
+import time
+
+import pytest
+
+from src.transport import TokenBucket, HostRateLimiter, create_session, rate_limiter
+from benchmarks.mock_server import MockServer
+
+
+def test_bucket_paces_after_burst():
+    """Po wyczerpaniu burstu tokeny wydawane w tempie rate."""
+    bucket = TokenBucket(rate=50, burst=2)
+    start = time.monotonic()
+    waits = [bucket.acquire() for _ in range(7)]
+    elapsed = time.monotonic() - start
+    
+    assert max(waits[:2]) < 0.005
+    assert 0.09 <= elapsed < 0.3  # 5 tokenów po 20 ms
+
+
+def test_throttle_halves_rate_honours_retry_after_and_recovers():
+    """429 obniża tempo o połowę i wstrzymuje host; sukcesy przywracają tempo."""
+    bucket = TokenBucket(rate=40, burst=1, min_rate=1)
+    bucket.acquire()
+    bucket.throttle(retry_after=0.2)
+    
+    assert bucket.rate == 20
+    assert bucket.acquire() >= 0.19
+    
+    for _ in range(150):
+        bucket.recover()
+    assert bucket.rate == 40
+
+
+def test_host_groups_share_bucket():
+    """www.forebet.com i forebet.com oraz hosty Flashscore dzielą kubełki."""
+    limiter = HostRateLimiter()
+    
+    assert limiter.bucket("https://www.forebet.com/pl/x") is limiter.bucket("https://forebet.com/en/y")
+    assert limiter.bucket("https://www.flashscore.pl/") is limiter.bucket("https://d.flashscore.com/x/feed/a")
+    assert limiter.bucket("http://127.0.0.1:1/") is not limiter.bucket("https://www.forebet.com/")
+
+
+def test_session_slows_down_on_429():
+    """Sesja transportu zwalnia po 429 z mocka (Retry-After) - ponowienia i kolejne zapytania przechodzą."""
+    rate_limiter.reset()
+    with MockServer(rate_limit=5) as server:
+        session = create_session(mode="live")
+        statuses = [session.get(f"{server.url}/en/hockey/predictions-today").status_code for _ in range(20)]
+        session.close()
+        rate = rate_limiter.bucket(server.url).rate
+    rate_limiter.reset()
+    
+    assert statuses == [200] * 20
+    assert 1 <= server.stats[('listing', 429)] <= 3
+    assert rate < 15
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,141 @@
+"""
+Testy polityki ponowień (błędy przejściowe vs trwałe, jitter, budżety) i jej użycia w transporcie i scraperze.
+"""
+import pytest
+import requests
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from src.config import Settings, Sport
+from src.data_management import cache_manager
+from src.scrapers import ForebtScraper
+from src.transport import RetryPolicy, ReplayMissError, create_session, rate_limiter, retry_policy, transient_reason
+from benchmarks.mock_server import MockServer
+
+
+class Flaky:
+    """Wywołanie zgłaszające kolejne błędy z listy, potem zwracające 'ok'."""
+    
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+class Status:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.closed = False
+    
+    def close(self):
+        self.closed = True
+
+
+def _policy(**kwargs) -> RetryPolicy:
+    delays = kwargs.pop('delays', [])
+    return RetryPolicy(sleep=delays.append, **kwargs)
+
+
+def test_transient_classification():
+    """Sieć, timeouty i błędy sieci Chrome są przejściowe; brak nagrania i błędy parsowania - nie."""
+    assert transient_reason(requests.ConnectionError()) == 'connection'
+    assert transient_reason(requests.ReadTimeout()) == 'timeout'
+    assert transient_reason(TimeoutException()) == 'driver_timeout'
+    assert transient_reason(WebDriverException("unknown error: net::ERR_CONNECTION_RESET")) == 'driver_network'
+    assert transient_reason(WebDriverException("no such element")) is None
+    assert transient_reason(ReplayMissError("brak")) is None
+    assert transient_reason(ValueError("parse")) is None
+
+
+def test_transient_errors_retried_permanent_fail_fast():
+    """Dwa błędy sieci → trzecia próba udana; błąd parsowania zgłoszony po jednej próbie."""
+    delays = []
+    policy = _policy(attempts=3, base_delay=1.0, max_delay=10.0, delays=delays)
+    flaky = Flaky(requests.ConnectionError(), requests.ReadTimeout())
+    broken = Flaky(ValueError("zły HTML"))
+    
+    assert policy.call(flaky, "https://www.forebet.com/x") == 'ok' and flaky.calls == 3
+    with pytest.raises(ValueError):
+        policy.call(broken, "https://www.forebet.com/x")
+    assert broken.calls == 1
+    assert len(delays) == 2 and 0 <= delays[0] <= 1.0 and 0 <= delays[1] <= 2.0
+
+
+def test_transient_status_retried_then_returned():
+    """503 ponawiane do limitu prób, ostatnia odpowiedź zwracana (poprzednie zamknięte)."""
+    responses = [Status(503), Status(503), Status(503)]
+    policy = _policy(attempts=3)
+    result = policy.call(lambda: responses.pop(0) if len(responses) > 1 else responses[0], "https://x/")
+    
+    assert result.status_code == 503 and not result.closed
+
+
+def test_budgets_per_host_and_run():
+    """Budżet hosta wyczerpany → bez ponowień dla hosta, inne hosty dalej do budżetu przebiegu."""
+    policy = _policy(attempts=5, run_budget=3, host_budget=2)
+    
+    with pytest.raises(requests.ConnectionError):
+        policy.call(Flaky(*[requests.ConnectionError()] * 5), "https://www.flashscore.pl/a")
+    assert policy.spent["flashscore"] == 2
+    
+    flaky = Flaky(requests.ConnectionError(), requests.ConnectionError())
+    with pytest.raises(requests.ConnectionError):
+        policy.call(flaky, "https://www.forebet.com/b")
+    assert flaky.calls == 2 and policy.spent[None] == 3
+    
+    policy.reset()
+    assert policy.call(Flaky(requests.ConnectionError()), "https://www.forebet.com/b") == 'ok'
+
+
+def test_jitter_spreads_delays():
+    """Full jitter: opóźnienia w 0..min(cap, base·2^n) i różne między wywołaniami."""
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+    delays = [policy.delay(4) for _ in range(50)]
+    
+    assert all(0 <= delay <= 3.0 for delay in delays)
+    assert len(set(delays)) > 40
+
+
+def test_session_retries_server_errors(monkeypatch):
+    """Sesja transportu ponawia 503 z mocka - wywołujący widzi wyłącznie 200."""
+    monkeypatch.setattr(retry_policy, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(Settings, 'MAX_RETRIES', 6)
+    monkeypatch.setattr(Settings, 'RATE_LIMIT_DEFAULT', 1000.0)
+    retry_policy.reset()
+    rate_limiter.reset()
+    with MockServer(error_rate=0.3, seed=7) as server:
+        session = create_session(mode="live")
+        statuses = [session.get(f"{server.url}/en/hockey/predictions-today").status_code for _ in range(10)]
+        session.close()
+    retry_policy.reset()
+    rate_limiter.reset()
+    
+    assert statuses == [200] * 10
+    assert server.stats[('listing', 503)] > 0
+
+
+def test_listing_parse_error_fails_fast(monkeypatch, tmp_path):
+    """Błąd parsowania listingu nie powtarza pobrania (dawniej: cały listing ponawiany z czekaniem)."""
+    monkeypatch.setattr(cache_manager, 'cache_dir', tmp_path)
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    
+    def broken_parser(soup, sport):
+        raise ValueError("zmieniony układ strony")
+    
+    with MockServer() as server:
+        Settings.override_endpoints(server.url)
+        with ForebtScraper(use_selenium=False) as scraper:
+            monkeypatch.setattr(scraper, '_parse_events', broken_parser)
+            with pytest.raises(ValueError):
+                scraper.fetch_events_by_sport(Sport.HOCKEY)
+    
+    assert server.stats[('listing', 200)] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,112 @@
+"""
+Testy strukturalnego dziennika przebiegu.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.data_management import RunLog, run_profiler
+
+
+def test_stage_records_and_percentiles(tmp_path):
+    """Test rekordów etapów (zagnieżdżenie, cache, bajty) i statystyk p50/p95."""
+    run_log = RunLog(path=tmp_path / "run_log.jsonl")
+    
+    with run_log.stage('listing', sport='football'):
+        run_log.annotate(cache='miss')
+        run_log.add_bytes(1000)
+        with run_log.stage('parse', sport='football') as record:
+            record['rows'] = 3
+        run_log.add_bytes(500)
+    
+    with pytest.raises(ValueError):
+        with run_log.stage('odds', match_id='1'):
+            raise ValueError("timeout")
+    
+    with run_log.stage('email', name='email football'):  # Pole 'name' nie koliduje z nazwą etapu
+        pass
+    
+    run_log.annotate(cache='hit')  # Poza etapem - ignorowane
+    run_log.close()
+    
+    records = [json.loads(line) for line in (tmp_path / "run_log.jsonl").read_text(encoding="utf-8").splitlines()]
+    assert [r['stage'] for r in records] == ['parse', 'listing', 'odds', 'email']
+    assert records[0]['rows'] == 3 and 'bytes' not in records[0]
+    assert records[1]['cache'] == 'miss' and records[1]['bytes'] == 1500
+    assert records[2]['status'] == 'error' and records[2]['error'] == 'timeout'
+    assert records[3]['name'] == 'email football'
+    assert len({r['run_id'] for r in records}) == 1
+    
+    for duration in range(1, 101):
+        run_log._durations.setdefault('h2h', []).append(float(duration))
+    stats = run_log.summary()['h2h']
+    assert stats['count'] == 100
+    assert stats['p50_ms'] == 50.0
+    assert stats['p95_ms'] == 95.0
+
+
+def test_profiler_splits_wall_cpu_and_memory(tmp_path):
+    """Test profilu etapów: czekanie vs CPU, szczyt pamięci, raport i plik .prof."""
+    profiler = run_profiler
+    run_log = RunLog(path=tmp_path / "run_log.jsonl")
+    
+    profiler.start()
+    with run_log.stage('listing') as listing:
+        time.sleep(0.05)
+        with run_log.stage('parse') as parse:
+            data = [str(i) * 10 for i in range(50000)]
+            sum(len(item) for item in data)
+            del data
+    report_path = profiler.stop(output_dir=tmp_path)
+    run_log.close()
+    
+    assert listing['cpu_ms'] < listing['duration_ms'] - 40  # Sleep to czekanie, nie CPU
+    assert parse['mem_peak_kb'] > 1024
+    assert listing['mem_peak_kb'] >= parse['mem_peak_kb']
+    
+    report = report_path.read_text(encoding='utf-8')
+    assert 'listing' in report and 'parse' in report and 'cProfile' in report
+    assert list(tmp_path.glob('profile_*.prof'))
+
+
+def _worker_parse_hotspot(n):
+    return sum(len(str(i) * 10) for i in range(n))
+
+
+def test_profiler_covers_worker_threads_and_overlapping_stages(tmp_path):
+    """Funkcje z wątków puli w raporcie cProfile; etapy równoległe dostają szczyt procesu, nie własny."""
+    profiler = run_profiler
+    run_log = RunLog(path=tmp_path / "run_log.jsonl")
+    inside = threading.Event()
+    release = threading.Event()
+    
+    def stage_in_thread():
+        with run_log.stage('odds') as record:
+            inside.set()
+            release.wait(5)
+            _worker_parse_hotspot(20000)
+        return record
+    
+    profiler.start()
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(stage_in_thread)
+        inside.wait(5)
+        with run_log.stage('h2h') as h2h:
+            release.set()
+        odds = future.result()
+    with run_log.stage('filter') as alone:
+        pass
+    report_path = profiler.stop(output_dir=tmp_path)
+    run_log.close()
+    
+    assert 'mem_peak_process_kb' in odds and 'mem_peak_kb' not in odds
+    assert 'mem_peak_process_kb' in h2h
+    assert 'mem_peak_kb' in alone
+    assert '_worker_parse_hotspot' in report_path.read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
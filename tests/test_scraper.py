@@ -2,8 +2,23 @@
 Przykładowy test dla forebet_scraper.
 """
 import pytest
+from bs4 import BeautifulSoup
+
 from src.scrapers import ForebtScraper
-from src.config import Sport
+from src.config import Settings, Sport
+from benchmarks import corpus
+
+
+@pytest.fixture
+def scraper():
+    scraper = ForebtScraper(use_selenium=False)
+    yield scraper
+    scraper.close()
+
+
+def _row(html: str):
+    """Pierwszy element wiersza z fragmentu HTML."""
+    return BeautifulSoup(html, 'lxml').body.contents[0]
 
 
 def test_scraper_initialization():
@@ -13,16 +28,58 @@ def test_scraper_initialization():
     scraper.close()
 
 
-def test_extract_teams_logic():
-    """Test logiki ekstraktowania drużyn."""
-    # TODO: Dodać mock HTML i testy parsowania
-    pass
+def test_extract_teams_logic(scraper):
+    """Test logiki ekstraktowania drużyn (linki /team/ i spany homeTeam/awayTeam)."""
+    table_row = _row('<div><a href="/pl/team/arsenal">Arsenal</a> - <a href="/pl/team/chelsea">Chelsea</a></div>')
+    rcnt_row = _row(
+        '<div class="rcnt"><span class="homeTeam"><span>Boston Celtics</span></span>'
+        '<span class="awayTeam"><span>Miami Heat</span></span></div>'
+    )
+    
+    assert scraper._extract_teams(table_row) == {'home': 'Arsenal', 'away': 'Chelsea'}
+    assert scraper._extract_teams(rcnt_row) == {'home': 'Boston Celtics', 'away': 'Miami Heat'}
+    assert scraper._extract_teams(_row('<div><span>brak drużyn</span></div>')) is None
+
+
+def test_extract_probabilities_logic(scraper):
+    """Test logiki ekstraktowania prawdopodobieństw (div.fprc i brak liczb)."""
+    row = _row('<div><div class="fprc"><span class="fpr">22</span><span>26</span><span>52</span></div></div>')
+    postponed = _row('<div><div class="fprc"><span>-</span><span>-</span><span>-</span></div></div>')
+    
+    probabilities = scraper._extract_probabilities(row)
+    
+    assert probabilities == {'home': 22.0, 'draw': 26.0, 'away': 52.0, 'max': 52.0, 'prediction': 'away'}
+    assert scraper._extract_probabilities(postponed) is None
+
+
+@pytest.mark.parametrize("sport", list(Settings.SPORT_URL_PATTERNS), ids=lambda sport: sport.value)
+def test_parse_recorded_listing(scraper, sport):
+    """Każdy zapisany listing daje kompletne zdarzenia; wiersze reklam i przełożone mecze są pomijane."""
+    soup = BeautifulSoup(corpus.listing_html(sport), 'lxml')
+    
+    events = scraper._parse_events(soup, sport)
+    
+    assert events
+    for event in events:
+        assert event['home_team'] and event['away_team']
+        assert event['match_id'] and event['match_url'].startswith("https://www.forebet.com/")
+        assert event['probabilities']['max'] == max(
+            event['probabilities'][key] for key in ('home', 'draw', 'away')
+        )
+        assert event['league'] != "Unknown League"
 
 
-def test_extract_probabilities_logic():
-    """Test logiki ekstraktowania prawdopodobieństw."""
-    # TODO: Dodać mock HTML i testy parsowania
-    pass
+def test_parse_recorded_match_pages(scraper):
+    """Forma z sekcji W/D/L i z tabel wyników (max 6 meczów na drużynę)."""
+    pages = corpus.match_pages()
+    
+    sections = scraper._parse_team_form(BeautifulSoup(pages['arsenal-chelsea'], 'lxml'))
+    tables = scraper._parse_team_form(BeautifulSoup(pages['boston-celtics-miami-heat'], 'lxml'))
+    
+    assert [match['result'] for match in sections['home_form']] == list("WWDWLW")
+    assert [match['result'] for match in sections['away_form']] == list("LDWDLL")
+    assert len(tables['home_form']) == len(tables['away_form']) == 6
+    assert all('score' in match for match in tables['home_form'])
 
 
 if __name__ == "__main__":
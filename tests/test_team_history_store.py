@@ -0,0 +1,44 @@
+"""
+Testy dla magazynu historii drużyn.
+"""
+from datetime import date, timedelta
+
+import pytest
+from src.data_management import TeamHistoryStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    history = TeamHistoryStore(db_path=tmp_path / "history.sqlite3")
+    yield history
+    history.close()
+
+
+def test_unknown_team_needs_refresh(store):
+    """Test odświeżania drużyny bez historii."""
+    assert store.needs_refresh("Legia Warszawa", "football")
+
+
+def test_form_served_from_store(store):
+    """Test zapisu i odczytu formy."""
+    store.record_form("Legia Warszawa", "football", [{'result': 'W'}, {'result': 'D', 'score': '1-1'}])
+    
+    assert not store.needs_refresh("legia  warszawa", "football")
+    assert store.get_form("Legia Warszawa", "football") == [{'result': 'W'}, {'result': 'D', 'score': '1-1'}]
+    assert store.get_form("Legia Warszawa", "basketball") == []
+
+
+def test_played_fixture_triggers_refresh(store):
+    """Test odświeżania po meczu rozegranym od ostatniej aktualizacji."""
+    today = date.today()
+    store.record_form("Lech Poznań", "football", [{'result': 'L'}])
+    store.record_fixture("Lech Poznań", "football", today)
+    
+    # Dzisiejszy mecz jeszcze się nie odbył
+    assert not store.needs_refresh("Lech Poznań", "football", today=today)
+    # Następnego dnia historia jest nieaktualna
+    assert store.needs_refresh("Lech Poznań", "football", today=today + timedelta(days=1))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
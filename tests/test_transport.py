@@ -0,0 +1,63 @@
+"""
+Testy warstwy transportu HTTP (nagrywanie, odtwarzanie, cache) na lokalnym mocku.
+"""
+import pytest
+
+from src.config import Settings
+from src.transport import ResponseStore, ReplayMissError, create_session
+from benchmarks.mock_server import MockServer
+
+
+def _session(tmp_path, mode):
+    return create_session({'X-Fsign': 'test'}, store=ResponseStore(tmp_path / "http"), mode=mode)
+
+
+def test_record_then_replay_without_network(tmp_path):
+    """Odpowiedzi nagrane w trybie record są odtwarzane bez zapytań do serwera."""
+    with MockServer() as server:
+        urls = [f"{server.url}/en/hockey/predictions-today", f"{server.url}/x/feed/df_od_1_KxGt7mYq_1_eu_1"]
+        recorded = [_session(tmp_path, "record").get(url) for url in urls]
+        served = sum(server.stats.values())
+        
+        replayed = [_session(tmp_path, "replay").get(url) for url in urls]
+        
+        assert sum(server.stats.values()) == served
+    
+    assert [r.content for r in replayed] == [r.content for r in recorded]
+    assert [r.status_code for r in replayed] == [200, 200]
+    assert replayed[0].text == recorded[0].text
+    assert ResponseStore(tmp_path / "http").stats()['requests'] == 2
+
+
+def test_replay_miss_is_connection_error(tmp_path):
+    """Brak nagrania w trybie replay to błąd połączenia (obsługiwany jak awaria sieci)."""
+    with pytest.raises(ReplayMissError):
+        _session(tmp_path, "replay").get("http://127.0.0.1:9/brak")
+
+
+def test_identical_bodies_are_stored_once(tmp_path):
+    """Dwa URL-e z tą samą treścią dzielą jeden obiekt w magazynie."""
+    with MockServer() as server:
+        session = _session(tmp_path, "record")
+        session.get(f"{server.url}/wyszukiwanie/?q=")
+        session.get(f"{server.url}/wyszukiwanie/?q=%20")
+    
+    assert ResponseStore(tmp_path / "http").stats() | {'bytes': 0} == {'requests': 2, 'objects': 1, 'bytes': 0}
+
+
+def test_cache_mode_respects_ttl(tmp_path, monkeypatch):
+    """Tryb cache serwuje zapis w TTL, po jego upływie pyta serwer ponownie."""
+    url_path = "/en/basketball/predictions-today"
+    with MockServer() as server:
+        session = _session(tmp_path, "cache")
+        session.get(f"{server.url}{url_path}")
+        session.get(f"{server.url}{url_path}")
+        assert server.stats[('listing', 200)] == 1
+        
+        monkeypatch.setattr(Settings, 'TRANSPORT_CACHE_TTL', -1)
+        session.get(f"{server.url}{url_path}")
+        assert server.stats[('listing', 200)] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
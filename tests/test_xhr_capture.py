@@ -0,0 +1,184 @@
+"""
+Testy listingów z danych XHR (JSON) zamiast DOM: parser, przechwytywanie z logu wydajności, replay endpointów.
+"""
+import json
+from datetime import datetime
+
+import pytest
+import requests
+
+from src.config import Settings, Sport
+from src.data_management import cache_manager
+from src.scrapers import ForebtScraper, forebet_scraper
+from src.scrapers.browser_manager import BrowserManager
+from src.scrapers.xhr_capture import (
+    capture_json_responses, events_from_captured, is_stale, parse_prediction_payload, xhr_endpoints
+)
+from benchmarks.mock_server import MockServer
+from benchmarks.synthetic import XHR_PATH
+
+
+@pytest.fixture
+def isolated_cache(monkeypatch, tmp_path):
+    """Cache (zdarzenia i endpointy XHR) w katalogu tymczasowym."""
+    monkeypatch.setattr(cache_manager, 'cache_dir', tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def synthetic_server(monkeypatch):
+    """Mock z dniem syntetycznym (listing + JSON XHR), Settings skierowane na niego."""
+    for name in ('FOREBET_BASE_URL', 'FLASHSCORE_BASE_URL', 'FLASHSCORE_FEED_URL'):
+        monkeypatch.setattr(Settings, name, getattr(Settings, name))
+    
+    with MockServer(synthetic=12) as server:
+        Settings.override_endpoints(server.url)
+        yield server
+
+
+class PerformanceLogDriver:
+    """WebDriver z logiem wydajności Chrome zawierającym podane odpowiedzi (zapytania dokumentu current_url)."""
+    
+    def __init__(self, responses, current_url="https://x/page"):
+        self.bodies = {}
+        self.log = []
+        self.current_url = current_url
+        self.add(responses, current_url)
+    
+    def add(self, responses, document_url):
+        """Dopisuje do logu zapytania i odpowiedzi wysłane przez dokument `document_url`."""
+        for url, kind, mime, body in responses:
+            request_id = str(len(self.bodies))
+            self.bodies[request_id] = body
+            sent = {'method': 'Network.requestWillBeSent', 'params': {
+                'requestId': request_id, 'documentURL': document_url, 'type': kind, 'request': {'url': url},
+            }}
+            received = {'method': 'Network.responseReceived', 'params': {
+                'requestId': request_id, 'type': kind, 'response': {'url': url, 'mimeType': mime},
+            }}
+            self.log += [{'message': json.dumps({'message': message})} for message in (sent, received)]
+    
+    def get_log(self, kind):
+        assert kind == 'performance'
+        log, self.log = self.log, []
+        return log
+    
+    def execute_cdp_cmd(self, command, params):
+        assert command == 'Network.getResponseBody'
+        return {'body': self.bodies[params['requestId']], 'base64Encoded': False}
+
+
+def _key(event):
+    return event['home_team'], event['away_team'], event['probabilities'], event['match_url']
+
+
+def test_parse_payload_aliases_nesting_and_invalid_rows():
+    """Różne nazwy pól, zagnieżdżone listy, względne URL-e; wiersze bez prognoz pomijane."""
+    payload = {'data': {'today': [
+        {'HOST_NAME': 'Arsenal', 'GUEST_NAME': 'Chelsea', 'Pred_1': '48', 'Pred_X': '27', 'Pred_2': '25',
+         'id': 101, 'url': '/pl/football/matches/arsenal-chelsea-101', 'short_tag': 'ENG1'},
+        {'home': 'Lakers', 'away': 'Celtics', 'prob_1': 41, 'prob_2': 59},
+        {'home': 'Bez', 'away': 'Prognozy'},
+    ]}}
+    events = parse_prediction_payload(payload, Sport.FOOTBALL, "https://www.forebet.com/pl/predictions")
+    
+    assert [(e['home_team'], e['away_team']) for e in events] == [('Arsenal', 'Chelsea'), ('Lakers', 'Celtics')]
+    assert events[0]['probabilities'] == {'home': 48.0, 'draw': 27.0, 'away': 25.0, 'max': 48.0, 'prediction': 'home'}
+    assert events[0]['match_url'] == "https://www.forebet.com/pl/football/matches/arsenal-chelsea-101"
+    assert events[0]['match_id'] == '101' and events[0]['league'] == 'ENG1'
+    assert events[1]['probabilities']['prediction'] == 'away' and events[1]['probabilities']['draw'] == 0.0
+
+
+def test_capture_reads_only_json_xhr_responses():
+    """Z logu wydajności tylko odpowiedzi XHR/Fetch typu JSON (bez dokumentów i skryptów)."""
+    driver = PerformanceLogDriver([
+        ("https://x/page", 'Document', 'text/html', '<html></html>'),
+        ("https://x/app.js", 'Script', 'application/javascript', 'var a;'),
+        ("https://x/data.json", 'XHR', 'application/json', '{"matches": []}'),
+        ("https://x/broken", 'Fetch', 'application/json', '{nie-json'),
+    ])
+    
+    assert capture_json_responses(driver) == [("https://x/data.json", {'matches': []})]
+    assert capture_json_responses(driver) == []
+
+
+def test_capture_keeps_only_requests_of_listing_document():
+    """XHR wysłane przez inne dokumenty (strony meczów) pomijane; adresy porównywane po zakodowaniu."""
+    listing = "https://x/pl/prognozy-piłkarskie-na-dziś"
+    driver = PerformanceLogDriver([("https://x/listing.json", 'XHR', 'application/json', '{"a": 1}')], listing)
+    driver.add([("https://x/match.json", 'XHR', 'application/json', '{"b": 2}')], "https://x/matches/a-b-1")
+    
+    assert capture_json_responses(driver, document_urls=[listing]) == [("https://x/listing.json", {'a': 1})]
+
+
+def test_stale_payloads_rejected():
+    """Prognozy z datami sprzed wczoraj nie są zdarzeniami bieżącego dnia; sama godzina - bieżące."""
+    now = datetime.now()
+    old = {'matches': [{'home': 'A', 'away': 'B', 'prob_1': 70, 'prob_2': 30, 'date': '2020-01-01 20:00:00'}]}
+    today = {'matches': [{'home': 'C', 'away': 'D', 'prob_1': 70, 'prob_2': 30,
+                          'date': now.strftime('%Y-%m-%d 20:00')}]}
+    timed = {'matches': [{'home': 'E', 'away': 'F', 'prob_1': 70, 'prob_2': 30, 'date': '20:00'}]}
+    
+    events, sources = events_from_captured([("https://x/old", old), ("https://x/today", today),
+                                            ("https://x/timed", timed)], Sport.FOOTBALL, "https://x/")
+    assert sources == ["https://x/today", "https://x/timed"]
+    assert is_stale(parse_prediction_payload(old, Sport.FOOTBALL)) and not is_stale([])
+
+
+def test_listing_capture_ignores_entries_from_earlier_pages(monkeypatch, isolated_cache):
+    """Log opróżniany przed listingiem: JSON prognoz innego sportu z wcześniejszych stron nie trafia do zdarzeń."""
+    monkeypatch.setattr(forebet_scraper, 'wait_until_ready', lambda driver, page: None)
+    url = Settings.get_sport_url(Sport.HOCKEY)
+    earlier = '{"rows": [{"home": "Arsenal", "away": "Chelsea", "prob_1": 61, "prob_2": 39}]}'
+    listing = '{"rows": [{"home": "Rangers", "away": "Bruins", "prob_1": 64, "prob_2": 36}]}'
+    # Wpis z poprzedniego sportu zapisany pod tym samym dokumentem - odfiltruje go tylko opróżnienie logu
+    driver = PerformanceLogDriver([("https://x/football.json", 'XHR', 'application/json', earlier)], url)
+    driver.get = lambda page: driver.add([("https://x/hockey.json", 'XHR', 'application/json', listing)], page)
+    
+    with ForebtScraper(use_selenium=True) as scraper:
+        scraper.browser = BrowserManager(lambda: driver, max_pages=0, max_rss_mb=0)
+        events = scraper._fetch_with_selenium(url, Sport.HOCKEY)
+    
+    assert [(e['home_team'], e['away_team']) for e in events] == [('Rangers', 'Bruins')]
+    assert xhr_endpoints.get(Sport.HOCKEY) == ["https://x/hockey.json"]
+
+
+def test_captured_endpoint_replayed_without_listing(synthetic_server, isolated_cache):
+    """Endpoint odkryty w przeglądarce → kolejne pobranie tylko JSON (bez listingu HTML), te same zdarzenia."""
+    sport = Sport.FOOTBALL
+    url = Settings.get_sport_url(sport)
+    endpoint = f"{synthetic_server.url}{XHR_PATH}?sport={sport.value}"
+    body = requests.get(endpoint).text
+    
+    with ForebtScraper(use_selenium=False) as scraper:
+        dom_events = scraper._fetch_with_requests(url, sport)
+        scraper.driver = PerformanceLogDriver([(endpoint, 'XHR', 'application/json', body)], url)
+        captured = scraper._events_from_xhr_capture(url, sport)
+        scraper.driver = None
+    
+    assert xhr_endpoints.get(sport) == [endpoint]
+    assert [_key(e) for e in captured] == [_key(e) for e in dom_events]
+    
+    synthetic_server.stats.clear()
+    with ForebtScraper(use_selenium=False) as scraper:
+        events = scraper.fetch_events_by_sport(sport)
+    
+    assert [_key(e) for e in events] == [_key(e) for e in dom_events]
+    assert synthetic_server.stats[('xhr', 200)] == 1
+    assert synthetic_server.stats[('listing', 200)] == 0
+
+
+def test_dead_endpoint_forgotten_and_dom_fallback(synthetic_server, isolated_cache):
+    """Endpoint bez danych (404) → zapomniany, zdarzenia z DOM listingu."""
+    xhr_endpoints.remember(Sport.HOCKEY, [f"{synthetic_server.url}{XHR_PATH}?sport=unknown"])
+    
+    with ForebtScraper(use_selenium=False) as scraper:
+        events = scraper.fetch_events_by_sport(Sport.HOCKEY)
+    
+    assert len(events) == 12
+    assert xhr_endpoints.get(Sport.HOCKEY) == []
+    assert synthetic_server.stats[('listing', 200)] == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])